@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+"""
+Benchmark the rate at which scanned files are added to a Seqparse instance.
+
+Compares adding each (in-memory) directory entry via `Seqparse.add_file` with
+the scanner's ingest path, `Seqparse._add_from_scan`, which parses each file
+name once and inserts integer frames straight into their sequences. No disk
+access is involved; the entries mimic those returned by `os.scandir`.
+
+Usage:
+    python benchmarks/bench_add_file.py [NUM_FILES]
+"""
+
+import os
+import sys
+import timeit
+
+from seqparse.seqparse import Seqparse
+
+
+class DirEntry:
+    """Minimal stand-in for os.DirEntry."""
+
+    def __init__(self, path):
+        """Initialise the instance."""
+        self.name = os.path.basename(path)
+        self.path = path
+
+
+def generate_entries(num_files):
+    """Generate a directory's worth of sequence and singleton entries."""
+    root = os.path.join("prod", "show", "seq01", "render")
+    entries = []
+    for idx in range(num_files):
+        if idx % 50 == 0:
+            file_name = f"notes_{idx:d}.txt"
+        else:
+            file_name = f"shot{idx % 7}_beauty.{idx // 7:04d}.exr"
+        entries.append(DirEntry(os.path.join(root, file_name)))
+    return entries
+
+
+def time_ingest(ingest, entries, repeat=5):
+    """Best-of-repeat time (in seconds) to ingest every entry once."""
+
+    def run():
+        parser = Seqparse()
+        ingest(parser, entries)
+        return parser
+
+    timer = timeit.Timer(run)
+    return min(timer.repeat(repeat=repeat, number=1))
+
+
+def add_files(parser, entries):
+    """Add every entry via the public add_file method."""
+    for entry in entries:
+        parser.add_file(entry)
+
+
+def add_from_scan(parser, entries):
+    """Add every entry via the scanner's ingest path."""
+    parser._add_from_scan(entries)  # pylint: disable=W0212
+
+
+def main(num_files=100000):
+    """Run the benchmark, print files per second."""
+    entries = generate_entries(num_files)
+
+    # Both ingest paths must produce identical results.
+    outputs = []
+    for ingest in (add_files, add_from_scan):
+        parser = Seqparse()
+        ingest(parser, entries)
+        outputs.append([str(x) for x in parser.output()])
+    assert outputs[0] == outputs[1]
+
+    print(f"{num_files:d} files\n")
+    baseline = None
+    for label, ingest in (("add_file", add_files),
+                          ("_add_from_scan", add_from_scan)):
+        elapsed = time_ingest(ingest, entries)
+        rate = num_files / elapsed
+        baseline = baseline or rate
+        print(f"{label:>15}: {rate:>12,.0f} files/s  ({rate / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*[int(x) for x in sys.argv[1:2]])
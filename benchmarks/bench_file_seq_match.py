@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Fuzz and benchmark `split_file_name` against FILE_SEQ_EXPR.
+
+The fuzz stage checks that both produce identical (name, frames, ext) splits
+for random names built from the characters that matter to the grammar. The
+benchmark stage reports the worst-case time per name for several families of
+machine-generated names (many dots, long digit/comma runs) across name
+lengths.
+
+Usage:
+    python benchmarks/bench_file_seq_match.py [NUM_FUZZ_NAMES]
+"""
+
+import random
+import re
+import sys
+import timeit
+
+from seqparse.regex import FILE_SEQ_EXPR, FRAME_EXPR, split_file_name
+
+FSEQ_EXPR = re.compile(FILE_SEQ_EXPR)
+FRAMES_EXPR = re.compile(FRAME_EXPR)
+
+LENGTHS = (256, 1024, 4096, 16384, 65536)
+
+
+def regex_split(val):
+    """Split a file sequence with the original regular expression."""
+    fmatch = FSEQ_EXPR.match(val)
+    return fmatch.groups() if fmatch else None
+
+
+def linear_split(val):
+    """Split a file sequence with split_file_name."""
+    return split_file_name(val, FRAMES_EXPR)
+
+
+def pathological_names(length):
+    """Generate names of (roughly) the given length that stress the regex."""
+    reps = max(1, length // 4)
+    return {
+        "dots": "1." * (length // 2) + "exr.",
+        "comma runs": ("1," * 32 + "1.") * (length // 66) + "e.",
+        "digit runs": ("1" * 63 + ".") * (length // 64) + "e.",
+        "dot digits": "a" + ".1" * reps + ".e.",
+        "valid": "a." * reps + "0001-0100x2,0200.exr",
+    }
+
+
+def fuzz(num_names, seed=0):
+    """Check split_file_name against FILE_SEQ_EXPR on random input."""
+    rng = random.Random(seed)
+    alphabet = "0123456789..,,--xxab/_\n"
+    for _ in range(num_names):
+        val = "".join(
+            rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+        if linear_split(val) != regex_split(val):
+            raise AssertionError(f"Mismatch for {val!r}")
+    print(f"fuzz: {num_names:d} names, no mismatches\n")
+
+
+def main(num_fuzz=100000):
+    """Run the fuzzer and benchmark, print timings."""
+    fuzz(num_fuzz)
+
+    print("worst-case time per name in microseconds\n")
+    print(f"{'length':>8}  {'family':<12}  {'regex':>10}  {'linear':>10}")
+
+    for length in LENGTHS:
+        worst = dict(regex=(0, ""), linear=(0, ""))
+        for family, val in pathological_names(length).items():
+            if linear_split(val) != regex_split(val):
+                raise AssertionError(f"Mismatch for {family} ({length:d})")
+            for label, func in (("regex", regex_split),
+                                ("linear", linear_split)):
+                timer = timeit.Timer(lambda func=func, val=val: func(val))
+                elapsed = min(timer.repeat(repeat=3, number=5)) / 5
+                worst[label] = max(worst[label], (elapsed, family))
+
+        regex_time, family = worst["regex"]
+        print(f"{length:>8d}  {family:<12}  {regex_time * 1e6:>10.1f}  "
+              f"{worst['linear'][0] * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main(*[int(x) for x in sys.argv[1:2]])
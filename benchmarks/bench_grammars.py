@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+Benchmark file name matching cost against the number of naming grammars.
+
+Compares the combined splitter built by `seqparse.regex.compile_grammars`
+with the naive approach of trying one splitter per grammar in turn. The
+default grammar on its own uses the dedicated `split_file_name`; from two
+grammars onwards, the combined splitter's per-name cost has to stay flat as
+grammars are added (the benchmark fails otherwise), while the naive approach
+grows with every grammar.
+
+Usage:
+    python benchmarks/bench_grammars.py [NUM_NAMES]
+"""
+
+import os
+import random
+import sys
+import timeit
+
+from seqparse.regex import compile_grammars, DEFAULT_GRAMMAR, NamingGrammar
+
+GRAMMARS = [
+    DEFAULT_GRAMMAR,
+    NamingGrammar("_", r"[^\.]+"),
+    NamingGrammar("", r"[^\.]+"),
+    NamingGrammar(".", r"[^\.]+\.gz"),
+    NamingGrammar("-", r"[^\.]+"),
+    NamingGrammar(".", r"[^\.]+\.bz2"),
+    NamingGrammar("_", r"[^\.]+\.gz"),
+    NamingGrammar("#", r"[^\.]+"),
+]
+
+
+def generate_names(num_names, seed=0):
+    """Generate a reproducible list of file names in mixed conventions."""
+    rng = random.Random(seed)
+    patterns = [
+        "{root}/{name}.{frame:04d}.exr", "{root}/{name}_{frame:04d}.exr",
+        "{root}/{name}{frame:04d}.tif", "{root}/{name}.{frame:04d}.exr.gz",
+        "{root}/{name}.jpg"
+    ]
+
+    names = []
+    for idx in range(num_names):
+        root = os.path.join("prod", "show", f"seq{idx % 7:02d}", "render")
+        names.append(
+            rng.choice(patterns).format(root=root,
+                                        name=f"shot{idx % 13}_beauty",
+                                        frame=idx % 1000))
+    return names
+
+
+def time_matchers(matchers, names, repeat=15):
+    """
+    Best-of-repeat time (in seconds) for each matcher to match every name.
+
+    Matchers are timed in turn within each round, so that any slowdown of
+    the machine affects all of them alike.
+    """
+    timers = [
+        timeit.Timer(lambda x=x: [x(y) for y in names]) for x in matchers
+    ]
+    times = [float("inf")] * len(timers)
+    for _ in range(repeat):
+        for idx, timer in enumerate(timers):
+            times[idx] = min(times[idx], timer.timeit(number=1))
+    return times
+
+
+def get_sequential(grammars):
+    """Naive matcher, trying one splitter per grammar in turn."""
+    singles = [compile_grammars([x])[0] for x in grammars]
+
+    def sequential(val):
+        for split in singles:
+            bits = split(val)
+            if bits:
+                return bits
+        return None
+
+    return sequential
+
+
+def main(num_names=20000, max_growth=1.5):
+    """Run the benchmark, print per-name timings, check they stay flat."""
+    names = generate_names(num_names)
+    counts = range(1, len(GRAMMARS) + 1)
+
+    matchers = [compile_grammars(GRAMMARS[:x])[0] for x in counts]
+    matchers.extend(get_sequential(GRAMMARS[:x]) for x in counts)
+    times = [x / num_names for x in time_matchers(matchers, names)]
+    combined_times = times[:len(counts)]
+
+    print(f"{num_names:d} names, time per name in microseconds\n")
+    print(f"{'grammars':>8}  {'combined':>10}  {'sequential':>10}")
+    for idx, num_grammars in enumerate(counts):
+        print(f"{num_grammars:>8d}  {times[idx] * 1e6:>10.3f}  "
+              f"{times[idx + len(counts)] * 1e6:>10.3f}")
+
+    growth = max(combined_times[1:]) / min(combined_times[1:])
+    print(f"\ncombined cost growth (2-{len(GRAMMARS)} grammars): "
+          f"{growth:.2f}x")
+    assert growth < max_growth, (
+        f"Combined cost grew {growth:.2f}x with the number of grammars")
+
+
+if __name__ == "__main__":
+    main(*[int(x) for x in sys.argv[1:2]])
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+Count the system calls made while scanning a directory with disk stats.
+
+Directory listings are served from memory by a mocked `os.scandir`, whose
+entries mirror the caching behaviour of `os.DirEntry` and count the
+stat/lstat calls that they would make -- no strace required. Each stat policy
+(the "stat" and "follow_symlinks" scan options) is compared, with and without
+file types (d_type) reported by the directory listing.
+
+Usage:
+    python benchmarks/bench_stat_syscalls.py [NUM_FILES]
+"""
+
+import os
+import sys
+from unittest import mock
+
+from seqparse.seqparse import Seqparse
+
+POLICIES = (
+    ("stat=True", dict(stat=True)),
+    ("stat='sequences'", dict(stat="sequences")),
+    ("stat=True, follow_symlinks=False", dict(stat=True,
+                                              follow_symlinks=False)),
+    ("stat='sequences', follow_symlinks=False",
+     dict(stat="sequences", follow_symlinks=False)),
+)
+
+
+class DirEntry:
+    """Stand-in for os.DirEntry that counts its (cached) system calls."""
+
+    def __init__(self, path, is_link=False, d_type=True, counts=None):
+        """Initialise the instance."""
+        self.name = os.path.basename(path)
+        self.path = path
+        self._counts = counts
+        self._d_type = d_type
+        self._is_link = is_link
+        self._lstat = self._stat = None
+
+    def is_dir(self, follow_symlinks=True):
+        """Whether the entry is a directory (never, here)."""
+        self.is_file(follow_symlinks)
+        return False
+
+    def is_file(self, follow_symlinks=True):
+        """Whether the entry is a file (always, unless an unfollowed link)."""
+        if self._is_link and follow_symlinks:
+            self.stat()
+            return True
+        if not self._d_type:
+            self.stat(follow_symlinks=False)
+        return not self._is_link
+
+    def is_symlink(self):
+        """Whether the entry is a symlink."""
+        if not self._d_type:
+            self.stat(follow_symlinks=False)
+        return self._is_link
+
+    def stat(self, follow_symlinks=True):
+        """Return a (fake) stat result, counting the first call."""
+        if follow_symlinks and self.is_symlink():
+            if self._stat is None:
+                self._counts["stat"] += 1
+                self._stat = os.stat_result((0, ) * 6 + (1024, 0, 0, 0))
+            return self._stat
+
+        if self._lstat is None:
+            self._counts["lstat"] += 1
+            self._lstat = os.stat_result((0, ) * 6 + (16, 0, 0, 0))
+        return self._lstat
+
+
+def generate_entries(num_files, d_type, counts):
+    """Generate a directory of sequences, singletons and symlinked frames."""
+    root = os.path.join("prod", "show", "seq01", "render")
+    entries = []
+    for idx in range(num_files):
+        is_link = False
+        if idx % 10 == 0:
+            file_name = f"notes_{idx:d}.txt"
+        else:
+            file_name = f"shot{idx % 7}_beauty.{idx // 7:04d}.exr"
+            is_link = idx % 4 == 0
+        entries.append(
+            DirEntry(os.path.join(root, file_name), is_link, d_type, counts))
+    return root, entries
+
+
+def count_syscalls(num_files, d_type, options):
+    """Scan a mocked directory, return the number of (l)stat calls."""
+    counts = dict(lstat=0, stat=0)
+    root, entries = generate_entries(num_files, d_type, counts)
+
+    parser = Seqparse()
+    parser.scan_options.update(options)
+    with mock.patch("seqparse.seqparse.os.scandir", return_value=entries):
+        parser.scan_path(root)
+
+    return counts
+
+
+def main(num_files=10000):
+    """Run the benchmark, print system calls per policy."""
+    print(f"{num_files:d} files (10% singletons, 20% symlinks)\n")
+    for d_type in (True, False):
+        print(f"d_type {'available' if d_type else 'unavailable'}:")
+        baseline = None
+        for label, options in POLICIES:
+            counts = count_syscalls(num_files, d_type, options)
+            total = counts["lstat"] + counts["stat"]
+            baseline = baseline or total
+            print(f"  {label:>40}: {total:>7,d} syscalls "
+                  f"({counts['lstat']:,d} lstat, {counts['stat']:,d} stat; "
+                  f"{total / baseline:.2f}x)")
+        print("")
+
+
+if __name__ == "__main__":
+    main(*[int(x) for x in sys.argv[1:2]])
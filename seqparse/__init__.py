@@ -32,8 +32,8 @@ Examples of proper frame sequences:
 
 import os
 
-__all__ = ("get_parser", "get_sequence", "get_version", "invert",
-           "validate_frame_sequence")
+__all__ = ("frame_cache_info", "get_parser", "get_sequence", "get_version",
+           "invert", "set_frame_cache_size", "validate_frame_sequence")
 
 __version__ = "1.0.1"
 
@@ -42,20 +42,44 @@ __version__ = "1.0.1"
 # EXPORTED METHODS
 
 
-def get_parser():
+def frame_cache_info():
+    """
+    Report usage statistics for the shared frame sequence cache.
+
+    Returns:
+        CacheInfo named tuple (hits, misses, maxsize, currsize).
+    """
+    from . import sequences  # pylint: disable=C0415
+    return sequences.frame_cache_info()
+
+
+def get_parser(columnar=False, grammars=None):
     """
     Create a new Seqparse instance.
 
+    Args:
+        columnar (bool, optional): Whether to buffer discovered file sequence
+            frames in flat columns (see seqparse.columnar.ColumnarSeqparse),
+            which saves memory while scanning trees with many small file
+            sequences. Defaults to False.
+        grammars (iterable of NamingGrammar, optional): File naming
+            conventions recognised by the instance. Defaults to the
+            "name.####.ext" convention.
+
     Returns:
         Valid Seqparse instance.
 
     Examples:
         >>> from seqparse import get_parser
         >>> get_parser()
-        Seqparse(sequences=0, singletons=0)
+        Seqparse(locations=0, sequences=0, singletons=0, frames=0)
     """
+    if columnar:
+        from .columnar import ColumnarSeqparse  # pylint: disable=C0415
+        return ColumnarSeqparse(grammars=grammars)
+
     from .seqparse import Seqparse  # pylint: disable=C0415
-    return Seqparse()
+    return Seqparse(grammars=grammars)
 
 
 def get_sequence(frames, pad=1):
@@ -149,6 +173,25 @@ def invert(iterable):
     return iterable.invert()
 
 
+def set_frame_cache_size(maxsize=4096):
+    """
+    Resize (and clear) the shared frame sequence cache.
+
+    Parsed string frame sequences are shared between FrameSequence,
+    FileSequence and validate_frame_sequence via a bounded LRU cache.
+
+    Args:
+        maxsize (int, optional): Maximum number of cached frame sequences. Use
+            0 to disable caching, None for an unbounded cache. Defaults to
+            4096.
+
+    Returns:
+        None
+    """
+    from . import sequences  # pylint: disable=C0415
+    sequences.set_frame_cache_size(maxsize)
+
+
 def validate_frame_sequence(frame_seq):
     """
     Whether the supplied string frame (not file) sequence is valid.
@@ -168,4 +211,4 @@ def validate_frame_sequence(frame_seq):
         None
     """
     from .seqparse import Seqparse  # pylint: disable=C0415
-    return Seqparse().validate_frame_sequence(frame_seq)
+    return Seqparse.validate_frame_sequence(frame_seq)
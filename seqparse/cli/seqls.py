@@ -6,14 +6,20 @@ Upon installation of the package this script will be accessable via `seqls`
 command on the command line of your choice.
 """
 
-from argparse import ArgumentParser
+from argparse import ArgumentParser, ArgumentTypeError
+from itertools import groupby
 import os
+import re
+import sqlite3
 import sys
 import time
 
 import humanize
 
 from .. import get_parser, get_version
+from ..manifest import FIND_COLUMNS, MANIFEST_COLUMNS, validate_columns
+from ..regex import compile_name_patterns
+from ..watch import get_watcher
 
 
 def run_main():  # pragma: no cover
@@ -38,31 +44,221 @@ def main(args, _debug=False):
     scan_opts = dict(max_levels=args.max_levels[0],
                      min_levels=args.min_levels[0])
 
-    parser = get_parser()
-    parser.scan_options.update(all=args.all, stat=args.long_format)
-
-    for search_path in sorted(args.search_path):
-        search_path = os.path.abspath(search_path)
-        parser.scan_path(search_path, **scan_opts)
-
-    output = []
+    include = list(args.include or [])
+    include.extend(f"*.{x}" for x in args.ext or [])
 
-    items = parser.output(missing=args.missing, seqs_only=args.seqs_only)
-    if args.long_format:
-        output.extend(long_format_output(items, args.human_readable))
+    parser = get_parser()
+    parser.scan_options.update(all=args.all,
+                               exclude=tuple(args.exclude or []),
+                               include=tuple(include),
+                               include_dirs=tuple(args.include_dirs or []),
+                               incremental=args.watch,
+                               stat=args.long_format)
+
+    search_paths = [os.path.abspath(x) for x in sorted(args.search_path)]
+    if args.stream:
+        output = stream_output(parser, search_paths, scan_opts, args)
     else:
-        output.extend(str(x) for x in items)
+        parser = read_input(parser, search_paths, scan_opts, args)
+        items = parser.output(missing=args.missing, seqs_only=args.seqs_only)
+        output = format_output(items, args)
 
     if _debug:
-        return output
+        return list(output)
 
     print("")
     for line in output:
         print(line)
 
+    if args.watch:
+        print_changes(parser, args)
+
     return None
 
 
+def read_input(parser, search_paths, scan_opts, args):
+    """
+    Populate the parser from the input requested on the command line.
+
+    Input is read from a manifest, a list of files (or stdin) or an index;
+    otherwise the search paths are simply scanned.
+
+    Returns:
+        Seqparse instance holding the input.
+    """
+    file_list = args.from_file or args.from_stdin
+    if args.manifest:
+        parser.load_manifest(args.manifest,
+                             columns=args.manifest_columns,
+                             sep=args.manifest_sep)
+    elif file_list:
+        parser.add_files(
+            os.path.abspath(x) for x in read_file_list(file_list, args.null))
+    elif args.index:
+        parser = scan_with_index(parser, search_paths, scan_opts, args.index)
+    else:
+        for search_path in search_paths:
+            parser.scan_path(search_path, **scan_opts)
+
+    return parser
+
+
+def format_output(items, args):
+    """Generate the (long format, if requested) output for the items."""
+    if args.long_format:
+        return long_format_output(items, args.human_readable)
+    return [str(x) for x in items]
+
+
+def print_changes(parser, args):
+    """Print the changes made on disk to the parser's contents until ^C."""
+    with get_watcher(parser, polling=args.poll) as watcher:
+        try:
+            for lines in watch_output(parser, args, watcher):
+                for line in lines:
+                    print(line)
+        except KeyboardInterrupt:
+            pass
+
+
+def stream_output(parser, search_paths, scan_opts, args):
+    """
+    Yield output lines as each directory of the search paths is scanned.
+
+    Long format output is aligned per directory.
+    """
+    opts = dict(missing=args.missing, seqs_only=args.seqs_only)
+    for search_path in search_paths:
+        items = parser.iter_scan(search_path, **scan_opts, **opts)
+        for _, dir_items in groupby(items, key=lambda x: x.path):
+            if args.long_format:
+                for line in long_format_output(dir_items,
+                                               args.human_readable):
+                    yield line
+            else:
+                for item in dir_items:
+                    yield str(item)
+
+
+def read_file_list(file_list, null_separated=False, chunk_size=1 << 20):
+    """
+    Yield the file paths listed in a file (or on stdin).
+
+    Args:
+        file_list (str): Path to the list of files, or "-" for stdin.
+        null_separated (bool, optional): Whether paths are separated by NUL
+            characters (eg, "find -print0") rather than newlines. Defaults to
+            False.
+        chunk_size (int, optional): Number of bytes read at a time.
+
+    Yields:
+        str file paths.
+    """
+    sep = b"\0" if null_separated else b"\n"
+
+    if file_list == "-":
+        stream = sys.stdin.buffer
+    else:
+        stream = open(file_list, "rb")  # pylint: disable=R1732
+
+    try:
+        remainder = b""
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+
+            paths = (remainder + chunk).split(sep)
+            remainder = paths.pop()
+            for path in paths:
+                if not null_separated:
+                    path = path.rstrip(b"\r")
+                if path:
+                    yield os.fsdecode(path)
+
+        if not null_separated:
+            remainder = remainder.rstrip(b"\r")
+        if remainder:
+            yield os.fsdecode(remainder)
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+
+
+def scan_with_index(parser, search_paths, scan_opts, index_path):
+    """
+    Scan the search paths, using (and updating) an index file where possible.
+
+    The index is only used if it was written for the same search paths, naming
+    grammars and scan options; otherwise the search paths are scanned from
+    scratch and the index is replaced.
+
+    Returns:
+        Seqparse instance holding the contents of the search paths.
+    """
+    parser.scan_options.update(incremental=True)
+    levels = (scan_opts["max_levels"], scan_opts["min_levels"])
+    roots = {x.rstrip(os.path.sep): levels for x in search_paths}
+
+    # Indexes written with other naming grammars fail to load.
+    indexed = get_parser(grammars=parser.grammars)
+    try:
+        indexed.load_index(index_path, validate=False)
+    except (ValueError, sqlite3.Error):
+        indexed = None
+
+    if (indexed and indexed.scan_roots == roots
+            and indexed.scan_options == parser.scan_options):
+        if not indexed.rescan():
+            return indexed
+        parser = indexed
+    else:
+        for search_path in search_paths:
+            parser.scan_path(search_path, **scan_opts)
+
+    parser.save_index(index_path)
+    return parser
+
+
+def watch_output(parser, args, watcher):
+    """
+    Yield the output lines for each batch of changes made on disk.
+
+    Items are compared per changed directory: new or updated items are
+    prefixed by "+", and items that no longer exist by "-".
+    """
+    def get_items(root_dir):
+        """Fetch the current output items, indexed by comparison key."""
+        items = {}
+        opts = dict(missing=args.missing, seqs_only=args.seqs_only)
+        for item in parser.output(root_dirs=[root_dir], **opts):
+            key = str(item)
+            if args.long_format:
+                key = (key, item.size, item.mtime)
+            items[key] = item
+        return items
+
+    current = {x: get_items(x) for x in parser.locations}
+    for changed in watcher:
+        lines = []
+        for root_dir in sorted(changed):
+            previous = current.pop(root_dir, {})
+            updated = get_items(root_dir)
+            if updated:
+                current[root_dir] = updated
+
+            added = [updated[x] for x in updated if x not in previous]
+            if args.long_format:
+                added = long_format_output(added, args.human_readable)
+
+            lines.extend("- " + str(previous[x]) for x in previous
+                         if x not in updated)
+            lines.extend("+ " + str(x) for x in added)
+
+        if lines:
+            yield lines
+
+
 def long_format_output(items, human_readable=False):
     """Generate long format output for the provided items."""
     bits = []
@@ -96,7 +292,7 @@ def parse_args(args):
 
     parser.add_argument(
         "search_path",
-        default=["."],
+        default=[],
         help=("Paths that you'd like to search for file sequences."),
         nargs="*")
     parser.add_argument("-a",
@@ -104,6 +300,41 @@ def parse_args(args):
                         action="store_true",
                         help="Do not ignore entries starting with '.'.")
 
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=None,
+        help=("Skip files and directories whose names match PATTERN (a "
+              "shell-style wildcard, or a regular expression prefixed by "
+              "'re:'); excluded directories are never descended into. May be "
+              "specified multiple times."),
+        metavar="PATTERN",
+        type=_get_name_pattern)
+
+    parser.add_argument(
+        "--ext",
+        action="append",
+        default=None,
+        help=("Only list files with the extension EXT (shorthand for "
+              "--include '*.EXT'). May be specified multiple times."))
+
+    parser.add_argument(
+        "--from-file",
+        default=None,
+        dest="from_file",
+        help=("Read the paths of files to list from FILE (one per line) "
+              "rather than scanning the search paths. The disk is only "
+              "accessed with -l/--long."),
+        metavar="FILE")
+
+    parser.add_argument(
+        "--from-stdin",
+        action="store_const",
+        const="-",
+        default=None,
+        dest="from_stdin",
+        help="As --from-file, reading the paths from stdin.")
+
     parser.add_argument(
         "-H",
         "--human-readable",
@@ -112,12 +343,69 @@ def parse_args(args):
         help=("with -l/--long, print sizes in human readable format (e.g., 1K "
               "234M 2G)."))
 
+    parser.add_argument(
+        "--include",
+        action="append",
+        default=None,
+        help=("Only list files whose names match PATTERN (as per --exclude). "
+              "May be specified multiple times."),
+        metavar="PATTERN",
+        type=_get_name_pattern)
+
+    parser.add_argument(
+        "--include-dir",
+        action="append",
+        default=None,
+        dest="include_dirs",
+        help=("Only list files in (or anywhere below) directories whose names "
+              "match PATTERN (as per --exclude). All directories are still "
+              "searched. May be specified multiple times."),
+        metavar="PATTERN",
+        type=_get_name_pattern)
+
     parser.add_argument("-l",
                         "--long",
                         action="store_true",
                         dest="long_format",
                         help="Use a long listing format.")
 
+    parser.add_argument(
+        "--index",
+        default=None,
+        help=("Path to an index file, used to speed up repeated listings of "
+              "the same search paths. Only directories that have changed "
+              "since the index was written are scanned again."),
+        metavar="PATH")
+
+    parser.add_argument(
+        "--manifest",
+        default=None,
+        help=("Read the paths and disk stats of files to list from a "
+              "manifest FILE ('-' for stdin) rather than scanning the search "
+              "paths; by default, lines are expected to be formatted as per "
+              "\"find -printf '%%s %%T@ %%C@ %%p\\n'\". The disk is never "
+              "accessed."),
+        metavar="FILE")
+
+    parser.add_argument(
+        "--manifest-columns",
+        default=None,
+        dest="manifest_columns",
+        help=("Comma-separated names of the columns of each manifest line: "
+              "any of {}, with the path last. Leave a name empty to skip a "
+              "column. Defaults to '{}'.".format(
+                  ", ".join(MANIFEST_COLUMNS), ",".join(FIND_COLUMNS))),
+        metavar="COLUMNS",
+        type=_get_manifest_columns)
+
+    parser.add_argument(
+        "--manifest-sep",
+        default=None,
+        dest="manifest_sep",
+        help=("The manifest column separator. Defaults to runs of "
+              "whitespace."),
+        metavar="SEP")
+
     parser.add_argument(
         "--maxdepth",
         default=[-1],
@@ -153,14 +441,64 @@ def parse_args(args):
                         dest="seqs_only",
                         help="Whether to filter out all non-sequence files.")
 
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help=("With --watch, poll for changes rather than relying upon "
+              "inotify (eg, for network file systems)."))
+
+    parser.add_argument(
+        "-z",
+        "--null",
+        action="store_true",
+        help=("With --from-file/--from-stdin, paths are separated by NUL "
+              "characters (eg, the output of 'find -print0')."))
+
     parser.add_argument("-v",
                         "--version",
                         action="store_true",
                         help="Print the version and exit.")
 
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=("Print the contents of each directory as soon as it has been "
+              "scanned (in alphabetical, depth-first order), keeping only one "
+              "directory's worth of files in memory."))
+
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help=("Keep watching the search paths, printing file sequences and "
+              "singletons as they change."))
+
     # Parse the arguments.
     parsed_args = parser.parse_args(args)
 
+    if parsed_args.stream and (parsed_args.index or parsed_args.watch):
+        parser.error("--stream cannot be combined with --index or --watch")
+
+    file_lists = [
+        x for x in (parsed_args.from_file, parsed_args.from_stdin,
+                    parsed_args.manifest) if x
+    ]
+    if file_lists:
+        if parsed_args.search_path:
+            parser.error("search paths cannot be combined with --from-file, "
+                         "--from-stdin or --manifest")
+        if (len(file_lists) > 1 or parsed_args.index or parsed_args.stream
+                or parsed_args.watch):
+            parser.error("--from-file, --from-stdin and --manifest cannot be "
+                         "combined with each other, --index, --stream or "
+                         "--watch")
+        if (parsed_args.exclude or parsed_args.ext or parsed_args.include
+                or parsed_args.include_dirs):
+            parser.error("--exclude, --ext, --include and --include-dir only "
+                         "apply to scanned search paths")
+    elif not parsed_args.search_path:
+        parsed_args.search_path = ["."]
+
     # We'll assume that if the user is requesting missing sequence files that
     # he/she doesn't want to see any singletons.
     if parsed_args.missing:
@@ -169,6 +507,24 @@ def parse_args(args):
     return parsed_args
 
 
+def _get_manifest_columns(value):
+    """Convert a comma-separated list of manifest column names."""
+    try:
+        return validate_columns(x.strip() or None for x in value.split(","))
+    except ValueError as error:
+        raise ArgumentTypeError(str(error)) from error
+
+
+def _get_name_pattern(value):
+    """Validate a file (or directory) name pattern."""
+    try:
+        compile_name_patterns([value])
+    except re.error as error:
+        blurb = f"invalid pattern {value!r}: {error}"
+        raise ArgumentTypeError(blurb) from error
+    return value
+
+
 if __name__ == "__main__":
     run_main()
     sys.exit(0)
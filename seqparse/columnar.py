@@ -0,0 +1,231 @@
+"""Flat, columnar storage for the file sequences found by Seqparse."""
+
+from array import array
+import os
+
+import six
+
+from .seqparse import Seqparse
+
+__all__ = ("ColumnarSeqparse",)
+
+# Column names and array type codes: location, name and extension ids (which
+# index the instance's lookup tables), zero-padding and frame.
+_COLUMNS = (("loc", "l"), ("name", "l"), ("ext", "l"), ("pad", "B"),
+            ("frame", "q"))
+
+# Frames (or pads) that don't fit the arrays are stored in the containers.
+_MAX_FRAME = 2**63 - 1
+_MAX_PAD = 255
+
+###############################################################################
+# Class: ColumnarSeqparse
+
+
+class ColumnarSeqparse(Seqparse):
+    """
+    Seqparse variant that buffers file sequence frames in flat columns.
+
+    Each frame discovered by a scan (or added via add_files) is appended to a
+    set of arrays as a (location id, name id, extension id, pad, frame)
+    record, with directories, base names and extensions interned in lookup
+    tables. Records are only grouped into FileSequenceContainer and
+    FileSequence instances when the container hierarchy is first required
+    (ie, by the locations property or the output method), so trees with
+    millions of small file sequences avoid the per-sequence object overhead
+    until then.
+
+    Singletons, frames with disk stats, and files added via add_file are
+    stored in the container hierarchy straight away. Fetching the stats
+    property groups any buffered records, too.
+    """
+
+    def __init__(self, grammars=None):
+        """Initialise the instance."""
+        super().__init__(grammars=grammars)
+
+        self._columns = {}
+        self._ids = {}
+        self._clear_records()
+
+    @property
+    def locations(self):
+        """PathTrie: Singletons and file sequences, indexed by directory."""
+        self._flush_records()
+        return self._locs
+
+    @property
+    def num_records(self):
+        """int: Number of frames buffered in the columns."""
+        return len(self._columns["frame"])
+
+    @property
+    def stats(self):
+        """
+        ScanStats: Counts of the contents of the instance, as per Seqparse.
+
+        Buffered records are grouped into the container hierarchy first.
+        """
+        self._flush_records()
+        return super().stats
+
+    def _add_to_directory(self, dir_name, files):
+        """
+        Add files from a single directory to the instance.
+
+        Frames without disk stats are appended to the columns; everything
+        else is added to the container hierarchy, as per Seqparse.
+
+        Args:
+            dir_name (str): The directory containing the files.
+            files (iterable): (base name, file, stat) tuples, as per
+                Seqparse._add_to_directory.
+
+        Returns:
+            None
+        """
+        if self.scan_options["stat"]:
+            # Disk stats are cached by the file sequences themselves.
+            super()._add_to_directory(dir_name, files)
+            return
+
+        columns = self._columns
+        add_name, add_ext = columns["name"].append, columns["ext"].append
+        add_pad, add_frame = columns["pad"].append, columns["frame"].append
+        name_ids, ext_ids = self._ids["name"], self._ids["ext"]
+        is_default_grammar = self._is_default_grammar
+
+        loc_ids = self._ids["loc"]
+        dir_node = self._locs.get_node(dir_name)
+        loc_id = loc_ids.setdefault(dir_node, len(loc_ids))
+
+        others = []
+        num_records = len(columns["frame"])
+        for base_name, file_entry, stat in files:
+            file_name = os.sep + base_name
+            bits = self._match_file_seq(file_name)
+
+            if stat is not None or bits is None:
+                others.append((base_name, file_entry, stat))
+                continue
+
+            name, frames, ext = bits
+            frame = int(frames) if frames.isdigit() else None
+            if frame is None or frame > _MAX_FRAME or len(frames) > _MAX_PAD:
+                others.append((base_name, file_entry, stat))
+                continue
+
+            sep = "."
+            if not is_default_grammar:
+                sep = self.frame_sep(file_name, bits)
+
+            name_id = name_ids.get((name, sep))
+            if name_id is None:
+                name_id = name_ids[(name, sep)] = len(name_ids)
+            ext_id = ext_ids.get(ext)
+            if ext_id is None:
+                ext_id = ext_ids[ext] = len(ext_ids)
+
+            add_name(name_id)
+            add_ext(ext_id)
+            add_pad(len(frames))
+            add_frame(frame)
+
+        num_records = len(columns["frame"]) - num_records
+        columns["loc"].extend(array("l", [loc_id]) * num_records)
+
+        if others:
+            super()._add_to_directory(dir_name, others)
+
+    def _clear_records(self):
+        """
+        Empty the columns and their lookup tables.
+
+        Returns:
+            None
+        """
+        self._columns = {name: array(code) for name, code in _COLUMNS}
+        self._ids = dict(loc={}, name={}, ext={})
+
+    def _flush_records(self):
+        """
+        Group the buffered records into the container hierarchy.
+
+        Returns:
+            None
+        """
+        columns = self._columns
+        if not columns["frame"]:
+            return
+
+        tables = {}
+        for table, ids in six.iteritems(self._ids):
+            tables[table] = [None] * len(ids)
+            for value, value_id in six.iteritems(ids):
+                tables[table][value_id] = value
+
+        groups = {}
+        records = zip(columns["loc"], columns["name"], columns["ext"],
+                      columns["pad"], columns["frame"])
+        for loc_id, name_id, ext_id, pad, frame in records:
+            key = (loc_id, name_id, ext_id, pad)
+            frames = groups.get(key)
+            if frames is None:
+                frames = groups[key] = []
+            frames.append(frame)
+
+        self._clear_records()
+
+        added = []
+        for (loc_id, name_id, ext_id, pad), frames in six.iteritems(groups):
+            dir_node = tables["loc"][loc_id]
+            name, sep = tables["name"][name_id]
+
+            seq_name = name[1:]
+            seq_key = seq_name if sep == "." else (seq_name, sep)
+            sequence = self._locs[dir_node]["seqs"][seq_key]
+            if not sequence:
+                sequence.name = seq_name
+                sequence.path = dir_node
+                sequence.sep = sep
+
+            fext = sequence[tables["ext"][ext_id]]
+            if pad not in fext:
+                self._counts["sequences"] += 1
+                added.append(fext)
+
+            fseq = fext[pad]
+            self._counts["frames"] -= len(fseq)
+            fseq._add_frames(frames)  # pylint: disable=W0212
+            self._counts["frames"] += len(fseq)
+
+        self._consolidate(added)
+
+    def _forget_dir(self, dir_name):
+        """
+        Drop a scanned directory and all of its scanned subdirectories.
+
+        Args:
+            dir_name (str): The directory that you'd like to drop.
+
+        Returns:
+            set of str directories that have been dropped.
+        """
+        self._flush_records()
+        return super()._forget_dir(dir_name)
+
+    def _rescan_dirs(self, dir_names, force=False):
+        """
+        Update the specified scanned directories with changes made on disk.
+
+        Args:
+            dir_names (iterable of str): The (previously scanned) directories
+                that you'd like to update. Unknown directories are ignored.
+            force (bool, optional): Whether to re-list the directories even if
+                their modification times haven't changed. Defaults to False.
+
+        Returns:
+            set of str directories that have been re-listed, added or removed.
+        """
+        self._flush_records()
+        return super()._rescan_dirs(dir_names, force=force)
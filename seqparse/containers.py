@@ -5,6 +5,7 @@ from functools import total_ordering
 import os
 
 from .files import File
+from .paths import PathNode
 from .sequences import FileSequence
 
 __all__ = ("FileExtension", "FileSequenceContainer", "SingletonContainer")
@@ -32,20 +33,35 @@ class FileExtension(MutableMapping):
         self._name = None
         self._parent = None
 
+        # Sorted zero-paddings, cached for output until one is added or
+        # removed.
+        self._sorted = None
+
+        # Zero-paddings added since the file sequences were last consolidated.
+        self._added = set()
+
         self.name = name
         self.parent = parent
 
+    def __contains__(self, key):
+        """Define containment logic (per collections.defaultdict)."""
+        return key in self._data
+
     def __delitem__(self, key):
         """Define key deletion logic (per standard dictionary)."""
         del self._data[key]
+        self._added.discard(key)
+        self._sorted = None
 
     def __getitem__(self, key):
         """Define key getter logic (per collections.defaultdict)."""
         if key not in self._data:
             opts = {'ext': self.name, 'pad': key}
             if self.parent:
-                opts.update(name=self.parent.full_name)
-            self._data[key] = self._CHILD_CLASS(**opts)
+                opts.update(name=self.parent.name, sep=self.parent.sep)
+            self._data[key] = self._set_child_path(self._CHILD_CLASS(**opts))
+            self._added.add(key)
+            self._sorted = None
         return self._data[key]
 
     def __iter__(self):
@@ -68,8 +84,8 @@ class FileExtension(MutableMapping):
         if isinstance(value, (list, tuple, set)):
             opts = dict(ext=self.name, frames=value, pad=key)
             if self.parent:
-                opts.update(name=self.parent.full_name)
-            value = self._CHILD_CLASS(**opts)
+                opts.update(name=self.parent.name, sep=self.parent.sep)
+            value = self._set_child_path(self._CHILD_CLASS(**opts))
 
         if not isinstance(value, self._CHILD_CLASS):
             blurb = 'Container may only hold "{}" instances ("{}" provided)'
@@ -77,7 +93,10 @@ class FileExtension(MutableMapping):
                 blurb.format(self._CHILD_CLASS.__name__,
                              type(value).__name__))
 
+        if key not in self._data:
+            self._sorted = None
         self._data[key] = value
+        self._added.add(key)
 
     @property
     def name(self):
@@ -101,6 +120,87 @@ class FileExtension(MutableMapping):
         if isinstance(val, FileSequenceContainer):
             self._parent = val
 
+    def consolidate(self):
+        """
+        Merge file sequences that don't need their zero-padding.
+
+        The frames of a file sequence without any zero-padded frames (ie,
+        "1000-1010" with a pad of 4) belong to the file sequence with the next
+        smallest zero-padding, if there is one. Once a file sequence with
+        zero-padded frames has been added, it reclaims any frames of its
+        zero-padding that were merged before it was. Frames are moved as
+        integers, along with any cached disk stats.
+
+        Only the file sequences added since the last consolidation are
+        checked. Seqparse consolidates its containers as files are added, so
+        their output is always consolidated; call this method yourself after
+        adding file sequences to a container directly.
+
+        Returns:
+            int number of file sequences that have been merged.
+        """
+        added = self._added
+        if not added:
+            return 0
+        self._added = set()
+
+        data = self._data
+        if self._sorted is None:
+            self._sorted = sorted(data)
+        pads = self._sorted
+
+        # Bar the smallest, consolidated file sequences are all zero-padded.
+        lowest = next((x for x in pads if x not in added), None)
+
+        merged = []
+        home = None
+        for pad in pads:
+            fseq = data[pad]
+            if home is None or not (pad in added or pad == lowest):
+                home = fseq
+                continue
+
+            if not fseq.is_padded:
+                fseq.move_frames(home)
+                merged.append(pad)
+                continue
+
+            if pad in added:
+                home.move_frames(fseq, first=10**(pad - 1))
+
+            home = fseq
+
+        for pad in merged:
+            del self[pad]
+
+        return len(merged)
+
+    def get_sequence(self, pad, padded=True):
+        """
+        Fetch the file sequence to which frames should be added.
+
+        Frames that aren't zero-padded go straight to the file sequence that
+        they'd be merged into by the consolidate method, if there is one.
+        Otherwise, the file sequence for the zero-padding is fetched (or
+        created), as per the standard getter.
+
+        Args:
+            pad (int): Zero-padding of the frames.
+            padded (bool, optional): Whether the frames are zero-padded (or
+                otherwise need a file sequence of the same zero-padding).
+                Defaults to True.
+
+        Returns:
+            FileSequence instance.
+        """
+        if padded or pad in self._data:
+            return self[pad]
+
+        smaller = [x for x in self._data if x < pad]
+        if not smaller:
+            return self[pad]
+        return self._data[max(smaller)]
+
     def output(self):
         """
         Calculate a sorted list of all contained file extentions.
@@ -108,20 +208,27 @@ class FileExtension(MutableMapping):
         Yields:
             FrameSequence, sorted by zero-pad length.
         """
-        # First, check to see if we need to consolidate our file sequences.
-        data = sorted(list(self.items()), reverse=True)
-        while len(data) > 1:
-            pad, fseq = data.pop(0)
+        # Read once: other threads may be outputting the instance, too.
+        pads = self._sorted
+        if pads is None:
+            pads = self._sorted = sorted(self._data)
 
-            # NOTE: the is_padded() method will force recalculation if the
-            # object is dirty.
-            if not fseq.is_padded:
-                prev_fseq = data[0][1]
-                prev_fseq.update(fseq)
-                del self[pad]
+        for pad in pads:
+            yield self._data[pad]
+
+    def _set_child_path(self, child):
+        """
+        Share the directory of the parent container with a child instance.
+
+        Args:
+            child (FileSequence): The child whose path you'd like to set.
 
-        for pad in sorted(self):
-            yield self[pad]
+        Returns:
+            The child instance.
+        """
+        if self.parent and self.parent._path:  # pylint: disable=W0212
+            child.path = self.parent._path  # pylint: disable=W0212
+        return child
 
 
 ###############################################################################
@@ -135,26 +242,34 @@ class FileSequenceContainer(MutableMapping):
 
     Args:
         name (str, optional): Base name of the contained files.
-        file_path (str, optional): Directory in which the contained files
-            reside.
+        file_path (str or PathNode, optional): Directory in which the
+            contained files reside.
+        sep (str, optional): Separator between the base name and frames of
+            the contained files. Defaults to ".".
     """
 
     _CHILD_CLASS = FileExtension
 
-    def __init__(self, name=None, file_path=None):
+    def __init__(self, name=None, file_path=None, sep="."):
         """Initialise the instance."""
         self._data = {}
 
-        self._full = None
         self._name = None
         self._path = None
+        self._sep = None
+
+        # Sorted file extensions, cached for output until one is added or
+        # removed.
+        self._sorted = None
 
         self.name = name
         self.path = file_path
+        self.sep = sep
 
     def __delitem__(self, key):
         """Define key deletion logic (per standard dictionary)."""
         del self._data[key]
+        self._sorted = None
 
     def __eq__(self, other):
         """
@@ -164,6 +279,9 @@ class FileSequenceContainer(MutableMapping):
         property and is only used for output sorting.
         """
         if type(other) is type(self):
+            if self._path is other._path:
+                # Containers in the same directory share their path.
+                return self._name == other._name
             return self.full_name == other.full_name
         return False
 
@@ -171,6 +289,7 @@ class FileSequenceContainer(MutableMapping):
         """Define key getter logic (per collections.defaultdict)."""
         if key not in self._data:
             self._data[key] = self._CHILD_CLASS(name=key, parent=self)
+            self._sorted = None
         return self._data[key]
 
     def __iter__(self):
@@ -189,6 +308,8 @@ class FileSequenceContainer(MutableMapping):
         property and is only used for output sorting.
         """
         if type(other) is type(self):
+            if self._path is other._path:
+                return (self._name or "") < (other._name or "")
             return self.full_name < other.full_name
         return True
 
@@ -212,14 +333,18 @@ class FileSequenceContainer(MutableMapping):
                      "({!r} != {!r})")
             raise ValueError(blurb.format(key, value.name))
 
+        if key not in self._data:
+            self._sorted = None
         self._data[key] = value
-        # Overriding child container's name to match!
-        value.name = self.full_name
+        # Overriding child container's name (and path) to match!
+        value.name = self.name
+        if self._path:
+            value.path = self._path
 
     @property
     def full_name(self):
         """str: Full (base) name of the file sequence."""
-        return self._full
+        return os.path.join(self.path or "", self._name or "")
 
     @property
     def name(self):
@@ -231,19 +356,33 @@ class FileSequenceContainer(MutableMapping):
         self._name = None
         if val:
             self._name = str(val)
-        self._full = os.path.join(self._path or "", self._name or "")
 
     @property
     def path(self):
-        """str: directory in which the contained files reside."""
-        return self._path
+        """
+        str: directory in which the contained files reside.
+
+        PathNode instances may be used to set the directory, in which case it
+        is only built as a string when requested.
+        """
+        if self._path is None:
+            return None
+        return str(self._path)
 
     @path.setter
     def path(self, val):
         self._path = None
         if val:
-            self._path = str(val)
-        self._full = os.path.join(self._path or "", self._name or "")
+            self._path = val if isinstance(val, PathNode) else str(val)
+
+    @property
+    def sep(self):
+        """str: Separator between the base name and frames of the files."""
+        return self._sep
+
+    @sep.setter
+    def sep(self, val):
+        self._sep = "." if val is None else str(val)
 
     def output(self):
         """
@@ -253,8 +392,12 @@ class FileSequenceContainer(MutableMapping):
             FileSequence, sorted (in order) by file path, extension, and zero-
                 padding length.
         """
-        for data in sorted(self.values()):
-            for file_seq in data.output():
+        exts = self._sorted
+        if exts is None:
+            exts = self._sorted = sorted(self._data)
+
+        for ext in exts:
+            for file_seq in self._data[ext].output():
                 yield file_seq
 
 
@@ -269,8 +412,8 @@ class SingletonContainer(MutableSet):
     Args:
         file_names (list-like of str, optional): List of base file names to
             store in the container.
-        file_path (str, optional): Directory in which the contained files
-            reside.
+        file_path (str or PathNode, optional): Directory in which the
+            contained files reside.
     """
 
     def __init__(self, file_names=None, file_path=None):
@@ -279,6 +422,9 @@ class SingletonContainer(MutableSet):
         self._path = None
         self._stat = {}
 
+        # Sorted file names, cached for output until one is added or removed.
+        self._sorted = None
+
         for item in file_names or []:
             self.add(item)
 
@@ -307,20 +453,30 @@ class SingletonContainer(MutableSet):
 
     @property
     def path(self):
-        """Directory in which the contained files are located."""
-        return self._path
+        """
+        Directory in which the contained files are located.
+
+        PathNode instances may be used to set the directory, in which case it
+        is only built as a string when requested.
+        """
+        return str(self._path)
 
     @path.setter
     def path(self, val):
-        self._path = str(val or "")
+        self._path = val if isinstance(val, PathNode) else str(val or "")
 
     def add(self, value):
         """Defining item addition logic (per standard set)."""
-        self._data.add(str(value))
+        value = str(value)
+        if value not in self._data:
+            self._data.add(value)
+            self._sorted = None
 
     def discard(self, value):
         """Defining item discard logic (per standard set)."""
-        self._data.discard(value)
+        if value in self._data:
+            self._data.discard(value)
+            self._sorted = None
 
     def update(self, iterable):
         """Defining update logic (per standard set)."""
@@ -354,9 +510,13 @@ class SingletonContainer(MutableSet):
         Yields:
             File, sorted alphabetically.
         """
-        for file_name in sorted(self):
-            yield File(os.path.join(self.path, file_name),
-                       self.stat(file_name))
+        file_names = self._sorted
+        if file_names is None:
+            file_names = self._sorted = sorted(self._data)
+
+        path = self.path
+        for file_name in file_names:
+            yield File(os.path.join(path, file_name), self.stat(file_name))
 
     def stat(self, base_name=None):
         """
@@ -0,0 +1,246 @@
+"""Persistent, SQLite-backed indexes of Seqparse instances."""
+
+import json
+import os
+import sqlite3
+
+from .regex import NamingGrammar
+from .seqparse import ScanRecord
+
+__all__ = ("INDEX_FORMAT", "load_index", "save_index")
+
+# Bump this whenever the index schema changes.
+INDEX_FORMAT = 1
+
+STAT_COLUMNS = ("st_mode", "st_ino", "st_dev", "st_nlink", "st_uid", "st_gid",
+                "st_size", "st_atime", "st_mtime", "st_ctime")
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE roots (path TEXT PRIMARY KEY, max_levels INTEGER,
+                    min_levels INTEGER);
+CREATE TABLE dirs (path TEXT PRIMARY KEY, mtime_ns INTEGER, inode INTEGER,
+                   level INTEGER, max_levels INTEGER, min_levels INTEGER);
+CREATE TABLE subdirs (parent TEXT, path TEXT);
+CREATE TABLE sequences (id INTEGER PRIMARY KEY, dir TEXT, name TEXT, sep TEXT,
+                        ext TEXT, pad INTEGER);
+CREATE TABLE chunks (seq_id INTEGER, first INTEGER, last INTEGER);
+CREATE TABLE frame_stats (seq_id INTEGER, frame INTEGER, {stats});
+CREATE TABLE singletons (dir TEXT, name TEXT, {stats});
+""".format(stats=", ".join(f"{x} INTEGER" for x in STAT_COLUMNS))
+
+###############################################################################
+# EXPORTED METHODS
+
+
+def load_index(parser, index_path):
+    """
+    Add the contents of an index file to the supplied parser.
+
+    The scan options, scan roots and incremental scan records stored in the
+    index are loaded along with the singletons and file sequences. No files
+    or directories are read from disk.
+
+    File sequences are stored as they were split by the naming grammars of
+    the instance that wrote the index, so the parser has to use the same
+    grammars.
+
+    Args:
+        parser (Seqparse): The instance to which you'd like to add the indexed
+            singletons and file sequences.
+        index_path (str): Location of the index file on disk.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: If the file is not an index, if it was written in an
+            unsupported format, or with naming grammars other than those of
+            the parser.
+    """
+    # pylint: disable=W0212
+    if not os.path.isfile(index_path):
+        raise ValueError(f"Index file does not exist: {index_path!r}")
+
+    conn = sqlite3.connect(index_path)
+    try:
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM meta"))
+        except sqlite3.DatabaseError as error:
+            raise ValueError(f"Invalid index file: {index_path!r}") from error
+
+        if meta.get("format") != str(INDEX_FORMAT):
+            blurb = "Unsupported index format ({!r} != {!r}): {!r}"
+            raise ValueError(
+                blurb.format(meta.get("format"), str(INDEX_FORMAT),
+                             index_path))
+
+        grammars = tuple(
+            NamingGrammar(*x) for x in json.loads(meta.get("grammars", "[]")))
+        if grammars != parser.grammars:
+            blurb = "Index naming grammars differ ({!r} != {!r}): {!r}"
+            raise ValueError(
+                blurb.format(grammars, parser.grammars, index_path))
+
+        # JSON turns the (tuple) name patterns of the scan options into
+        # lists.
+        scan_options = json.loads(meta["scan_options"])
+        parser.scan_options.update(
+            (x, tuple(y) if isinstance(y, list) else y)
+            for x, y in scan_options.items())
+
+        for path, max_levels, min_levels in conn.execute(
+                "SELECT path, max_levels, min_levels FROM roots"):
+            parser._roots[path] = (max_levels, min_levels)
+
+        subdirs = {}
+        for parent, path in conn.execute(
+                "SELECT parent, path FROM subdirs ORDER BY rowid"):
+            subdirs.setdefault(parent, []).append(path)
+
+        for row in conn.execute("SELECT * FROM dirs"):
+            path = row[0]
+            parser._scanned[path] = ScanRecord(*row[1:],
+                                               tuple(subdirs.get(path, ())))
+
+        parser._import_locations(_read_locations(conn))
+    finally:
+        conn.close()
+
+
+def save_index(parser, index_path):
+    """
+    Write the contents of the supplied parser to an index file.
+
+    File sequences are stored per zero-padding, as runs of consecutive frames.
+    The naming grammars of the parser are stored along with its scan options.
+    Any existing file at the specified location is (atomically) replaced.
+
+    Args:
+        parser (Seqparse): The instance whose contents you'd like to store.
+        index_path (str): Location of the index file on disk.
+
+    Returns:
+        None
+    """
+    # pylint: disable=W0212
+    temp_path = f"{index_path}.{os.getpid()}.tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+    conn = sqlite3.connect(temp_path)
+    try:
+        with conn:
+            conn.executescript(_SCHEMA)
+            conn.executemany(
+                "INSERT INTO meta VALUES (?, ?)",
+                [("format", str(INDEX_FORMAT)),
+                 ("grammars", json.dumps(parser.grammars)),
+                 ("scan_options", json.dumps(parser.scan_options))])
+            conn.executemany("INSERT INTO roots VALUES (?, ?, ?)",
+                             [(path, ) + tuple(levels)
+                              for path, levels in parser.scan_roots.items()])
+            _write_scan_records(conn, parser._scanned)
+            _write_locations(conn, parser._export_locations())
+    finally:
+        conn.close()
+
+    os.replace(temp_path, index_path)
+
+
+###############################################################################
+# INTERNAL METHODS
+
+
+def _read_locations(conn):
+    """
+    Read stored singletons and file sequences from an index.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the index.
+
+    Returns:
+        list of location records, as per Seqparse._export_locations.
+    """
+    locations = {}
+
+    def get_location(dir_name):
+        """Fetch the (sequences, singletons) lists for a directory."""
+        if dir_name not in locations:
+            locations[dir_name] = ([], [])
+        return locations[dir_name]
+
+    runs, stats = {}, {}
+    for seq_id, first, last in conn.execute(
+            "SELECT seq_id, first, last FROM chunks"):
+        runs.setdefault(seq_id, []).append((first, last))
+    for row in conn.execute("SELECT * FROM frame_stats"):
+        stats.setdefault(row[0], []).append((row[1], row[2:]))
+
+    for seq_id, dir_name, name, sep, ext, pad in conn.execute(
+            "SELECT id, dir, name, sep, ext, pad FROM sequences"):
+        seq_key = name if sep == "." else (name, sep)
+        get_location(dir_name)[0].append(
+            (seq_key, name, sep, ext, pad, runs.get(seq_id, []),
+             stats.get(seq_id, [])))
+
+    for row in conn.execute("SELECT * FROM singletons"):
+        stat = row[2:]
+        if stat[0] is None:
+            stat = None
+        get_location(row[0])[1].append((row[1], stat))
+
+    return [(dir_name, seqs, files)
+            for dir_name, (seqs, files) in locations.items()]
+
+
+def _write_locations(conn, locations):
+    """
+    Write singletons and file sequences to an index.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the index.
+        locations (list): Location records, as per
+            Seqparse._export_locations.
+
+    Returns:
+        None
+    """
+    no_stat = (None, ) * len(STAT_COLUMNS)
+    stat_values = ", ".join("?" * len(STAT_COLUMNS))
+
+    for dir_name, seqs, files in locations:
+        for _, name, sep, ext, pad, runs, stats in seqs:
+            cursor = conn.execute(
+                "INSERT INTO sequences (dir, name, sep, ext, pad) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (dir_name, name or "", sep, ext, pad))
+            seq_id = cursor.lastrowid
+            conn.executemany("INSERT INTO chunks VALUES (?, ?, ?)",
+                             [(seq_id, ) + tuple(x) for x in runs])
+            conn.executemany(
+                f"INSERT INTO frame_stats VALUES (?, ?, {stat_values})",
+                [(seq_id, frame) + tuple(stat) for frame, stat in stats])
+
+        conn.executemany(
+            f"INSERT INTO singletons VALUES (?, ?, {stat_values})",
+            [(dir_name, name) + tuple(stat or no_stat)
+             for name, stat in files])
+
+
+def _write_scan_records(conn, records):
+    """
+    Write incremental scan records to an index.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the index.
+        records (dict): ScanRecord instances, indexed by directory.
+
+    Returns:
+        None
+    """
+    for path, record in records.items():
+        conn.execute("INSERT INTO dirs VALUES (?, ?, ?, ?, ?, ?)",
+                     (path, ) + tuple(record[:-1]))
+        conn.executemany("INSERT INTO subdirs VALUES (?, ?)",
+                         [(path, x) for x in record.subdirs])
@@ -0,0 +1,145 @@
+"""Readers for precomputed file metadata (stat) manifests."""
+
+import io
+import os
+import sys
+
+__all__ = ("FIND_COLUMNS", "MANIFEST_COLUMNS", "read_manifest",
+           "validate_columns")
+
+# Column names, in os.stat_result order.
+MANIFEST_COLUMNS = ("mode", "ino", "dev", "nlink", "uid", "gid", "size",
+                    "atime", "mtime", "ctime")
+
+# The layout of "find -printf '%s %T@ %C@ %p\n'" output.
+FIND_COLUMNS = ("size", "mtime", "ctime", "path")
+
+_TIME_COLUMNS = frozenset(("atime", "mtime", "ctime"))
+
+###############################################################################
+# EXPORTED METHODS
+
+
+def read_manifest(manifest, columns=FIND_COLUMNS, sep=None):
+    """
+    Yield the files (and their stats) listed in a manifest.
+
+    Each line of a manifest describes one file, as a series of columns. The
+    path must be the last column, and takes up the rest of the line (so may
+    contain the separator); columns named None are skipped. For example,
+    GPFS policy engine output ("<inode> <gen> <snapshot> <size> <mtime> --
+    <path>", with numeric times) may be read with the following columns:
+
+        ("ino", None, None, "size", "mtime", None, "path")
+
+    Stat columns that aren't provided are reported as zero; times are read as
+    (fractional) seconds since the epoch.
+
+    Args:
+        manifest (str or iterable of str): Path to the manifest file ("-" for
+            stdin), or an iterable of its lines.
+        columns (tuple of str, optional): Names of the columns of each line,
+            taken from MANIFEST_COLUMNS plus "path". Defaults to FIND_COLUMNS.
+        sep (str, optional): The column separator. Defaults to None (runs of
+            whitespace).
+
+    Yields:
+        (str path, os.stat_result) tuples.
+
+    Raises:
+        ValueError: If the column layout is invalid, or a line can't be
+            parsed.
+    """
+    columns = validate_columns(columns)
+
+    # (line index, stat index, type) for each column that's being read.
+    fields = [(index, MANIFEST_COLUMNS.index(name),
+               float if name in _TIME_COLUMNS else int)
+              for index, name in enumerate(columns[:-1]) if name is not None]
+    num_splits = len(columns) - 1
+
+    lines = manifest
+    if isinstance(manifest, str):
+        lines = _open_manifest(manifest)
+
+    try:
+        for line_num, line in enumerate(lines, 1):
+            line = line.rstrip("\r\n")
+            if not line:
+                continue
+
+            bits = line.split(sep, num_splits)
+            stat = [0] * len(MANIFEST_COLUMNS)
+            try:
+                if len(bits) <= num_splits or not bits[-1]:
+                    raise ValueError("missing columns")
+                for index, stat_index, cast in fields:
+                    stat[stat_index] = cast(bits[index])
+            except ValueError as error:
+                raise ValueError(
+                    f"Invalid manifest line {line_num:d}: {line!r} "
+                    f"({error})") from error
+
+            yield bits[-1], os.stat_result(stat)
+    finally:
+        if lines is not manifest:
+            if manifest == "-":
+                # Leave stdin open.
+                lines.detach()
+            else:
+                lines.close()
+
+
+def validate_columns(columns):
+    """
+    Check a manifest column layout.
+
+    Args:
+        columns (iterable of str): Names of the columns of each line, taken
+            from MANIFEST_COLUMNS plus "path" (or None, for skipped columns).
+
+    Returns:
+        tuple of str column names.
+
+    Raises:
+        ValueError: If the path isn't the last (and only the last) column, or
+            if any of the column names are unknown.
+    """
+    columns = tuple(columns)
+    if not columns or columns[-1] != "path" or "path" in columns[:-1]:
+        raise ValueError(
+            f"The last (and only the last) column must be 'path': {columns!r}")
+
+    unknown = set(columns[:-1]) - set(MANIFEST_COLUMNS) - {None}
+    if unknown:
+        raise ValueError(f"Unknown manifest columns: {sorted(unknown)!r}")
+
+    return columns
+
+
+###############################################################################
+# INTERNAL METHODS
+
+
+def _open_manifest(manifest_path):
+    """
+    Open a manifest file for reading.
+
+    Paths are decoded in the same way as os.fsdecode, so undecodable bytes
+    survive the round trip.
+
+    Args:
+        manifest_path (str): Path to the manifest file, or "-" for stdin.
+
+    Returns:
+        file-like object.
+    """
+    if manifest_path == "-":
+        file_obj = sys.stdin.buffer
+    else:
+        file_obj = open(manifest_path, "rb")  # pylint: disable=R1732
+
+    return io.TextIOWrapper(file_obj,
+                            encoding=sys.getfilesystemencoding(),
+                            errors="surrogateescape",
+                            newline="\n")
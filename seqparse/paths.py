@@ -0,0 +1,290 @@
+"""Compact storage for (directory) paths utilized by the Seqparse module."""
+
+from collections.abc import MutableMapping
+from operator import attrgetter
+import os
+import sys
+
+__all__ = ("PathNode", "PathTrie")
+
+# Marks trie nodes that don't hold a value.
+_MISSING = object()
+
+###############################################################################
+# Class: PathNode
+
+
+class PathNode:
+    """
+    A single path in a PathTrie.
+
+    Each node only holds its own (interned) path segment; the full path is
+    built from the segments of the node and its ancestors whenever it's
+    requested. Nodes are path-like, so they may be passed to the os module.
+
+    Args:
+        segment (str, optional): The last segment of the path. Defaults to "".
+        parent (PathNode, optional): The node of the parent path. Defaults to
+            None (the root of a trie).
+    """
+
+    __slots__ = ("children", "parent", "segment", "value")
+
+    def __init__(self, segment="", parent=None):
+        """Initialise the instance."""
+        self.children = None
+        self.parent = parent
+        self.segment = segment
+        self.value = _MISSING
+
+    def __bool__(self):
+        """Whether the node represents a non-empty path."""
+        parent = self.parent
+        return parent is not None and (parent.parent is not None
+                                       or self.segment != "")
+
+    def __fspath__(self):
+        """File system representation of the node."""
+        return self.path
+
+    def __repr__(self):  # pragma: no cover
+        """Pretty representation of the instance."""
+        return f"{type(self).__name__}({self.path!r})"
+
+    def __str__(self):
+        """String representation of the node."""
+        return self.path
+
+    @property
+    def path(self):
+        """str: The full path represented by the node."""
+        segments = []
+        node = self
+        while node.parent is not None:
+            segments.append(node.segment)
+            node = node.parent
+        return os.sep.join(reversed(segments))
+
+
+###############################################################################
+# Class: PathTrie
+
+
+class PathTrie(MutableMapping):
+    """
+    Mapping of paths to values, stored as a trie of interned path segments.
+
+    Paths are split on os.sep (and rebuilt exactly, so there's no
+    normalisation), with each distinct segment string stored once no matter
+    how many paths share it. The memory used by the paths therefore grows with
+    the number of unique segments rather than the combined length of the
+    paths.
+
+    Args:
+        default_factory (callable, optional): Called to provide the values of
+            missing keys, as per collections.defaultdict. Defaults to None
+            (missing keys raise KeyError).
+    """
+
+    def __init__(self, default_factory=None):
+        """Initialise the instance."""
+        self.default_factory = default_factory
+        self._len = 0
+        self._root = PathNode()
+        self._sorted = None
+
+    def __contains__(self, key):
+        """Define containment logic (per standard dictionary)."""
+        node = self.get_node(key, create=False)
+        return node is not None and node.value is not _MISSING
+
+    def __delitem__(self, key):
+        """Define key deletion logic (per standard dictionary)."""
+        node = self.get_node(key, create=False)
+        if node is None or node.value is _MISSING:
+            raise KeyError(key)
+
+        node.value = _MISSING
+        self._len -= 1
+        self._sorted = None
+
+        # Prune any branches that no longer lead to values.
+        while (node.parent is not None and node.value is _MISSING
+               and not node.children):
+            del node.parent.children[node.segment]
+            if not node.parent.children:
+                node.parent.children = None
+            node = node.parent
+
+    def __getitem__(self, key):
+        """Define key getter logic (per collections.defaultdict)."""
+        node = self.get_node(key, create=self.default_factory is not None)
+        if node is None:
+            raise KeyError(key)
+
+        if node.value is _MISSING:
+            if self.default_factory is None:
+                raise KeyError(key)
+            node.value = self.default_factory()
+            self._len += 1
+            self._sorted = None
+
+        return node.value
+
+    def __iter__(self):
+        """Define key iteration logic (depth-first, in insertion order)."""
+        for node in self.nodes():
+            yield node.path
+
+    def __len__(self):
+        """Define item length logic (per standard dictionary)."""
+        return self._len
+
+    def __repr__(self):  # pragma: no cover
+        """Pretty representation of the instance."""
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def __setitem__(self, key, value):
+        """Define item setting logic (per standard dictionary)."""
+        node = self.get_node(key)
+        if node.value is _MISSING:
+            self._len += 1
+            self._sorted = None
+        node.value = value
+
+    def clear(self):
+        """
+        Remove all items from the trie.
+
+        Returns:
+            None
+        """
+        self._len = 0
+        self._root = PathNode()
+        self._sorted = None
+
+    def get(self, key, default=None):
+        """
+        Fetch the value of a path, without creating missing keys.
+
+        Args:
+            key (str or PathNode): The path whose value you'd like to fetch.
+            default (optional): Returned if there's no value for the path.
+                Defaults to None.
+
+        Returns:
+            The value of the path, or the default.
+        """
+        node = self.get_node(key, create=False)
+        if node is None or node.value is _MISSING:
+            return default
+        return node.value
+
+    def get_node(self, path, create=True):
+        """
+        Fetch the trie node of a path.
+
+        Fetching a node does not provide it with a value.
+
+        Args:
+            path (str or PathNode): The path whose node you'd like to fetch.
+            create (bool, optional): Whether to create missing nodes. Defaults
+                to True.
+
+        Returns:
+            PathNode instance (None if the node is missing and create is
+            False).
+        """
+        if isinstance(path, PathNode):
+            return path
+
+        node = self._root
+        for segment in str(path).split(os.sep):
+            children = node.children
+            child = children.get(segment) if children else None
+            if child is None:
+                if not create:
+                    return None
+                if children is None:
+                    children = node.children = {}
+                segment = sys.intern(segment)
+                child = children[segment] = PathNode(segment, node)
+            node = child
+
+        return node
+
+    def items(self):
+        """
+        Iterate over the paths and values of the trie.
+
+        Yields:
+            (str path, value) tuples, as per __iter__.
+        """
+        for node in self.nodes():
+            yield node.path, node.value
+
+    def nodes(self):
+        """
+        Iterate over the nodes that hold values.
+
+        Yields:
+            PathNode instances, depth-first in insertion order.
+        """
+        pending = [self._root]
+        while pending:
+            node = pending.pop()
+            if node.value is not _MISSING:
+                yield node
+            if node.children:
+                pending.extend(reversed(list(node.children.values())))
+
+    def pop(self, key, *args):
+        """
+        Remove a path, returning its value.
+
+        Args:
+            key (str or PathNode): The path that you'd like to remove.
+            default (optional): Returned if there's no value for the path.
+
+        Returns:
+            The value of the path, or the default.
+
+        Raises:
+            KeyError: If there's no value for the path, and no default was
+                provided.
+        """
+        node = self.get_node(key, create=False)
+        if node is None or node.value is _MISSING:
+            if args:
+                return args[0]
+            raise KeyError(key)
+
+        value = node.value
+        del self[node]
+        return value
+
+    def sorted_nodes(self):
+        """
+        List the nodes that hold values, sorted by path.
+
+        The list is cached until a path is added to (or removed from) the
+        trie, so repeated calls don't sort (or even build) any paths.
+
+        Returns:
+            tuple of PathNode instances.
+        """
+        nodes = self._sorted
+        if nodes is None:
+            nodes = self._sorted = tuple(
+                sorted(self.nodes(), key=attrgetter("path")))
+        return nodes
+
+    def values(self):
+        """
+        Iterate over the values of the trie.
+
+        Yields:
+            Values, as per __iter__.
+        """
+        for node in self.nodes():
+            yield node.value
@@ -1,10 +1,16 @@
 """Container for all regular expressions used by the seqparse module."""
 
+from array import array
 from collections import namedtuple
+from fnmatch import translate
+from functools import lru_cache, partial
+import os
 import re
 
-__all__ = ("BITS_EXPR", "FILE_NAME_EXPR", "FRAME_EXPR", "FILE_SEQ_EXPR",
-           "SeqparseRegexMixin")
+__all__ = ("BITS_EXPR", "DEFAULT_GRAMMAR", "FILE_NAME_EXPR", "FRAME_EXPR",
+           "FILE_SEQ_EXPR", "NamingGrammar", "ParsedNames",
+           "SeqparseRegexMixin", "compile_grammars", "compile_name_patterns",
+           "split_file_name")
 
 # BITS_EXPR is used to split a frame "chunk" into three sections: first
 # (frame), last (frame). and step.
@@ -26,6 +32,290 @@ ChunkBits = namedtuple('ChunkBits', 'first last step')
 FileNameBits = namedtuple('FileNameBits', 'name frame ext')
 SequenceBits = namedtuple('SequenceBits', 'name frames ext')
 
+# ParsedNames holds the column arrays generated by
+# SeqparseRegexMixin.parse_many: one entry per input file name in every column
+# apart from "dirs," which is the lookup table for the "dir_index" column.
+ParsedNames = namedtuple('ParsedNames',
+                         'dirs dir_index name sep frame pad ext singleton')
+
+# NamingGrammar describes a file naming convention: the literal separator
+# between the base name and the frame(s), and a regular expression matching the
+# file extension (everything after the frame's trailing ".").
+NamingGrammar = namedtuple('NamingGrammar', 'sep ext')
+
+# DEFAULT_GRAMMAR describes the "name.####.ext" convention.
+DEFAULT_GRAMMAR = NamingGrammar(".", r"[^\.]+")
+
+
+def split_file_name(val, frames_expr):
+    """
+    Split a "name.frames.ext" file name without backtracking.
+
+    Produces the same output as matching FILE_NAME_EXPR/FILE_SEQ_EXPR, but in
+    time linear to the length of the frames: the extension and frames can only
+    ever be the last two dot-separated sections of the name, so those are
+    located directly and only the frames are matched against `frames_expr`.
+
+    Args:
+        val (str): Input file name or file sequence.
+        frames_expr (re.Pattern): Compiled expression that has to match the
+            frames section in its entirety.
+
+    Returns:
+        None if the input is invalid, tuple consisting of (base name, frames,
+        extension) otherwise.
+    """
+    ext_dot = val.rfind(".")
+    if ext_dot == -1 or ext_dot == len(val) - 1:
+        return None
+
+    name_dot = val.rfind(".", 0, ext_dot)
+    if not frames_expr.fullmatch(val, name_dot + 1, ext_dot):
+        return None
+
+    name = None
+    if name_dot != -1:
+        # FILE_SEQ_EXPR's "(?P<name>.+)" doesn't match empty names or
+        # newlines.
+        name = val[:name_dot]
+        if not name or "\n" in name:
+            return None
+
+    return name, val[name_dot + 1:ext_dot], val[ext_dot + 1:]
+
+
+def compile_grammars(grammars):
+    r"""
+    Compile naming grammars into file name/sequence splitting functions.
+
+    Only the separator and extension pairs that were declared together are
+    matched: a name is split at its frame(s) first, the separator in front
+    of them is looked up, and only the extensions of that separator's
+    grammars are tried. The cost of splitting a file name therefore doesn't
+    grow with the number of supported conventions.
+
+    Where a name could be split in more than one way, the longest base name
+    wins (ie, the frames closest to the end of the name, with the shortest
+    separator). An empty separator is only allowed where none of the other
+    separators would do, and never directly after a digit.
+
+    Args:
+        grammars (iterable of NamingGrammar): The naming conventions that
+            you'd like to match.
+
+    Returns:
+        tuple of (file name, file sequence) functions, each of which takes
+        a string and returns None if it's invalid, or a tuple consisting of
+        (base name, frame(s), extension) otherwise.
+
+    Raises:
+        ValueError: If a separator ends with a digit, as the frame(s) would
+            then be ambiguous.
+
+    Examples:
+        >>> from seqparse.regex import compile_grammars, NamingGrammar
+        >>> split_file, _ = compile_grammars(
+        ...     [NamingGrammar("_", r"exr"), NamingGrammar("", r"tif")])
+        >>> split_file("kitty_0001.exr"), split_file("kitty0001.tif")
+        (('kitty', '0001', 'exr'), ('kitty', '0001', 'tif'))
+        >>> print(split_file("kitty_0001.tif"))
+        None
+    """
+    grammars = tuple(grammars)
+    if grammars == (DEFAULT_GRAMMAR,):
+        return (partial(split_file_name, frames_expr=re.compile(r"\d+")),
+                partial(split_file_name, frames_expr=re.compile(FRAME_EXPR)))
+
+    for grammar in grammars:
+        if grammar.sep[-1:].isdecimal():
+            raise ValueError(
+                f"Separator can't end with a digit: {grammar.sep!r}")
+
+    return (_GrammarSplitter(grammars),
+            _GrammarSplitter(grammars, sequence=True))
+
+
+def compile_name_patterns(patterns):
+    r"""
+    Compile file (or directory) name patterns into a single expression.
+
+    Patterns are shell-style wildcards (per fnmatch.fnmatchcase), unless they
+    start with "re:" -- in which case the rest of the pattern is a regular
+    expression, matched from the start of the name (per re.match). Compiled
+    expressions are cached.
+
+    Args:
+        patterns (iterable of str): The patterns that you'd like to match.
+
+    Returns:
+        compiled expression that matches names matching any of the patterns,
+        or None if no patterns were supplied.
+
+    Raises:
+        re.error: If a regular expression is invalid.
+
+    Examples:
+        >>> from seqparse.regex import compile_name_patterns
+        >>> expr = compile_name_patterns(["*.exr", r"re:v\d+$"])
+        >>> [bool(expr.match(x)) for x in ("kitty.exr", "v001", "tmp")]
+        [True, True, False]
+    """
+    return _compile_name_patterns(tuple(patterns))
+
+
+def _compile_exts(exts):
+    """
+    Compile naming grammar extensions into a single expression.
+
+    Args:
+        exts (iterable of str): Regular expressions matching extensions.
+
+    Returns:
+        compiled expression that matches any of the extensions.
+    """
+    return re.compile("|".join(f"(?:{x})" for x in dict.fromkeys(exts)))
+
+
+@lru_cache(maxsize=32)
+def _compile_name_patterns(patterns):
+    """
+    Compile a tuple of name patterns, as per compile_name_patterns.
+
+    Args:
+        patterns (tuple of str): The patterns that you'd like to match.
+
+    Returns:
+        compiled expression, or None if no patterns were supplied.
+    """
+    if not patterns:
+        return None
+
+    exprs = []
+    for pattern in patterns:
+        if pattern.startswith("re:"):
+            # Checked on its own, so errors point at the offending pattern.
+            exprs.append(re.compile(pattern[3:]).pattern)
+        else:
+            exprs.append(translate(pattern))
+
+    return re.compile("|".join(f"(?:{x})" for x in exprs))
+
+
+###############################################################################
+# Class: _GrammarSplitter
+class _GrammarSplitter:
+    """Split file names (or file sequences) per a set of naming grammars."""
+
+    def __init__(self, grammars, sequence=False):
+        """
+        Initialise the instance (see compile_grammars).
+
+        Args:
+            grammars (tuple of NamingGrammar): The naming conventions that
+                you'd like to match.
+            sequence (bool, optional): Whether to split file sequences (ie,
+                frames like "0001-0010x2") rather than file names. Defaults
+                to False.
+        """
+        exts = {}
+        for grammar in grammars:
+            exts.setdefault(grammar.sep, []).append(grammar.ext)
+
+        self._any_ext = _compile_exts(x.ext for x in grammars)
+        self._exts = {x: _compile_exts(y) for x, y in exts.items()}
+        self._frames_expr = re.compile(FRAME_EXPR)
+        self._sep_lengths = sorted({len(x) for x in exts if x})
+        self._sequence = sequence
+
+        # Matches up to the run of frame characters that ends at "endpos"
+        # (by backtracking from there), and each digit that starts a run.
+        frame_chars = r"\d,x-" if sequence else r"\d"
+        self._run_expr = re.compile(rf"(?s:.*)(?<![{frame_chars}])")
+        self._start_expr = re.compile(r"(?<!\d)\d")
+
+    def __call__(self, val):
+        """
+        Split a file name (or file sequence).
+
+        Args:
+            val (str): Input file name or file sequence.
+
+        Returns:
+            None if the input is invalid, tuple consisting of (base name,
+            frame(s), extension) otherwise.
+        """
+        ext_dot = len(val)
+        while True:
+            ext_dot = val.rfind(".", 0, ext_dot)
+            if ext_dot < 1:
+                return None
+
+            # Frames always end with a digit.
+            if not val[ext_dot - 1].isdecimal():
+                continue
+
+            # The frame(s) start at the first digit of the (last) run of
+            # frame characters, or at any later digit that follows a frame
+            # chunk separator.
+            run_start = self._run_expr.match(val, 0, ext_dot).end()
+            if self._sequence:
+                frames_match = self._frames_expr.fullmatch
+                starts = [
+                    x.start()
+                    for x in self._start_expr.finditer(val, run_start, ext_dot)
+                    if frames_match(val, x.start(), ext_dot)
+                ]
+                starts.reverse()
+            else:
+                starts = (run_start,)
+
+            for start in starts:
+                name_end = self._get_name_end(val, start, ext_dot + 1)
+                if name_end != -1:
+                    return (val[:name_end] if name_end else None,
+                            val[start:ext_dot], val[ext_dot + 1:])
+
+    def _get_name_end(self, val, start, ext_start):
+        """
+        Find the end of the base name in front of the frame(s) of a name.
+
+        Args:
+            val (str): Input file name or file sequence.
+            start (int): Index of the first character of the frame(s).
+            ext_start (int): Index of the first character of the extension.
+
+        Returns:
+            int index, 0 if the name doesn't have a base name, or -1 if it
+            doesn't match any of the grammars.
+        """
+        if not start:
+            return 0 if self._any_ext.fullmatch(val, ext_start) else -1
+
+        has_sep = False
+        for length in self._sep_lengths:
+            if length > start:
+                break
+
+            ext_expr = self._exts.get(val[start - length:start])
+            if ext_expr is None:
+                continue
+
+            has_sep = True
+            if (length < start and "\n" not in val[:start - length]
+                    and ext_expr.fullmatch(val, ext_start)):
+                return start - length
+
+        # An empty separator mustn't follow any of the others (or a frame
+        # chunk separator), so "name.####.ext" doesn't turn into a base name
+        # of "name." and "name0001-0010.ext" into "name0001-".
+        ext_expr = self._exts.get("")
+        if has_sep or ext_expr is None or "\n" in val[:start]:
+            return -1
+        if (self._sequence and val[start - 1] in ",x-"
+                and val[start - 2:start - 1].isdecimal()):
+            return -1
+        return start if ext_expr.fullmatch(val, ext_start) else -1
+
 
 ###############################################################################
 # Class: SeqparseRegexMixin
@@ -33,9 +323,48 @@ class SeqparseRegexMixin:
     """Base for classes that need to perform regular expression matches."""
 
     _bits_expr = re.compile(BITS_EXPR)
-    _file_expr = re.compile(FILE_NAME_EXPR)
     _frame_expr = re.compile(rf",*{FRAME_EXPR},*$")
-    _fseq_expr = re.compile(FILE_SEQ_EXPR)
+    _grammars = (DEFAULT_GRAMMAR,)
+    _is_default_grammar = True
+    _split_file, _split_seq = compile_grammars(_grammars)
+
+    @property
+    def grammars(self):
+        """tuple of NamingGrammar: File naming conventions recognised."""
+        return self._grammars
+
+    def set_grammars(self, grammars=None):
+        r"""
+        Set the file naming conventions recognised by the instance.
+
+        The grammars are compiled (per compile_grammars) for use by this
+        instance alone: the class itself (and every other instance) keeps the
+        "name.####.ext" convention.
+
+        Args:
+            grammars (iterable of NamingGrammar, optional): The naming
+                conventions that you'd like to match. Defaults to the
+                "name.####.ext" convention (DEFAULT_GRAMMAR).
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If a separator ends with a digit.
+
+        Examples:
+            >>> from seqparse.regex import DEFAULT_GRAMMAR, NamingGrammar
+            >>> from seqparse.seqparse import Seqparse
+            >>> parser = Seqparse()
+            >>> parser.set_grammars([DEFAULT_GRAMMAR,
+            ...                      NamingGrammar("_", r"[^\.]+")])
+            >>> parser.file_name_match("kitty_0001.exr")
+            FileNameBits(name='kitty', frame='0001', ext='exr')
+        """
+        grammars = tuple(grammars or (DEFAULT_GRAMMAR,))
+        self._split_file, self._split_seq = compile_grammars(grammars)
+        self._grammars = grammars
+        self._is_default_grammar = grammars == (DEFAULT_GRAMMAR,)
 
     def bits_match(self, val, as_dict=False):
         """
@@ -73,10 +402,10 @@ class SeqparseRegexMixin:
             as_dict = False, or
             dict of regex groups with as_dict = True.
         """
-        fmatch = self._file_expr.match(val)
-        if fmatch:
-            return fmatch.groupdict() if as_dict else FileNameBits(
-                **fmatch.groupdict())
+        bits = self._match_file_name(val)
+        if bits:
+            return FileNameBits(*bits)._asdict() if as_dict else FileNameBits(
+                *bits)
         return None
 
     def file_seq_match(self, val, as_dict=False):
@@ -94,12 +423,146 @@ class SeqparseRegexMixin:
             as_dict = False, or
             dict of regex groups with as_dict = True.
         """
-        fmatch = self._fseq_expr.match(val)
-        if fmatch:
-            return fmatch.groupdict() if as_dict else SequenceBits(
-                **fmatch.groupdict())
+        bits = self._match_file_seq(val)
+        if bits:
+            return SequenceBits(*bits)._asdict() if as_dict else SequenceBits(
+                *bits)
         return None
 
+    def frame_sep(self, val, bits):
+        """
+        Calculate the separator between base name and frame(s) of a file.
+
+        Args:
+            val (str): File name or file sequence, as matched by
+                `file_name_match` or `file_seq_match`.
+            bits (tuple): Output of the match.
+
+        Returns:
+            str separator ("." for the default naming convention).
+        """
+        name, frames, ext = bits
+        if name is None:
+            return "."
+        return val[len(name):len(val) - len(frames) - len(ext) - 1]
+
+    def parse_many(self, names):
+        """
+        Split an iterable of file names into column arrays.
+
+        Every input name is split once, per the naming grammars of the
+        instance, and the results are stored in flat columns rather than a
+        namedtuple (or dictionary) per name. This is a standalone API for
+        tools that post-process lists of names; Seqparse doesn't use it to
+        add files.
+
+        Args:
+            names (iterable of str): File names (including any containing
+                directory) that you'd like to parse.
+
+        Returns:
+            ParsedNames instance consisting of the following columns:
+
+            * dirs (list of str): Unique directory names, in order of first
+              appearance,
+            * dir_index (array of int): Index of each name's directory in
+              `dirs`,
+            * name (list of str): Base name of the file sequence, or the full
+              base name for singletons,
+            * sep (list of str): Separator between the base name and frame
+              (as per frame_sep), empty for singletons,
+            * frame (array of int): Integer frame, -1 for singletons,
+            * pad (array of int): Zero-padding of the frame, 0 for singletons,
+            * ext (list of str): File extension, empty for singletons, and
+            * singleton (array of int): 1 for singletons, 0 for sequence
+              members.
+
+            Frames too large to be stored in a 64-bit integer are flagged as
+            singletons.
+
+        Examples:
+            >>> from seqparse.regex import SeqparseRegexMixin
+            >>> parsed = SeqparseRegexMixin().parse_many(
+            ...     ["a/kitty.0001.exr", "a/kitty.0002.exr", "b/pony.jpg"])
+            >>> parsed.dirs
+            ['a', 'b']
+            >>> list(parsed.frame), list(parsed.singleton)
+            ([1, 2, -1], [0, 0, 1])
+            >>> parsed.sep
+            ['.', '.', '']
+        """
+        dirs = []
+        dir_lookup = {}
+
+        output = ParsedNames(dirs=dirs,
+                             dir_index=array("l"),
+                             name=[],
+                             sep=[],
+                             frame=array("q"),
+                             pad=array("l"),
+                             ext=[],
+                             singleton=array("b"))
+
+        file_match = self._match_file_name
+        frame_sep = None if self._is_default_grammar else self.frame_sep
+        split = os.path.split
+
+        for val in names:
+            bits = file_match(val)
+            if bits:
+                base_name, frame, ext = bits
+                frame_num = int(frame)
+                if frame_num >= 2**63:
+                    bits = None
+
+            if bits:
+                sep = frame_sep(val, bits) if frame_sep else "."
+                # File names like "0001.exr" don't have a base name at all.
+                dir_name, base_name = split(base_name or "")
+                pad = len(frame)
+            else:
+                dir_name, base_name = split(val)
+                sep, frame_num, pad, ext = "", -1, 0, ""
+
+            dir_idx = dir_lookup.get(dir_name)
+            if dir_idx is None:
+                dir_idx = dir_lookup[dir_name] = len(dirs)
+                dirs.append(dir_name)
+
+            output.dir_index.append(dir_idx)
+            output.name.append(base_name)
+            output.sep.append(sep)
+            output.frame.append(frame_num)
+            output.pad.append(pad)
+            output.ext.append(ext)
+            output.singleton.append(int(bits is None))
+
+        return output
+
+    def _match_file_name(self, val):
+        """
+        Split a file name into (base name, frame, extension).
+
+        Args:
+            val (str): Input file name.
+
+        Returns:
+            None if input is an invalid sequence file name, tuple otherwise.
+        """
+        return self._split_file(val)
+
+    def _match_file_seq(self, val):
+        """
+        Split a file sequence into (base name, frames, extension).
+
+        Args:
+            val (str): Input file sequence.
+
+        Returns:
+            None if input is an invalid file sequence, tuple otherwise.
+        """
+        return self._split_seq(val)
+
     def is_frame_sequence(self, val):
         """
         Whether a string frame sequence is valid.
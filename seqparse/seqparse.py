@@ -1,16 +1,31 @@
 """The main engine for the seqparse module."""
 
-from collections import defaultdict
+import asyncio
+from collections import defaultdict, deque, namedtuple
+from itertools import groupby
+from concurrent.futures import (as_completed, FIRST_COMPLETED,
+                                ProcessPoolExecutor, ThreadPoolExecutor, wait)
 import os
 
 import six
 
 from .containers import FileSequenceContainer, SingletonContainer
-from .regex import SeqparseRegexMixin
-from .sequences import FrameSequence
+from .paths import PathTrie
+from .regex import compile_name_patterns, SeqparseRegexMixin
+from .sequences import _get_parsed_frames, FrameSequence
 
 __all__ = ("Seqparse",)
 
+# Disk state of a scanned directory, used by Seqparse.rescan to skip
+# directories that haven't changed since they were last scanned.
+ScanRecord = namedtuple(
+    "ScanRecord",
+    ("mtime_ns", "inode", "level", "max_levels", "min_levels", "subdirs"))
+
+# Snapshot of the contents of a Seqparse instance (see Seqparse.stats).
+ScanStats = namedtuple(
+    "ScanStats", ("locations", "sequences", "singletons", "frames", "size"))
+
 ###############################################################################
 # Class: Seqparse
 
@@ -51,27 +66,61 @@ class Seqparse(SeqparseRegexMixin):
         ...     print str(item)
         ...
         test_dir/TEST_DIR.0005-0009.tif
+
+    Args:
+        grammars (iterable of NamingGrammar, optional): File naming
+            conventions recognised by the instance (see set_grammars).
+            Defaults to the "name.####.ext" convention.
     """
 
-    def __init__(self):
+    def __init__(self, grammars=None):
         """Initialise the instance."""
         super().__init__()
 
-        self._locs = defaultdict(
+        if grammars:
+            self.set_grammars(grammars)
+
+        # Directories are stored in a trie of path segments, which is shared
+        # with the containers for each directory.
+        self._locs = PathTrie(
             lambda: dict(seqs=defaultdict(FileSequenceContainer),
                          files=SingletonContainer()))
 
-        self._options = dict(all=False, stat=False)
+        self._options = dict(all=False,
+                             exclude=(),
+                             follow_symlinks=True,
+                             incremental=False,
+                             include=(),
+                             include_dirs=(),
+                             stat=False)
 
-    def __repr__(self):  # pragma: no cover
-        """Pretty representation of the instance."""
-        num_seqs = len(list(self.output(seqs_only=True)))
-        num_files = len(list(self.output())) - num_seqs
+        # Live counters for the stats property, updated as files are added
+        # and directories are dropped.
+        self._counts = dict(sequences=0, singletons=0, frames=0, size=0)
+
+        # Sorted file sequence containers, cached per directory for output
+        # (see the _output_location method).
+        self._output_order = {}
+
+        # Incremental scan records (see the rescan method).
+        self._dir_stats = {}
+        self._roots = {}
+        self._scanned = {}
 
-        blurb = ("{name}(sequences={seqs}, singletons={files})")
-        return blurb.format(name=type(self).__name__,
-                            files=num_files,
-                            seqs=num_seqs)
+    def __repr__(self):
+        """Pretty representation of the instance."""
+        stats = self.stats
+        blurb = ("{name}(locations={stats.locations}, "
+                 "sequences={stats.sequences}, "
+                 "singletons={stats.singletons}, frames={stats.frames})")
+        return blurb.format(name=type(self).__name__, stats=stats)
+
+    def __ior__(self, other):
+        """Merge the contents of another instance into this one (via |=)."""
+        if not isinstance(other, Seqparse):
+            return NotImplemented
+        self.merge(other)
+        return self
 
     @property
     def locations(self):
@@ -80,9 +129,41 @@ class Seqparse(SeqparseRegexMixin):
 
     @property
     def scan_options(self):
-        """A dictionary of options used while scanning disk for files."""
+        """
+        dict: Options used while scanning disk for files.
+
+        * all (bool): Whether to include files and directories whose names
+          start with ".".
+        * exclude (iterable of str): Name patterns of files and directories
+          to skip (see seqparse.regex.compile_name_patterns for the syntax).
+          Excluded directories aren't descended into.
+        * follow_symlinks (bool): Whether to follow symlinks. If disabled,
+          symlinked directories aren't scanned, and symlinks are added as files
+          using their own (lstat) disk stats, which saves a stat per symlink.
+        * incremental (bool): Whether to record scanned directories for
+          rescans (see the rescan method).
+        * include (iterable of str): Name patterns of the files to keep, as
+          per exclude. Defaults to all files.
+        * include_dirs (iterable of str): Name patterns of the directories
+          whose files to keep, as per exclude. Files are only kept if their
+          directory (or any of its parents) matches, eg ["render"] keeps the
+          files anywhere below "render" directories. Every directory is still
+          descended into. Defaults to all directories.
+        * stat (bool or str): Whether to cache disk stats for files: True
+          (all files), "sequences" (only file sequence members -- singletons
+          aren't stat'd) or False.
+        """
         return self._options
 
+    @property
+    def scan_roots(self):
+        """
+        A dictionary of scanned directories.
+
+        Values are (max_levels, min_levels) tuples, as supplied to scan_path.
+        """
+        return self._roots
+
     @property
     def sequences(self):
         """A dictionary of tracked file sequences."""
@@ -93,13 +174,39 @@ class Seqparse(SeqparseRegexMixin):
         """A dictionary of tracked singleton files."""
         return self._get_data("files")
 
-    def add_file(self, file_name):
+    @property
+    def stats(self):
+        """
+        ScanStats: Counts of the contents of the instance.
+
+        * locations (int): Tracked directories.
+        * sequences (int): File sequences, per zero-padding (ie, after
+          zero-padding consolidation).
+        * singletons (int): Singleton files.
+        * frames (int): Frames, across all file sequences.
+        * size (int): Total size in bytes of all files with cached disk stats.
+
+        The counters are updated as files are added to (or directories are
+        dropped from) the instance, so fetching them is cheap no matter how
+        many files have been found. Changes made directly to the containers
+        of the instance aren't counted.
+        """
+        counts = self._counts
+        return ScanStats(len(self._locs), counts["sequences"],
+                         counts["singletons"], counts["frames"],
+                         counts["size"])
+
+    def add_file(self, file_name, stat=None):
         """
         Add a file to the parser instance.
 
         Args:
             file_name (str): The name of the file you'd like to add to the
                 parser.
+            stat (stat_result, optional): Disk stats of the file, cached in
+                place of stat'ing it (as per the "stat" scan option). Ignored
+                for files named after a frame range, whose stats don't belong
+                to any one frame. Defaults to None.
 
         Returns:
             None
@@ -114,13 +221,20 @@ class Seqparse(SeqparseRegexMixin):
         if sequence_bits:
             dir_name, base_name = os.path.split(sequence_bits.name)
 
-            loc = self.locations[dir_name]
-            sequence = loc["seqs"][base_name]
+            # Sequences that use a non-default naming grammar are indexed by
+            # (base name, separator) so they can't collide with "name.####.ext"
+            # sequences of the same base name.
+            sep = self.frame_sep(str(file_name), sequence_bits)
+            seq_key = base_name if sep == "." else (base_name, sep)
+
+            dir_node = self._locs.get_node(dir_name)
+            sequence = self._locs[dir_node]["seqs"][seq_key]
 
-            # Set the name and path properties at initialization.
+            # Set the name, path and separator properties at initialization.
             if not sequence:
                 sequence.name = base_name
-                sequence.path = dir_name
+                sequence.path = dir_node
+                sequence.sep = sep
 
             # We'll assume that a frame sequence is properly formed -- and use
             # the length of the first frame as the padding. The FrameSequence
@@ -130,46 +244,214 @@ class Seqparse(SeqparseRegexMixin):
                 pad = len(bits["first"])
                 break
 
+            # Single, unpadded frames may be added to a file sequence with a
+            # smaller zero-padding.
             ext = sequence[sequence_bits.ext]
-            ext[pad].add(sequence_bits.frames)
-
-            if self.scan_options["stat"]:
-                # "entry" *should* only ever be defined if it was passed in via
-                # the scan_path method.
-                if entry:
-                    stat = entry.stat(follow_symlinks=True)
-                else:
-                    stat = os.stat(file_name)
-                ext[pad].cache_stat(int(sequence_bits.frames), stat)
+            num_pads = len(ext)
+            fseq = ext.get_sequence(
+                pad,
+                padded=not sequence_bits.frames.isdigit()
+                or sequence_bits.frames.startswith("0"))
+            is_new = len(ext) != num_pads
+            if is_new:
+                self._counts["sequences"] += 1
+
+            num_frames = len(fseq)
+            fseq.add(sequence_bits.frames)
+            self._counts["frames"] += len(fseq) - num_frames
+
+            if sequence_bits.frames.isdigit():
+                if stat is None and self.scan_options["stat"]:
+                    # "entry" *should* only ever be defined if it was passed in
+                    # via the scan_path method.
+                    stat = _get_file_stat(entry or file_name,
+                                          self.scan_options["follow_symlinks"])
+                if stat is not None:
+                    self._cache_stat(fseq, int(sequence_bits.frames), stat)
+
+            if is_new:
+                self._consolidate([ext])
 
         else:
             dir_name, base_name = os.path.split(file_name)
-            loc = self.locations[dir_name]
+            dir_node = self._locs.get_node(dir_name)
 
-            singletons = loc["files"]
+            singletons = self._locs[dir_node]["files"]
 
             # Set the path properties at initialization.
             if not singletons:
-                singletons.path = dir_name
+                singletons.path = dir_node
 
+            num_files = len(singletons)
             singletons.add(base_name)
-            if self.scan_options["stat"]:
-                if entry:
-                    stat = entry.stat(follow_symlinks=True)
-                else:
-                    stat = os.stat(file_name)
-                singletons.cache_stat(base_name, stat)
+            self._counts["singletons"] += len(singletons) - num_files
+
+            if stat is None and self.scan_options["stat"] not in (
+                    False, "sequences"):
+                stat = _get_file_stat(entry or file_name,
+                                      self.scan_options["follow_symlinks"])
+            if stat is not None:
+                self._cache_stat(singletons, base_name, stat)
+
+    def add_files(self, file_names, batch_size=100000):
+        """
+        Add many files to the parser instance.
+
+        Paths are gathered in batches and grouped by directory, so that each
+        directory is looked up once per batch. The disk is not accessed
+        unless the "stat" scan option has been enabled.
+
+        Args:
+            file_names (iterable of str): The names of the files you'd like to
+                add to the parser.
+            batch_size (int, optional): Maximum number of paths held in memory
+                at once. Defaults to 100000.
+
+        Returns:
+            None
+        """
+        self._add_batches(((str(x), None) for x in file_names), batch_size)
+
+    def load_manifest(self,
+                      manifest,
+                      columns=None,
+                      sep=None,
+                      batch_size=100000):
+        """
+        Add the files (and disk stats) listed in a stat manifest.
+
+        Manifests are read line by line and ingested in batches, as per
+        add_files; their stats are cached by the file sequences and
+        singletons in place of stat'ing the files. The disk is never accessed
+        (other than to read the manifest itself).
+
+        Args:
+            manifest (str or iterable of str): Path to the manifest file ("-"
+                for stdin), or an iterable of its lines.
+            columns (tuple of str, optional): Names of the columns of each
+                line; see seqparse.manifest.read_manifest. Defaults to None
+                ("find -printf '%s %T@ %C@ %p\\n'" output).
+            sep (str, optional): The column separator. Defaults to None (runs
+                of whitespace).
+            batch_size (int, optional): Maximum number of files held in
+                memory at once. Defaults to 100000.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If the column layout is invalid, or a line can't be
+                parsed.
+        """
+        # pylint: disable=C0415
+        from .manifest import FIND_COLUMNS, read_manifest
+
+        files = read_manifest(manifest, columns or FIND_COLUMNS, sep)
+        self._add_batches(files, batch_size)
+
+    def load_index(self, index_path, validate=True):
+        """
+        Add the contents of an index file (see save_index) to the instance.
+
+        Args:
+            index_path (str): Location of the index file on disk.
+            validate (bool, optional): Whether to bring the loaded contents up
+                to date with the disk (via the rescan method). Defaults to
+                True.
+
+        Returns:
+            set of str directories that have changed on disk since the index
+            was saved (always empty if validate == False).
+
+        Raises:
+            ValueError: If the file is not a valid index, or if it was written
+                by an instance with different naming grammars.
+        """
+        from .index import load_index  # pylint: disable=C0415
+
+        load_index(self, index_path)
+        if validate:
+            return self.rescan()
+        return set()
 
-    def output(self, missing=False, seqs_only=False):
+    def merge(self, other):
+        """
+        Merge the singletons and file sequences of another instance.
+
+        Frames are merged per directory, file sequence, extension and zero-
+        padding -- and cached disk stats are carried over -- without re-parsing
+        or re-stat'ing any files. Scan roots and incremental scan records are
+        carried over, too. The other instance is left untouched.
+
+        Args:
+            other (Seqparse): The instance you'd like to merge into this one.
+
+        Returns:
+            None
+        """
+        if not isinstance(other, Seqparse):
+            blurb = "Can only merge Seqparse instances ({!r} provided)"
+            raise TypeError(blurb.format(type(other).__name__))
+        if other is self:
+            return
+
+        for dir_name, data in six.iteritems(other.locations):
+            if not (data["seqs"] or data["files"]):
+                continue
+
+            dir_node = self._locs.get_node(dir_name)
+            loc = self._locs[dir_node]
+            self._count_location(loc, -1)
+
+            for seq_key, other_container in six.iteritems(data["seqs"]):
+                container = loc["seqs"][seq_key]
+                if not container:
+                    container.name = other_container.name
+                    container.path = dir_node
+                    container.sep = other_container.sep
+
+                for ext, other_fext in six.iteritems(other_container):
+                    fext = container[ext]
+                    for pad, other_fseq in six.iteritems(other_fext):
+                        stats = other_fseq.stat()
+                        groups = _split_by_pad(
+                            pad, other_fseq._data)  # pylint: disable=W0212
+                        for frames_pad, frames in groups:
+                            fseq = fext[frames_pad]
+                            fseq._add_frames(frames)  # pylint: disable=W0212
+                            fseq.stat().update(
+                                x for x in six.iteritems(stats)
+                                if x[0] in frames)
+                    fext.consolidate()
+
+            singletons = loc["files"]
+            if not singletons:
+                singletons.path = dir_node
+            singletons.update(data["files"])
+            singletons.stat().update(data["files"].stat())
+            self._count_location(loc)
+
+        self._roots.update(other.scan_roots)
+        self._scanned.update(other._scanned)  # pylint: disable=W0212
+
+    def output(self, missing=False, seqs_only=False, root_dirs=None):
         """
         Yield a list of contained singletons and file sequences.
 
+        File sequences are consolidated as files are added, so output doesn't
+        modify the contents of the instance (although frames are calculated
+        and cached as they're first yielded): several threads may output an
+        instance at once, provided none of them are adding files to it.
+
         Args:
             missing (bool, optional): Whether to yield "inverted" file
                 sequences (ie, the missing files). Defaults to False. NOTE:
                 Using this option implies that seqs_only == True.
             seqs_only (bool, optional): Whether to only yield file sequences
                 (if any). Defaults to False.
+            root_dirs (iterable of str, optional): Only yield the contents of
+                the specified directories. Defaults to None (yield the
+                contents of all directories).
 
         Yields:
             File and/or FileSequence instances, depending on input arguments.
@@ -177,22 +459,194 @@ class Seqparse(SeqparseRegexMixin):
         if missing:
             seqs_only = True
 
-        for root_dir in sorted(self.locations):
-            data = self.locations[root_dir]
-            for container in sorted(data["seqs"].values()):
-                for file_seq in container.output():
-                    if missing:
-                        yield file_seq.invert()
-                    else:
-                        yield file_seq
+        # The sorted order of the directories and their contents is cached
+        # until files are added to (or directories dropped from) the
+        # instance, so repeated calls only need to iterate.
+        if root_dirs is None:
+            root_dirs = self.locations.sorted_nodes()
+        else:
+            root_dirs = sorted(root_dirs)
+
+        for root_dir in root_dirs:
+            for item in self._output_location(root_dir, missing, seqs_only):
+                yield item
+
+    def iter_scan(self,
+                  search_paths,
+                  max_levels=-1,
+                  min_levels=-1,
+                  missing=False,
+                  seqs_only=False):
+        """
+        Scan supplied path, yielding the contents of each directory in turn.
+
+        The singletons and file sequences of each directory are yielded as
+        soon as that directory has been listed, then discarded: only a single
+        directory's worth of files is held in memory at any one time, and the
+        instance itself is left untouched. Directories are scanned depth-first,
+        in alphabetical order.
+
+        Args:
+            search_paths (str): The location(s) on disk you'd like to scan for
+                file sequences and singletons.
+            max_levels (int, optional): Descend at most the specified number (a
+                non- negative integer) of directories below the starting point.
+                max_levels == 0 means only scan the starting-point itself.
+            min_levels (int, optional): Do not scan at levels less than
+                specified number (a non-negative integer). min_levels == 1
+                means scan all levels except the starting-point.
+            missing (bool, optional): Whether to yield "inverted" file
+                sequences (ie, the missing files). Defaults to False. NOTE:
+                Using this option implies that seqs_only == True.
+            seqs_only (bool, optional): Whether to only yield file sequences
+                (if any). Defaults to False.
+
+        Yields:
+            File and/or FileSequence instances, grouped by directory.
+        """
+        opts = dict(missing=missing, seqs_only=seqs_only)
+
+        if isinstance(search_paths, (list, set, tuple)):
+            for search_path in search_paths:
+                for item in self.iter_scan(search_path, **opts):
+                    yield item
+            return
+        if os.path.isfile(search_paths):
+            parser = self._get_scratch_parser()
+            parser.add_file(search_paths)
+            for item in parser.output(**opts):
+                yield item
+            return
+
+        search_path = search_paths.rstrip(os.path.sep)
+        walker = self._scandir_walk(search_path)
+
+        for root, dir_entries, file_entries, cur_level in walker:
+            # Listings aren't recorded for incremental rescans.
+            self._dir_stats.pop(root, None)
+
+            max_out = max_levels > -1 and cur_level == max_levels
+            min_out = min_levels > -1 and cur_level <= min_levels
+
+            if max_out:
+                del dir_entries[:]
+            else:
+                dir_entries.sort(key=lambda x: x.name)
 
-            if seqs_only:
+            if min_out or not file_entries:
                 continue
 
-            for file_name in sorted(data["files"].output()):
-                yield file_name
+            parser = self._get_scratch_parser()
+            parser._add_from_scan(file_entries)  # pylint: disable=W0212
+            for item in parser.output(**opts):
+                yield item
+
+    async def iter_scan_async(self,
+                              search_paths,
+                              max_levels=-1,
+                              min_levels=-1,
+                              concurrency=8,
+                              missing=False,
+                              seqs_only=False):
+        """
+        Scan supplied path without blocking the running event loop.
+
+        Directory listings (and, if requested via the "stat" scan option, file
+        stats) are run on the event loop's default executor, with at most
+        concurrency of them in flight at once. Discovered files are added to
+        the instance from the event loop itself, and the singletons and file
+        sequences of each directory are yielded as soon as that directory has
+        been scanned.
+
+        Args:
+            search_paths (str): The location(s) on disk you'd like to scan for
+                file sequences and singletons.
+            max_levels (int, optional): Descend at most the specified number (a
+                non- negative integer) of directories below the starting point.
+                max_levels == 0 means only scan the starting-point itself.
+            min_levels (int, optional): Do not scan at levels less than
+                specified number (a non-negative integer). min_levels == 1
+                means scan all levels except the starting-point.
+            concurrency (int, optional): Maximum number of directories listed
+                at once. Defaults to 8.
+            missing (bool, optional): Whether to yield "inverted" file
+                sequences (ie, the missing files). Defaults to False. NOTE:
+                Using this option implies that seqs_only == True.
+            seqs_only (bool, optional): Whether to only yield file sequences
+                (if any). Defaults to False.
+
+        Yields:
+            File and/or FileSequence instances, grouped by directory in the
+            order that directories finish scanning.
+        """
+        if missing:
+            seqs_only = True
+
+        scan = self._scan_async(search_paths,
+                                max_levels=max_levels,
+                                min_levels=min_levels,
+                                concurrency=concurrency)
+        async for root_dir in scan:
+            for item in self._output_location(root_dir, missing, seqs_only):
+                yield item
+
+    async def scan_path_async(self,
+                              search_paths,
+                              max_levels=-1,
+                              min_levels=-1,
+                              concurrency=8):
+        """
+        Scan supplied path without blocking the running event loop.
+
+        Args:
+            search_paths (str): The location(s) on disk you'd like to scan for
+                file sequences and singletons.
+            max_levels (int, optional): Descend at most the specified number (a
+                non- negative integer) of directories below the starting point.
+                max_levels == 0 means only scan the starting-point itself.
+            min_levels (int, optional): Do not scan at levels less than
+                specified number (a non-negative integer). min_levels == 1
+                means scan all levels except the starting-point.
+            concurrency (int, optional): Maximum number of directories listed
+                at once. Defaults to 8.
+
+        Returns:
+            None
+        """
+        scan = self._scan_async(search_paths,
+                                max_levels=max_levels,
+                                min_levels=min_levels,
+                                concurrency=concurrency)
+        async for _ in scan:
+            pass
+
+    def save_index(self, index_path):
+        """
+        Write the contents of the instance to an SQLite index file.
+
+        Indexes store singletons and file sequences along with any cached disk
+        stats, the naming grammars, scan options, scan roots and the
+        incremental scan records used to validate the index when it is loaded
+        (see the "incremental" scan option).
 
-    def scan_path(self, search_paths, max_levels=-1, min_levels=-1):
+        Args:
+            index_path (str): Location of the index file on disk. Any existing
+                file will be replaced.
+
+        Returns:
+            None
+        """
+        from .index import save_index  # pylint: disable=C0415
+
+        save_index(self, index_path)
+
+    def scan_path(self,
+                  search_paths,
+                  max_levels=-1,
+                  min_levels=-1,
+                  workers=None,
+                  breadth_first=False,
+                  processes=None):
         """
         Scan supplied path, add all discovered files to the instance.
 
@@ -205,35 +659,150 @@ class Seqparse(SeqparseRegexMixin):
             min_levels (int, optional): Do not scan at levels less than
                 specified number (a non-negative integer). min_levels == 1
                 means scan all levels except the starting-point.
+            workers (int, optional): Number of threads used to list
+                directories concurrently (discovered files are still added to
+                the instance from the calling thread). Useful on network
+                storage, where scan time is dominated by latency. Defaults to
+                None (scan serially).
+            breadth_first (bool, optional): Whether to scan directories in
+                breadth-first (rather than depth-first) order when scanning
+                serially. Defaults to False.
+            processes (int, optional): Number of worker processes across which
+                the top-level subdirectories of the search path are sharded.
+                Each process parses its files into a partial instance, the
+                results of which are merged into this instance. Defaults to
+                None (parse all files in the calling process).
 
         Returns:
             None
         """
         if isinstance(search_paths, (list, set, tuple)):
             for search_path in search_paths:
-                self.scan_path(search_path, max_levels=-1, min_levels=-1)
+                self.scan_path(search_path,
+                               max_levels=-1,
+                               min_levels=-1,
+                               workers=workers,
+                               breadth_first=breadth_first,
+                               processes=processes)
             return
         if os.path.isfile(search_paths):
             self.add_file(search_paths)
             return
 
         search_path = search_paths.rstrip(os.path.sep)
-        search_seps = search_paths.count(os.path.sep)
+        self._roots[search_path] = (max_levels, min_levels)
 
-        for root, dir_entries, file_entries in self._scandir_walk(search_path):
-            # Cheap and easy way to limit our search depth: count path
-            # separators!
-            cur_level = root.count(os.path.sep) - search_seps
+        if processes and processes > 1:
+            self._scan_path_processes(search_path, max_levels, min_levels,
+                                      processes, workers)
+            return
 
-            max_out = max_levels > -1 and cur_level == max_levels
-            min_out = min_levels > -1 and cur_level <= min_levels
+        self._scan_tree(search_path,
+                        max_levels=max_levels,
+                        min_levels=min_levels,
+                        workers=workers,
+                        breadth_first=breadth_first)
 
-            if max_out:
-                del dir_entries[:]
-            if min_out:
-                del file_entries[:]
+    def rescan(self):
+        """
+        Update the instance with changes made on disk since it was scanned.
 
-            self._add_from_scan(file_entries)
+        Only available for locations scanned with the "incremental" scan
+        option enabled. Each scanned directory is stat'ed: directories whose
+        modification time (or inode) has changed are listed again, new
+        subdirectories are scanned and directories that no longer exist are
+        dropped. Unchanged directories are not listed at all.
+
+        NOTE: A directory's modification time only changes when files are
+        added to, removed from or renamed within it -- not when the contents
+        of its files change.
+
+        Returns:
+            set of str directories that have been re-listed, added or removed.
+        """
+        return self._rescan_dirs(self._scanned)
+
+    def _rescan_dirs(self, dir_names, force=False):
+        """
+        Update the specified scanned directories with changes made on disk.
+
+        Args:
+            dir_names (iterable of str): The (previously scanned) directories
+                that you'd like to update. Unknown directories are ignored.
+            force (bool, optional): Whether to re-list the directories even if
+                their modification times haven't changed. Defaults to False.
+
+        Returns:
+            set of str directories that have been re-listed, added or removed.
+        """
+        changed = set()
+
+        # Sorting guarantees that parents are visited before their children.
+        for dir_name in sorted(dir_names):
+            record = self._scanned.get(dir_name)
+            if record is None:
+                # Dropped along with a (removed or changed) parent.
+                continue
+
+            try:
+                dir_stat = os.stat(dir_name)
+            except OSError:
+                changed.update(self._forget_dir(dir_name))
+                continue
+
+            if (not force and dir_stat.st_mtime_ns == record.mtime_ns
+                    and dir_stat.st_ino == record.inode):
+                continue
+
+            # Drop the directory's files (but not its subdirectories, which
+            # are checked separately), then scan it and any new
+            # subdirectories.
+            self._drop_location(dir_name)
+            try:
+                changed.update(
+                    self._scan_tree(dir_name,
+                                    max_levels=record.max_levels,
+                                    min_levels=record.min_levels,
+                                    level=record.level,
+                                    skip_scanned=True))
+            except OSError:
+                changed.update(self._forget_dir(dir_name))
+                continue
+
+            subdirs = set(self._scanned[dir_name].subdirs)
+            for subdir in record.subdirs:
+                if subdir not in subdirs:
+                    changed.update(self._forget_dir(subdir))
+
+        return changed
+
+    def _add_batches(self, files, batch_size):
+        """
+        Add files from any number of directories, in batches.
+
+        Args:
+            files (iterable): (str path, stat_result or None) tuples.
+            batch_size (int): Maximum number of files held in memory at once.
+
+        Returns:
+            None
+        """
+        batch = defaultdict(list)
+        num_files = 0
+
+        for file_name, stat in files:
+            dir_name, base_name = os.path.split(file_name)
+            batch[dir_name].append((base_name, file_name, stat))
+
+            num_files += 1
+            if num_files >= batch_size:
+                for dir_name, dir_files in six.iteritems(batch):
+                    self._add_to_directory(dir_name, dir_files)
+                batch.clear()
+                num_files = 0
+
+        for dir_name, dir_files in six.iteritems(batch):
+            self._add_to_directory(dir_name, dir_files)
 
     def _add_from_scan(self, file_entries):
         """
@@ -247,8 +816,400 @@ class Seqparse(SeqparseRegexMixin):
         Returns:
             None
         """
-        for file_entry in file_entries:
-            self.add_file(file_entry)
+        # Entries are (almost always) grouped by directory: comparing path
+        # prefixes is a cheap way to find each group.
+        groups = groupby(file_entries,
+                         key=lambda x: x.path[:len(x.path) - len(x.name)])
+        for dir_prefix, entries in groups:
+            self._add_to_directory(os.path.dirname(dir_prefix),
+                                   ((x.name, x, None) for x in entries))
+
+    def _add_to_directory(self, dir_name, files):
+        """
+        Add files from a single directory to the instance.
+
+        Each file's base name is parsed exactly once; single frames are then
+        inserted straight into their (integer) frame sequences, in one batch
+        per sequence. Anything else (ie, a file literally named after a frame
+        range) falls back to add_file.
+
+        Args:
+            dir_name (str): The directory containing the files.
+            files (iterable): (base name, file, stat) tuples, where each file
+                is either a scandir-style DirEntry instance or the str path to
+                the file. Supplied stat_result instances are always cached;
+                otherwise (None) files are only stat'd if the "stat" scan
+                option has been enabled.
+
+        Returns:
+            None
+        """
+        follow_symlinks = self.scan_options["follow_symlinks"]
+        stat_seqs = bool(self.scan_options["stat"])
+        stat_files = stat_seqs and self.scan_options["stat"] != "sequences"
+        is_default_grammar = self._is_default_grammar
+
+        dir_node = self._locs.get_node(dir_name)
+        loc = self._locs[dir_node]
+        num_files = len(loc["files"])
+        fseqs, pending, added = {}, {}, []
+        for base_name, file_entry, stat in files:
+            # Matching against a (minimal) path keeps the results identical to
+            # those of add_file, without the cost of parsing the directory.
+            file_name = os.sep + base_name
+            bits = self._match_file_seq(file_name)
+
+            if bits is None:
+                singletons = loc["files"]
+                if not singletons:
+                    singletons.path = dir_node
+                singletons.add(base_name)
+                if stat is None and stat_files:
+                    stat = _get_file_stat(file_entry, follow_symlinks)
+                if stat is not None:
+                    self._cache_stat(singletons, base_name, stat)
+                continue
+
+            name, frames, ext = bits
+            if not frames.isdigit():
+                self.add_file(file_entry, stat=stat)
+                continue
+
+            sep = "."
+            if not is_default_grammar:
+                sep = self.frame_sep(file_name, bits)
+
+            fseq_key = (name, sep, ext, len(frames), frames[0] == "0")
+            fseq = fseqs.get(fseq_key)
+            if fseq is None:
+                seq_name = name[1:]
+                seq_key = seq_name if sep == "." else (seq_name, sep)
+
+                sequence = loc["seqs"][seq_key]
+                if not sequence:
+                    sequence.name = seq_name
+                    sequence.path = dir_node
+                    sequence.sep = sep
+
+                fext = sequence[ext]
+                num_pads = len(fext)
+                fseq = fseqs[fseq_key] = fext.get_sequence(
+                    len(frames), padded=fseq_key[-1])
+                if len(fext) != num_pads:
+                    self._counts["sequences"] += 1
+                    added.append(fext)
+
+            frame = int(frames)
+            if id(fseq) not in pending:
+                pending[id(fseq)] = (fseq, [])
+            pending[id(fseq)][1].append(frame)
+
+            if stat is None and stat_seqs:
+                stat = _get_file_stat(file_entry, follow_symlinks)
+            if stat is not None:
+                self._cache_stat(fseq, frame, stat)
+
+        self._counts["singletons"] += len(loc["files"]) - num_files
+        self._add_frames_to_sequences(pending)
+        self._consolidate(added)
+
+    def _add_frames_to_sequences(self, pending):
+        """
+        Add batches of integer frames to their file sequences.
+
+        Args:
+            pending (dict): (FileSequence, list of int frames) tuples, indexed
+                by the id of the FileSequence instance to which the frames
+                should be added. Emptied once all frames have been added.
+
+        Returns:
+            None
+        """
+        num_frames = 0
+        for fseq, frames in six.itervalues(pending):
+            num_frames -= len(fseq)
+            fseq._add_frames(frames)  # pylint: disable=W0212
+            num_frames += len(fseq)
+        self._counts["frames"] += num_frames
+        pending.clear()
+
+    def _cache_stat(self, container, key, stat):
+        """
+        Cache the disk stats of a file, keeping track of the total size.
+
+        Args:
+            container (FileSequence or SingletonContainer): The container of
+                the file.
+            key (int or str): The frame (or base name) of the file.
+            stat (stat_result): The disk stats that you'd like to cache.
+
+        Returns:
+            None
+        """
+        self._counts["size"] += _stat_size(stat) - _stat_size(
+            container.stat(key))
+        container.cache_stat(key, stat)
+
+    async def _scan_async(self,
+                          search_paths,
+                          max_levels=-1,
+                          min_levels=-1,
+                          concurrency=8):
+        """
+        Scan supplied path(s), listing directories on the default executor.
+
+        Args:
+            search_paths (str): The location(s) on disk you'd like to scan for
+                file sequences and singletons.
+            max_levels (int, optional): Maximum depth to scan, as per
+                scan_path. Defaults to -1 (no limit).
+            min_levels (int, optional): Minimum depth to scan, as per
+                scan_path. Defaults to -1 (no limit).
+            concurrency (int, optional): Maximum number of directories listed
+                at once. Defaults to 8.
+
+        Yields:
+            Directories to which files have been added, as soon as all of
+            their files have been added to the instance.
+        """
+        loop = asyncio.get_running_loop()
+
+        if not isinstance(search_paths, (list, set, tuple)):
+            search_paths = [search_paths]
+        elif len(search_paths) > 1:
+            # Mirror scan_path: levels only apply to single search paths.
+            max_levels = min_levels = -1
+
+        pending = deque()
+        for search_path in search_paths:
+            is_file = await loop.run_in_executor(None, os.path.isfile,
+                                                 search_path)
+            if is_file:
+                self.add_file(search_path)
+                yield os.path.dirname(search_path)
+            else:
+                search_path = search_path.rstrip(os.path.sep)
+                self._roots[search_path] = (max_levels, min_levels)
+                pending.append((search_path, 0))
+
+        running = {}
+        try:
+            while pending or running:
+                while pending and len(running) < max(concurrency, 1):
+                    path, depth = pending.popleft()
+                    future = loop.run_in_executor(None, self._list_dir_stat,
+                                                  path)
+                    running[future] = depth
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED)
+
+                for future in done:
+                    cur_level = running.pop(future)
+                    root, dir_entries, file_entries = future.result()
+
+                    max_out = max_levels > -1 and cur_level == max_levels
+                    min_out = min_levels > -1 and cur_level <= min_levels
+
+                    if max_out:
+                        del dir_entries[:]
+
+                    self._record_scan(root, dir_entries, cur_level,
+                                      max_levels, min_levels)
+                    pending.extend(
+                        (x.path, cur_level + 1) for x in dir_entries)
+
+                    if min_out or not file_entries:
+                        continue
+
+                    self._add_from_scan(file_entries)
+                    yield root
+        finally:
+            for future in running:
+                future.cancel()
+
+    def _export_locations(self):
+        """
+        Export the raw contents of the instance in a compact, picklable form.
+
+        File sequences are exported per zero-padding, *before* any zero-padding
+        consolidation, with their frames compressed into runs of consecutive
+        frames. Disk stats are exported as tuples.
+
+        Returns:
+            list of (directory, list of file sequence records, list of
+            singleton records) tuples. File sequence records are (key, name,
+            separator, extension, pad, list of (first, last) frame runs,
+            list of (frame, stat tuple)); singleton records are (base name,
+            stat tuple or None).
+        """
+        output = []
+        for dir_name, data in six.iteritems(self.locations):
+            seqs = []
+            for seq_key, container in six.iteritems(data["seqs"]):
+                for ext, fext in six.iteritems(container):
+                    for pad, fseq in six.iteritems(fext):
+                        groups = _split_by_pad(
+                            pad, fseq._data)  # pylint: disable=W0212
+                        for frames_pad, frames in groups:
+                            stats = [(frame, tuple(stat)) for frame, stat in
+                                     six.iteritems(fseq.stat())
+                                     if frame in frames]
+                            seqs.append((seq_key, container.name,
+                                         container.sep, ext, frames_pad,
+                                         _frame_runs(frames), stats))
+
+            singletons = data["files"]
+            files = []
+            for base_name in singletons:
+                stat = singletons.stat(base_name)
+                files.append((base_name, tuple(stat) if stat else None))
+
+            output.append((dir_name, seqs, files))
+
+        return output
+
+    def _import_locations(self, locations):
+        """
+        Add the output of _export_locations to the instance.
+
+        Args:
+            locations (list): Output from the _export_locations method of
+                another instance.
+
+        Returns:
+            None
+        """
+        from . import get_stat_result  # pylint: disable=C0415
+
+        for dir_name, seqs, files in locations:
+            dir_node = self._locs.get_node(dir_name)
+            loc = self._locs[dir_node]
+            self._count_location(loc, -1)
+
+            for seq_key, name, sep, ext, pad, runs, stats in seqs:
+                container = loc["seqs"][seq_key]
+                if not container:
+                    container.name = name
+                    container.path = dir_node
+                    container.sep = sep
+
+                fseq = container[ext][pad]
+                for first, last in runs:
+                    fseq._add_frames(  # pylint: disable=W0212
+                        range(first, last + 1))
+                for frame, stat in stats:
+                    fseq.cache_stat(frame, get_stat_result(stat))
+
+            for container in six.itervalues(loc["seqs"]):
+                for fext in six.itervalues(container):
+                    fext.consolidate()
+
+            singletons = loc["files"]
+            if files and not singletons:
+                singletons.path = dir_node
+            for base_name, stat in files:
+                singletons.add(base_name)
+                if stat is not None:
+                    singletons.cache_stat(base_name, get_stat_result(stat))
+            self._count_location(loc)
+
+    def _consolidate(self, fexts):
+        """
+        Consolidate the zero-padding of newly added file sequences.
+
+        Args:
+            fexts (iterable of FileExtension): The containers to which file
+                sequences have been added.
+
+        Returns:
+            None
+        """
+        for fext in fexts:
+            self._counts["sequences"] -= fext.consolidate()
+
+    def _count_location(self, loc, sign=1):
+        """
+        Add (or subtract) the contents of a location to the stats counters.
+
+        Args:
+            loc (dict): The singletons and file sequences of a directory, as
+                stored in the locations property.
+            sign (int, optional): 1 to add the contents to the counters, -1
+                to subtract them. Defaults to 1.
+
+        Returns:
+            None
+        """
+        num_seqs = num_frames = size = 0
+        for container in six.itervalues(loc["seqs"]):
+            for fext in six.itervalues(container):
+                for fseq in six.itervalues(fext):
+                    num_seqs += 1
+                    num_frames += len(fseq)
+                    size += sum(map(_stat_size, six.itervalues(fseq.stat())))
+
+        singletons = loc["files"]
+        size += sum(map(_stat_size, six.itervalues(singletons.stat())))
+
+        counts = self._counts
+        counts["sequences"] += sign * num_seqs
+        counts["singletons"] += sign * len(singletons)
+        counts["frames"] += sign * num_frames
+        counts["size"] += sign * size
+
+    def _drop_location(self, dir_name):
+        """
+        Drop the singletons and file sequences of a directory.
+
+        Args:
+            dir_name (str): The directory whose contents you'd like to drop.
+
+        Returns:
+            None
+        """
+        dir_node = self._locs.get_node(dir_name, create=False)
+        if dir_node is None:
+            return
+
+        loc = self._locs.pop(dir_node, None)
+        if loc is not None:
+            self._count_location(loc, -1)
+            self._output_order.pop(dir_node, None)
+
+    def _forget_dir(self, dir_name):
+        """
+        Drop a scanned directory and all of its scanned subdirectories.
+
+        Args:
+            dir_name (str): The directory that you'd like to drop.
+
+        Returns:
+            set of str directories that have been dropped.
+        """
+        forgotten = set()
+        pending = [dir_name]
+        while pending:
+            dir_name = pending.pop()
+            forgotten.add(dir_name)
+            self._drop_location(dir_name)
+            record = self._scanned.pop(dir_name, None)
+            if record:
+                pending.extend(record.subdirs)
+
+        return forgotten
+
+    def _get_scratch_parser(self):
+        """
+        Create an empty instance with the same grammars and scan options as
+        this one.
+
+        Returns:
+            Seqparse instance.
+        """
+        parser = type(self)(grammars=self.grammars)
+        parser.scan_options.update(self.scan_options, incremental=False)
+        return parser
 
     def _get_data(self, typ):
         """
@@ -268,32 +1229,337 @@ class Seqparse(SeqparseRegexMixin):
 
         return output
 
-    def _scandir_walk(self, search_path, follow_symlinks=True):
+    def _list_dir(self, search_path, follow_symlinks=None):
         """
-        Recursively yield DirEntry objects for given directory.
+        List the directories and files contained by the given directory.
+
+        Entries are classified using the file types reported by the directory
+        listing wherever possible. Symlinks are only stat'd if they're being
+        followed; otherwise they're listed as files. Entries rejected by the
+        "all", "exclude", "include" and "include_dirs" scan options are
+        skipped as early as possible, before any files are parsed.
 
         Args:
             search_path (str): Directory to scan for files.
             follow_symlinks (bool, optional): Whether to follow symlinks
-                dicovered at scan time. Defaults to False.
+                discovered at scan time. Defaults to None (use the
+                "follow_symlinks" scan option).
 
-        Yields:
-            DirEntry representations of discovered files.
+        Returns:
+            tuple of (directory, DirEntry list of subdirectories, DirEntry list
+            of files).
         """
-        root, dir_entries, file_entries = search_path, [], []
+        if self.scan_options["incremental"]:
+            # Stat'ing *before* listing guarantees that changes made while
+            # listing will be picked up by the next rescan.
+            self._dir_stats[search_path] = os.stat(search_path)
+
+        if follow_symlinks is None:
+            follow_symlinks = self.scan_options["follow_symlinks"]
+
+        show_all = self.scan_options["all"]
+        exclude = compile_name_patterns(self.scan_options["exclude"])
+        include = compile_name_patterns(self.scan_options["include"])
+        include_dirs = compile_name_patterns(
+            self.scan_options["include_dirs"])
+
+        keep_files = not include_dirs or any(
+            include_dirs.match(x) for x in search_path.split(os.path.sep))
+
+        dir_entries, file_entries = [], []
         for entry in os.scandir(search_path):
-            if entry.name.startswith(".") and not self.scan_options["all"]:
+            name = entry.name
+            if name.startswith(".") and not show_all:
+                continue
+            if exclude and exclude.match(name):
                 continue
             if entry.is_dir(follow_symlinks=follow_symlinks):
                 dir_entries.append(entry)
+            elif not keep_files or (include and not include.match(name)):
+                continue
             elif entry.is_file(follow_symlinks=follow_symlinks):
                 file_entries.append(entry)
+            elif not follow_symlinks and entry.is_symlink():
+                file_entries.append(entry)
+
+        return search_path, dir_entries, file_entries
+
+    def _list_dir_stat(self, search_path, follow_symlinks=None):
+        """
+        List the given directory, stat'ing its files if required.
+
+        DirEntry instances cache their stat results, so files stat'ed here
+        (typically on a worker thread) won't be stat'ed again by add_file.
+
+        Args:
+            search_path (str): Directory to scan for files.
+            follow_symlinks (bool, optional): Whether to follow symlinks
+                discovered at scan time. Defaults to None (use the
+                "follow_symlinks" scan option).
 
-        yield root, dir_entries, file_entries
+        Returns:
+            tuple of (directory, DirEntry list of subdirectories, DirEntry list
+            of files).
+        """
+        listing = self._list_dir(search_path, follow_symlinks)
 
-        for entry in dir_entries:
-            for data in self._scandir_walk(entry.path):
-                yield data
+        stat = self.scan_options["stat"]
+        if stat:
+            follow_symlinks = self.scan_options["follow_symlinks"]
+            for entry in listing[2]:
+                if (stat == "sequences"
+                        and self._match_file_seq(os.sep + entry.name) is None):
+                    # Singletons aren't stat'd.
+                    continue
+                entry.stat(follow_symlinks=follow_symlinks)
+
+        return listing
+
+    def _output_location(self, root_dir, missing=False, seqs_only=False):
+        """
+        Yield the singletons and file sequences of the specified directory.
+
+        Args:
+            root_dir (str): The directory whose contents you'd like to yield.
+            missing (bool, optional): Whether to yield "inverted" file
+                sequences (ie, the missing files). Defaults to False.
+            seqs_only (bool, optional): Whether to only yield file sequences
+                (if any). Defaults to False.
+
+        Yields:
+            File and/or FileSequence instances, depending on input arguments.
+        """
+        locations = self.locations
+        dir_node = locations.get_node(root_dir, create=False)
+        data = None if dir_node is None else locations.get(dir_node)
+        if data is None:
+            return
+
+        # Containers are only sorted again once new ones have been added to
+        # the directory (containers are never removed from a directory that
+        # is still tracked: the whole directory is dropped instead).
+        seqs = data["seqs"]
+        order = self._output_order.get(dir_node)
+        if order is None or order[0] is not seqs or order[1] != len(seqs):
+            containers = sorted(seqs.values(), key=_get_container_key)
+            order = self._output_order[dir_node] = (seqs, len(seqs),
+                                                    containers)
+
+        for container in order[2]:
+            for file_seq in container.output():
+                if missing:
+                    yield file_seq.invert()
+                else:
+                    yield file_seq
+
+        if seqs_only:
+            return
+
+        for file_name in data["files"].output():
+            yield file_name
+
+    def _record_scan(self, root, dir_entries, level, max_levels, min_levels):
+        """
+        Record the disk state of a scanned directory for use by rescan.
+
+        Args:
+            root (str): The scanned directory.
+            dir_entries (list of DirEntry): The subdirectories to be scanned.
+            level (int): Depth of the directory below the search path.
+            max_levels (int): Maximum depth of the scan, as per scan_path.
+            min_levels (int): Minimum depth of the scan, as per scan_path.
+
+        Returns:
+            None
+        """
+        dir_stat = self._dir_stats.pop(root, None)
+        if dir_stat is None:
+            return
+
+        self._scanned[root] = ScanRecord(dir_stat.st_mtime_ns, dir_stat.st_ino,
+                                         level, max_levels, min_levels,
+                                         tuple(x.path for x in dir_entries))
+
+    def _scan_path_processes(self, search_path, max_levels, min_levels,
+                             processes, workers):
+        """
+        Scan supplied directory, sharding its subdirectories across processes.
+
+        Files at the top level of the search path are added by the calling
+        process; each top-level subdirectory is scanned by a worker process.
+
+        Args:
+            search_path (str): Directory to scan for files.
+            max_levels (int): Maximum depth to scan, as per scan_path.
+            min_levels (int): Minimum depth to scan, as per scan_path.
+            processes (int): Maximum number of worker processes.
+            workers (int): Number of threads used by each worker process to
+                list directories, as per scan_path.
+
+        Returns:
+            None
+        """
+        _, dir_entries, file_entries = self._list_dir(search_path)
+
+        # As per scan_path: the search path is at level zero.
+        if max_levels == 0:
+            del dir_entries[:]
+        if min_levels > -1:
+            del file_entries[:]
+
+        self._record_scan(search_path, dir_entries, 0, max_levels, min_levels)
+        self._add_from_scan(file_entries)
+
+        # Subdirectories are scanned one level down from the search path.
+        shard_args = (type(self), self.grammars, dict(self.scan_options),
+                      max_levels, min_levels, workers)
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            futures = [
+                executor.submit(_scan_shard, entry.path, *shard_args)
+                for entry in dir_entries
+            ]
+            for future in as_completed(futures):
+                locations, scanned = future.result()
+                self._import_locations(locations)
+                self._scanned.update(scanned)
+
+    def _scan_tree(self,
+                   search_path,
+                   max_levels=-1,
+                   min_levels=-1,
+                   level=0,
+                   workers=None,
+                   breadth_first=False,
+                   skip_scanned=False):
+        """
+        Scan supplied directory, add all discovered files to the instance.
+
+        Args:
+            search_path (str): Directory to scan for files.
+            max_levels (int, optional): Maximum depth to scan, as per
+                scan_path. Defaults to -1 (no limit).
+            min_levels (int, optional): Minimum depth to scan, as per
+                scan_path. Defaults to -1 (no limit).
+            level (int, optional): Depth of search_path below the starting
+                point of the scan. Defaults to 0.
+            workers (int, optional): Number of threads used to list
+                directories, as per scan_path. Defaults to None.
+            breadth_first (bool, optional): Whether to scan directories in
+                breadth-first order, as per scan_path. Defaults to False.
+            skip_scanned (bool, optional): Whether to skip subdirectories that
+                have already been (incrementally) scanned. Defaults to False.
+
+        Returns:
+            set of str directories that have been scanned.
+        """
+        walker = self._scandir_walk(search_path, breadth_first=breadth_first)
+        if workers and workers > 1:
+            walker = self._scandir_walk_threaded(search_path, workers)
+
+        scanned = set()
+        for root, dir_entries, file_entries, depth in walker:
+            cur_level = level + depth
+            max_out = max_levels > -1 and cur_level == max_levels
+            min_out = min_levels > -1 and cur_level <= min_levels
+
+            if max_out:
+                del dir_entries[:]
+            if min_out:
+                del file_entries[:]
+
+            self._record_scan(root, dir_entries, cur_level, max_levels,
+                              min_levels)
+            if skip_scanned:
+                dir_entries[:] = [
+                    x for x in dir_entries if x.path not in self._scanned
+                ]
+
+            self._add_from_scan(file_entries)
+            scanned.add(root)
+
+        return scanned
+
+    def _scandir_walk(self,
+                      search_path,
+                      follow_symlinks=None,
+                      breadth_first=False):
+        """
+        Yield DirEntry objects for given directory and all of its descendants.
+
+        The directory tree is traversed iteratively (no recursion), so the
+        cost per directory does not depend upon its depth. Subdirectories
+        removed from the yielded list of directory entries will not be
+        scanned.
+
+        Args:
+            search_path (str): Directory to scan for files.
+            follow_symlinks (bool, optional): Whether to follow symlinks
+                discovered at scan time. Defaults to None (use the
+                "follow_symlinks" scan option).
+            breadth_first (bool, optional): Whether to traverse the tree
+                breadth-first rather than depth-first. Defaults to False.
+
+        Yields:
+            tuple of (directory, DirEntry list of subdirectories, DirEntry list
+            of files, depth below search_path).
+        """
+        pending = deque([(search_path, 0)])
+        next_dir = pending.popleft if breadth_first else pending.pop
+
+        while pending:
+            path, depth = next_dir()
+            root, dir_entries, file_entries = self._list_dir(
+                path, follow_symlinks)
+
+            yield root, dir_entries, file_entries, depth
+
+            children = [(x.path, depth + 1) for x in dir_entries]
+            if not breadth_first:
+                # Depth-first traversal pops from the right: reverse the
+                # children so they're still scanned in listing order.
+                children.reverse()
+            pending.extend(children)
+
+    def _scandir_walk_threaded(self,
+                               search_path,
+                               workers,
+                               follow_symlinks=None):
+        """
+        Yield DirEntry objects for given directory, listed on a thread pool.
+
+        Directories are yielded in the order their listings complete. As with
+        _scandir_walk, subdirectories removed from the yielded list of
+        directory entries will not be scanned.
+
+        Args:
+            search_path (str): Directory to scan for files.
+            workers (int): Maximum number of directories to list concurrently.
+            follow_symlinks (bool, optional): Whether to follow symlinks
+                discovered at scan time. Defaults to None (use the
+                "follow_symlinks" scan option).
+
+        Yields:
+            tuple of (directory, DirEntry list of subdirectories, DirEntry list
+            of files, depth below search_path).
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = {
+                executor.submit(self._list_dir, search_path, follow_symlinks):
+                0
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    depth = pending.pop(future)
+                    root, dir_entries, file_entries = future.result()
+
+                    yield root, dir_entries, file_entries, depth
+
+                    for entry in dir_entries:
+                        child = executor.submit(self._list_dir, entry.path,
+                                                follow_symlinks)
+                        pending[child] = depth + 1
 
     @staticmethod
     def validate_frame_sequence(frame_seq):
@@ -318,9 +1584,142 @@ class Seqparse(SeqparseRegexMixin):
             >>> print parser.validate_frame_sequence("3,1,5,7")
             1-7x2
         """
+        if isinstance(frame_seq, six.string_types):
+            # Repeated frame sequences are served from the shared cache.
+            parsed = _get_parsed_frames(frame_seq)
+            return parsed.output if parsed else None
+
         try:
             seq = FrameSequence(frame_seq)
         except ValueError:
             return None
 
         return str(seq)
+
+
+###############################################################################
+# Helper functions
+
+
+def _get_file_stat(file_entry, follow_symlinks=True):
+    """
+    Stat a file, reusing any result cached by its DirEntry instance.
+
+    Args:
+        file_entry (DirEntry or str): The file to stat.
+        follow_symlinks (bool, optional): Whether to stat the targets of
+            symlinks rather than the links themselves. Defaults to True.
+
+    Returns:
+        os.stat_result instance.
+    """
+    if isinstance(file_entry, str):
+        return os.stat(file_entry, follow_symlinks=follow_symlinks)
+    return file_entry.stat(follow_symlinks=follow_symlinks)
+
+
+def _get_container_key(container):
+    """
+    Sort key for the file sequence containers of a single directory.
+
+    Args:
+        container (FileSequenceContainer): The container to sort.
+
+    Returns:
+        str base name of the container.
+    """
+    return container.name or ""
+
+
+def _stat_size(stat):
+    """
+    Size of a file, as per its (optional) disk stats.
+
+    Args:
+        stat (stat_result or None): The disk stats of the file.
+
+    Returns:
+        int size in bytes (0 if no disk stats were supplied).
+    """
+    return 0 if stat is None else stat.st_size
+
+
+def _frame_runs(frames):
+    """
+    Compress the supplied frames into runs of consecutive frames.
+
+    Args:
+        frames (iterable of int): Frames that you'd like to compress.
+
+    Returns:
+        list of (first, last) tuples, sorted by frame.
+    """
+    runs = []
+    for frame in sorted(frames):
+        if runs and frame == runs[-1][1] + 1:
+            runs[-1][1] = frame
+        else:
+            runs.append([frame, frame])
+
+    return [tuple(x) for x in runs]
+
+
+def _split_by_pad(pad, frames):
+    """
+    Split the frames of a file sequence by their original zero-padding.
+
+    Frames merged into a file sequence by zero-padding consolidation have
+    more digits than its zero-padding, which gives their original one away.
+
+    Args:
+        pad (int): Zero-padding of the file sequence.
+        frames (set of int): Frames of the file sequence.
+
+    Returns:
+        list of (int zero-padding, set of int frames) tuples.
+    """
+    if not frames or max(frames) < 10**pad:
+        return [(pad, frames)]
+
+    groups = {}
+    for frame in frames:
+        groups.setdefault(max(pad, len(str(frame))), set()).add(frame)
+    return sorted(groups.items())
+
+
+def _scan_shard(search_path,
+                parser_class,
+                grammars,
+                scan_options,
+                max_levels=-1,
+                min_levels=-1,
+                workers=None):
+    """
+    Scan supplied subdirectory into a new parser, for use by a worker process.
+
+    Args:
+        search_path (str): The subdirectory (one level below the starting
+            point of the scan) you'd like to scan.
+        parser_class (type): Seqparse (sub)class used to scan the location.
+        grammars (tuple of NamingGrammar): File naming grammars recognised by
+            the calling process.
+        scan_options (dict): Scan options of the calling instance.
+        max_levels (int, optional): Maximum depth to scan, as per scan_path.
+        min_levels (int, optional): Minimum depth to scan, as per scan_path.
+        workers (int, optional): Number of threads used to list directories,
+            as per scan_path.
+
+    Returns:
+        tuple of (list of location records, as per Seqparse._export_locations,
+        dict of incremental scan records, indexed by directory).
+    """
+    # pylint: disable=W0212
+    parser = parser_class(grammars=grammars)
+    parser.scan_options.update(scan_options)
+    parser._scan_tree(search_path,
+                      max_levels=max_levels,
+                      min_levels=min_levels,
+                      level=1,
+                      workers=workers)
+
+    return parser._export_locations(), parser._scanned
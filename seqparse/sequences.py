@@ -1,13 +1,25 @@
 """Sequence-related data structures utilized by the Seqparse module."""
 
+from collections import namedtuple
 from collections.abc import MutableSet
+from functools import lru_cache
 import os
 
 import six
 
+from .paths import PathNode
 from .regex import SeqparseRegexMixin
 
-__all__ = ("FileSequence", "FrameSequence", "SeqparsePadException")
+__all__ = ("FileSequence", "FrameSequence", "SeqparsePadException",
+           "frame_cache_info", "set_frame_cache_size")
+
+# Default number of parsed string frame sequences to keep in the shared cache.
+FRAME_CACHE_SIZE = 4096
+
+# ParsedFrames holds the canonical (fully calculated) representation of a
+# string frame sequence, as stored in the shared frame sequence cache.
+ParsedFrames = namedtuple("ParsedFrames",
+                          "pad frames chunks is_padded output")
 
 ###############################################################################
 # Class: SeqparsePadException
@@ -26,6 +38,110 @@ class SeqparsePadException(Exception):
         super().__init__(message)
 
 
+###############################################################################
+# Frame sequence cache
+
+
+def frame_cache_info():
+    """
+    Report usage statistics for the shared frame sequence cache.
+
+    Returns:
+        functools-style CacheInfo named tuple (hits, misses, maxsize,
+        currsize).
+    """
+    return _FRAME_CACHE.cache_info()
+
+
+def set_frame_cache_size(maxsize=FRAME_CACHE_SIZE):
+    """
+    Resize (and clear) the shared frame sequence cache.
+
+    String frame sequences parsed by FrameSequence, FileSequence and the
+    validate_frame_sequence methods are stored in a bounded LRU cache, so
+    repeated strings are only ever parsed once.
+
+    Args:
+        maxsize (int, optional): Maximum number of cached frame sequences. Use
+            0 to disable caching, None for an unbounded cache. Defaults to
+            FRAME_CACHE_SIZE.
+
+    Returns:
+        None
+    """
+    global _FRAME_CACHE  # pylint: disable=W0603
+    _FRAME_CACHE = lru_cache(maxsize=maxsize)(_parse_frame_sequence)
+
+
+def _get_parsed_frames(frame_seq):
+    """
+    Look up the canonical representation of a string frame sequence.
+
+    Args:
+        frame_seq (str): The frame sequence you'd like to parse.
+
+    Returns:
+        None if the frame sequence is invalid, ParsedFrames otherwise.
+    """
+    return _FRAME_CACHE(frame_seq)
+
+
+def _parse_frame_sequence(frame_seq):
+    """
+    Parse a string frame sequence into its canonical representation.
+
+    This is the uncached worker behind the shared frame sequence cache.
+
+    Args:
+        frame_seq (str): The frame sequence you'd like to parse.
+
+    Returns:
+        None if the frame sequence is invalid, ParsedFrames otherwise.
+
+    Raises:
+        SeqparsePadException: if the chunks of the sequence are padded
+            inconsistently.
+    """
+    # pylint: disable=W0212
+    if not _MATCHER.is_frame_sequence(frame_seq):
+        return None
+
+    frames = set()
+    pad = None
+    for bit in frame_seq.split(","):
+        if not bit:
+            continue
+
+        first, last, step = _MATCHER.bits_match(bit)
+        try:
+            chunk = FrameChunk(first, last, step, len(first))
+        except ValueError:
+            # Descending chunks (ie, "0010-0001") are invalid as well.
+            return None
+
+        if pad is None:
+            pad = chunk.pad
+        elif chunk.pad != pad:
+            blurb = ("Specified value ({!r}) is incorrectly padded ({:d} "
+                     "!= {:d})")
+            raise SeqparsePadException(blurb.format(chunk, chunk.pad, pad))
+
+        frames.update(range(chunk.first, chunk.last + 1, chunk.step))
+
+    seq = FrameSequence(pad=pad)
+    seq._data = frames
+    seq.calculate(force=True)
+
+    return ParsedFrames(pad=seq.pad,
+                        frames=frozenset(frames),
+                        chunks=tuple(seq._attrs["chunks"]),
+                        is_padded=seq._attrs["is_padded"],
+                        output=seq._output)
+
+
+_FRAME_CACHE = lru_cache(maxsize=FRAME_CACHE_SIZE)(_parse_frame_sequence)
+_MATCHER = SeqparseRegexMixin()
+
 ###############################################################################
 # Class: FrameChunk
 
@@ -245,10 +361,11 @@ class FrameSequence(MutableSet, SeqparseRegexMixin):
         self._output = None
 
         if isinstance(frames, six.string_types):
-            if not self.is_frame_sequence(frames):
+            parsed = _get_parsed_frames(frames)
+            if parsed is None:
                 blurb = "Invalid iterable specified ({}, {!r})"
                 raise ValueError(blurb.format(type(frames), frames))
-            self._add_frame_sequence(frames)
+            self._set_parsed_frames(parsed)
             return
 
         # NOTE: This could probably be made more efficient by copying a
@@ -313,7 +430,10 @@ class FrameSequence(MutableSet, SeqparseRegexMixin):
     @property
     def is_padded(self):
         """bool: Whether the FrameSequence contains any zero-padded frames."""
-        self.calculate()
+        if self.is_dirty:
+            # Cheaper than recalculating the output of the instance.
+            data = self._data
+            return bool(data) and min(data) < 10**(self.pad - 1)
         return self._attrs["is_padded"]
 
     @property
@@ -332,12 +452,9 @@ class FrameSequence(MutableSet, SeqparseRegexMixin):
     def add(self, value):
         """Defining value addition logic (per standard set)."""
         if isinstance(value, six.string_types):
-            if self.is_frame_sequence(value):
-                if not value.isdigit():
-                    self._add_frame_sequence(value)
-                    return
-            else:
-                raise ValueError(f'Invalid value specified ({value!r})')
+            if not value.isdigit():
+                self._add_frame_sequence(value)
+                return
 
             value_pad = len(value)
             if value.startswith("0") and value_pad != self.pad:
@@ -402,18 +519,19 @@ class FrameSequence(MutableSet, SeqparseRegexMixin):
         if not (self.is_dirty or force):
             return
 
-        self._attrs["is_padded"] = False
-        del self._attrs["chunks"][:]
-        self._output = ""
+        # Results are only stored once they've all been calculated, so other
+        # threads reading the instance never see a partial calculation.
+        chunks = []
 
         num_frames = len(self._data)
         if not num_frames:
+            self._output = ""
+            self._attrs.update(chunks=chunks, is_padded=False)
             return
 
         all_frames = sorted(self._data)
         if num_frames == 1:
-            self._attrs["chunks"].append(
-                FrameChunk(all_frames[0], pad=self.pad))
+            chunks.append(FrameChunk(all_frames[0], pad=self.pad))
 
         else:
             current_frames = set()
@@ -448,23 +566,23 @@ class FrameSequence(MutableSet, SeqparseRegexMixin):
                         current_frames = set([frames[1]])
                         prev_step = 0
 
-                    self._attrs["chunks"].append(chunk)
+                    chunks.append(chunk)
 
                 else:
                     current_frames.update(frames)
 
             if current_frames:
                 chunk = self._chunk_from_frames(current_frames, step, self.pad)
-                self._attrs["chunks"].append(chunk)
-
-        # This will be used by the parent FileExtension instance during the
-        # zero-pad consolidation stage of the output process.
-        self._attrs["is_padded"] = all_frames[0] < 10**(self.pad - 1)
+                chunks.append(chunk)
 
         # Optimize padding in cases similar to 1, 2, 1000.
-        self._output = ",".join(str(x) for x in self._attrs["chunks"])
+        self._output = ",".join(str(x) for x in chunks)
 
-        self._attrs["dirty"] = False
+        # is_padded is used by the parent FileExtension instance during the
+        # zero-pad consolidation of its file sequences.
+        self._attrs.update(chunks=chunks,
+                           dirty=False,
+                           is_padded=all_frames[0] < 10**(self.pad - 1))
 
     def invert(self):
         """
@@ -473,20 +591,15 @@ class FrameSequence(MutableSet, SeqparseRegexMixin):
         Returns:
             FrameSequence containing the missing frames (if any).
         """
-        self.calculate()
         inverted = FrameSequence(pad=self.pad)
-        num_chunks = len(self._attrs["chunks"])
 
-        if num_chunks == 1:
-            inverted.add(self._attrs["chunks"][0].invert())
-
-        elif num_chunks:
-            for idx in range(num_chunks - 1):
-                current_chunk = self._attrs["chunks"][idx]
-                next_chunk = self._attrs["chunks"][idx + 1]
-                inverted.add(current_chunk.invert(last=next_chunk.first - 1))
-
-            inverted.add(self._attrs["chunks"][-1].invert())
+        # The frames missing from each chunk (and the gaps between them) are
+        # simply the frames missing from the full range.
+        frames = self._data
+        if frames:
+            missing = set(range(min(frames), max(frames) + 1))
+            missing.difference_update(frames)
+            inverted._add_frames(missing)
 
         return inverted
 
@@ -504,6 +617,20 @@ class FrameSequence(MutableSet, SeqparseRegexMixin):
         for item in iterable:
             self.add(item)
 
+    def _add_frames(self, frames):
+        """
+        Add integer frames to the instance without per-frame validation.
+
+        Args:
+            frames (iterable of int): Frames that you'd like to add to the
+                instance.
+
+        Returns:
+            None
+        """
+        self._data.update(frames)
+        self._attrs["dirty"] = True
+
     def _add_frame_sequence(self, frame_seq):
         """
         Add a string frame sequence to the instance.
@@ -515,16 +642,39 @@ class FrameSequence(MutableSet, SeqparseRegexMixin):
         Returns:
             None
         """
-        for bit in frame_seq.split(","):
-            if not bit:
-                continue
+        parsed = _get_parsed_frames(frame_seq)
+        if parsed is None:
+            raise ValueError(f'Invalid value specified ({frame_seq!r})')
 
-            first, last, step = self.bits_match(bit)
-            pad = len(first)
-            if self.pad is None:
-                self.pad = pad
+        if parsed.pad != self.pad:
+            blurb = ("Specified value ({!r}) is incorrectly padded ({:d} "
+                     "!= {:d})")
+            raise SeqparsePadException(
+                blurb.format(frame_seq, parsed.pad, self.pad))
 
-            self.add(FrameChunk(first, last, step, pad))
+        self._data.update(parsed.frames)
+        self._attrs["dirty"] = True
+
+    def _set_parsed_frames(self, parsed):
+        """
+        Replace the contents of the instance with a parsed frame sequence.
+
+        The cached chunks and string output are re-used as-is, so no
+        recalculation is necessary.
+
+        Args:
+            parsed (ParsedFrames): Canonical frame sequence, as stored in the
+                shared frame sequence cache.
+
+        Returns:
+            None
+        """
+        self._data = set(parsed.frames)
+        self._output = parsed.output
+        self._attrs.update(chunks=list(parsed.chunks),
+                           dirty=False,
+                           is_padded=parsed.is_padded,
+                           pad=parsed.pad)
 
     @staticmethod
     def _chunk_from_frames(frames, step, pad):
@@ -572,24 +722,48 @@ class FileSequence(FrameSequence):  # pylint: disable=too-many-ancestors
             tuple of integer frames.
         ext (str, optional): File extension for the sequence.
         pad (int, optional): Frame padding for the sequence. Defaults to 1.
+        sep (str, optional): Separator between base name and frames.
+            Defaults to ".".
+        grammars (iterable of NamingGrammar, optional): File naming
+            conventions used to parse a file sequence supplied as the name
+            (ie, Seqparse.grammars). Defaults to the grammars of a cloned
+            instance, or the "name.####.ext" convention.
     """
 
-    def __init__(self, name=None, frames=None, ext=None, pad=1):
+    def __init__(self,
+                 name=None,
+                 frames=None,
+                 ext=None,
+                 pad=1,
+                 sep=".",
+                 grammars=None):
         """Initialise the instance."""
+        if grammars is None and isinstance(name, FileSequence):
+            grammars = name.grammars
+        if grammars and tuple(grammars) != self._grammars:
+            self.set_grammars(grammars)
+
         self._cache = {'ctime': None, 'mtime': None, 'size': None}
-        self._info = {'ext': None, 'full': None, 'name': None, 'path': None}
+        self._info = {
+            'ext': None,
+            'name': None,
+            'path': None,
+            'sep': "."
+        }
         self._stat = {}
 
         if name:
             if isinstance(name, six.string_types):
                 file_seq_bits = self.file_seq_match(name)
                 if file_seq_bits:
+                    sep = self.frame_sep(name, file_seq_bits)
                     name, frames, ext = file_seq_bits
                     pad = None
 
             elif isinstance(name, FileSequence):
-                name, frames, ext, pad = (name.full_name, name.pretty_frames,
-                                          name.ext, name.pad)
+                name, frames, ext, pad, sep = (name.full_name,
+                                               name.pretty_frames, name.ext,
+                                               name.pad, name.sep)
         if frames is None:
             frames = []
 
@@ -597,6 +771,7 @@ class FileSequence(FrameSequence):  # pylint: disable=too-many-ancestors
 
         self.ext = ext
         self.name = name
+        self.sep = sep
 
     def __contains__(self, item):
         """Defining containment logic (per standard set)."""
@@ -625,8 +800,9 @@ class FileSequence(FrameSequence):  # pylint: disable=too-many-ancestors
                  "frames=set({fr!r}))")
         return blurb.format(cls=type(self).__name__,
                             fr=sorted(self._data),
+                            full=self.full_name,
                             pad=self.pad,
-                            **self._info)
+                            ext=self.ext)
 
     def __str__(self):
         """String reprentation of the frame sequence."""
@@ -668,7 +844,7 @@ class FileSequence(FrameSequence):  # pylint: disable=too-many-ancestors
     @property
     def full_name(self):
         """str: Full name of the sequence, including containing directory."""
-        return self._info["full"]
+        return os.path.join(self.path or "", self._info["name"] or "")
 
     @property
     def mtime(self):
@@ -703,24 +879,36 @@ class FileSequence(FrameSequence):  # pylint: disable=too-many-ancestors
                 self.path = path_name
             self._info["name"] = val
 
-        self._info["full"] = os.path.join(self._info["path"] or "", val or "")
-
     @property
     def path(self):
         """
         str: Directory in which the contained files are located.
 
         Note: Setting the `name` property will reset the contained value.
+        PathNode instances may be used to set the directory, in which case it
+        is only built as a string when requested.
         """
-        return self._info["path"]
+        path = self._info["path"]
+        if isinstance(path, PathNode):
+            return os.path.normpath(path.path)
+        return path
 
     @path.setter
     def path(self, val):
         self._info["path"] = None
-        if val:
+        if isinstance(val, PathNode):
+            self._info["path"] = val or None
+        elif val:
             self._info["path"] = str(os.path.normpath(val))
 
-        self._info["full"] = os.path.join(val or "", self._info["name"] or "")
+    @property
+    def sep(self):
+        """str: Separator between the base name and frames of the files."""
+        return self._info["sep"]
+
+    @sep.setter
+    def sep(self, val):
+        self._info["sep"] = "." if val is None else str(val)
 
     @property
     def size(self):
@@ -740,7 +928,7 @@ class FileSequence(FrameSequence):  # pylint: disable=too-many-ancestors
     def update(self, iterable):
         """Defining item update logic (per standard set)."""
         if isinstance(iterable, FileSequence):
-            for attr in ("ext", "full_name"):
+            for attr in ("ext", "full_name", "sep"):
                 iterable_value = getattr(iterable, attr)
                 self_value = getattr(self, attr)
                 if iterable_value != self_value:
@@ -774,6 +962,9 @@ class FileSequence(FrameSequence):  # pylint: disable=too-many-ancestors
 
         frame = int(frame)
         self._stat[frame] = get_stat_result(input_stat)
+
+        # Aggregated disk stats will need to be recalculated.
+        self._attrs["dirty"] = True
         return self._stat[frame]
 
     def calculate(self, force=False):
@@ -793,11 +984,12 @@ class FileSequence(FrameSequence):  # pylint: disable=too-many-ancestors
         if not (self.is_dirty or force):
             return
 
-        super().calculate(force=force)
-
-        # Cache disk stats for easy/quick access via property ...
+        # Cache disk stats for easy/quick access via property (before the
+        # instance is marked as clean) ...
         self._aggregate_stats()
 
+        super().calculate(force=force)
+
     def invert(self):
         """
         Calculate file names missing from the sequence.
@@ -808,9 +1000,38 @@ class FileSequence(FrameSequence):  # pylint: disable=too-many-ancestors
         frames = super().invert()
         inverted = FileSequence(name=self.full_name,
                                 frames=frames,
-                                ext=self.ext)
+                                ext=self.ext,
+                                sep=self.sep)
         return inverted
 
+    def move_frames(self, target, first=None):
+        """
+        Move frames (and their cached disk stats) to another file sequence.
+
+        Frames are moved as integers, without per-frame validation, which is
+        how FileExtension merges file sequences of differing zero-padding.
+
+        Args:
+            target (FileSequence): The file sequence to which you'd like to
+                move the frames.
+            first (int, optional): The smallest frame you'd like to move.
+                Defaults to None (all frames).
+
+        Returns:
+            list of int frames that were moved.
+        """
+        frames = [x for x in self._data if first is None or x >= first]
+        stats = self._stat
+        for frame in frames:
+            if frame in stats:
+                target._stat[frame] = stats.pop(frame)
+
+        self._data.difference_update(frames)
+        self._attrs["dirty"] = True
+        target._add_frames(frames)
+
+        return frames
+
     def stat(self, frame=None, force=False, lazy=False):
         """
         Individual frame file system status.
@@ -848,15 +1069,13 @@ class FileSequence(FrameSequence):  # pylint: disable=too-many-ancestors
         """
         Aggregate stats for a variety of file sequence properties.
 
-        This method clears all cached aggregate values before recalculating
-        new values.
+        This method replaces all cached aggregate values with new values.
 
         Returns:
             None
         """
-        self._cache = {'ctime': None, 'mtime': None, 'size': None}
-
         if not self.stat():
+            self._cache = {'ctime': None, 'mtime': None, 'size': None}
             return
 
         # Disabling pylint here because the stat object will never be a
@@ -892,7 +1111,7 @@ class FileSequence(FrameSequence):  # pylint: disable=too-many-ancestors
 
         file_name = "{fr}.{ext}"
         if self.name:
-            file_name = "{name}.{fr}.{ext}"
+            file_name = "{name}{sep}{fr}.{ext}"
 
         file_name = file_name.format(fr=frames, **self._info)
         return os.path.join(self.path or "", file_name)
@@ -7,7 +7,7 @@ import six
 from .. import get_stat_result
 
 __all__ = ("DirEntry", "generate_entries", "initialise_mock_scandir_data",
-           "mock_os_stat", "mock_scandir_deep")
+           "mock_os_stat", "mock_scandir_deep", "SyscallDirEntry")
 
 MOCK_SCANDIR_DEEP_DATA = []
 
@@ -71,6 +71,69 @@ class DirEntry:
         return get_stat_result(MOCK_SCANDIR_STAT_DATA[self.name])
 
 
+class SyscallDirEntry:
+    """
+    Mocked DirEntry class that counts the system calls it would make.
+
+    Mirrors the caching behaviour of os.DirEntry: file types are read from the
+    directory listing (d_type) where available, and stat/lstat results are
+    cached per instance.
+    """
+
+    def __init__(self, file_path, kind="file", target=None, d_type=True):
+        """Initialise the instance."""
+        self.name = os.path.basename(file_path)
+        self.path = file_path
+        self.syscalls = []
+        self._kind = kind
+        self._target = target
+        self._d_type = d_type
+        self._lstat = self._stat = None
+
+    def __repr__(self):  # pragma: no cover
+        """A representation for the instance."""
+        blurb = "{}(path={!r}, kind={!r}, target={!r})"
+        return blurb.format(type(self).__name__, self.path, self._kind,
+                            self._target)
+
+    def is_dir(self, follow_symlinks=True):
+        """Whether this instance represents a directory."""
+        return self._get_kind(follow_symlinks) == "dir"
+
+    def is_file(self, follow_symlinks=True):
+        """Whether this instance represents a file."""
+        return self._get_kind(follow_symlinks) == "file"
+
+    def is_symlink(self):
+        """Whether this instance represents a symlink."""
+        if not self._d_type:
+            self.stat(follow_symlinks=False)
+        return self._kind == "link"
+
+    def stat(self, follow_symlinks=True):
+        """Return a mock'd os.stat object for the entry."""
+        if follow_symlinks and self.is_symlink():
+            if self._stat is None:
+                self.syscalls.append("stat")
+                self._stat = get_stat_result([0] * 6 + [1024, 0, 0, 0])
+            return self._stat
+
+        if self._lstat is None:
+            self.syscalls.append("lstat")
+            self._lstat = get_stat_result([0] * 6 + [16, 0, 0, 0])
+        return self._lstat
+
+    def _get_kind(self, follow_symlinks):
+        """The kind of file represented by the instance."""
+        if self._kind == "link" and follow_symlinks:
+            self.stat()
+            return self._target
+
+        if not self._d_type:
+            self.stat(follow_symlinks=False)
+        return self._kind
+
+
 ###############################################################################
 # EXPORTED METHODS
 
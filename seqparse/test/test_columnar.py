@@ -0,0 +1,109 @@
+"""Test columnar storage of file sequences (seqparse.columnar)."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from .. import get_parser
+from ..columnar import ColumnarSeqparse
+from ..regex import DEFAULT_GRAMMAR, NamingGrammar
+
+###############################################################################
+# class: TestColumnarSeqparse
+
+
+class TestColumnarSeqparse(unittest.TestCase):
+    """Test the ColumnarSeqparse class of the seqparse module."""
+
+    _test_root = "test_dir"
+
+    _file_names = [
+        "kitty.0001.exr", "sub/pony.01.jpg", "kitty.0002.exr",
+        "kitty.0010.exr", "kitty.5.exr", "sub/pony.02.jpg", "singleton.jpg",
+        "sub/.0001.exr", "sub/0001.exr", "kitty_0004.exr",
+        "kitty.0001-0003.exr", "kitty.100000000000000000000.exr",
+        "kitty.10000.exr", "sub/pony.0003.jpg"
+    ]
+
+    def setUp(self):
+        """Set up the file names used by each test."""
+        self.file_names = [
+            os.path.join(self._test_root, x) for x in self._file_names
+        ]
+
+    def test_add_files(self):
+        """ColumnarSeqparse: Test adding files, and grouping on output."""
+        expected = get_parser()
+        expected.add_files(self.file_names)
+
+        parser = get_parser(columnar=True)
+        self.assertIsInstance(parser, ColumnarSeqparse)
+        parser.add_files(self.file_names)
+
+        # Frames are buffered until the container hierarchy is needed.
+        self.assertEqual(parser.num_records, 9)
+        self.assertEqual(list(map(str, parser.output())),
+                         list(map(str, expected.output())))
+        self.assertEqual(parser.num_records, 0)
+
+        # Frames added after output are merged with the existing sequences.
+        parser.add_files([os.path.join(self._test_root, "kitty.0011.exr")])
+        self.assertEqual(parser.num_records, 1)
+        kitty = parser.sequences[self._test_root]["kitty"]["exr"][4]
+        self.assertEqual(parser.num_records, 0)
+        self.assertIn(11, kitty)
+
+    def test_grammars(self):
+        """ColumnarSeqparse: Test file sequences using custom grammars."""
+        file_names = [
+            os.path.join(self._test_root, x)
+            for x in ("kitty_0001.exr", "kitty_0002.exr", "kitty.0003.exr")
+        ]
+        grammars = [DEFAULT_GRAMMAR, NamingGrammar("_", r"[^\.]+")]
+
+        output = []
+        for columnar in (False, True):
+            parser = get_parser(columnar=columnar, grammars=grammars)
+            parser.add_files(file_names)
+            output.append(list(map(str, parser.output())))
+
+        self.assertEqual(output[0], output[1])
+        self.assertEqual(len(output[1]), 2)
+
+    def test_scan(self):
+        """ColumnarSeqparse: Test scanning, stats and rescans on disk."""
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+
+        for file_name in self._file_names[:-5]:
+            file_path = os.path.join(root, file_name)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, "w", encoding="utf-8") as file_obj:
+                file_obj.write(file_name)
+
+        output = []
+        for columnar in (False, True):
+            parser = get_parser(columnar=columnar)
+            parser.scan_options["incremental"] = True
+            parser.scan_path(root)
+            output.append(list(map(str, parser.output())))
+
+            os.remove(os.path.join(root, "kitty.0010.exr"))
+            self.assertEqual(parser.rescan(), {root})
+            output.append(list(map(str, parser.output())))
+
+            with open(os.path.join(root, "kitty.0010.exr"),
+                      "w",
+                      encoding="utf-8") as file_obj:
+                file_obj.write("kitty.0010.exr")
+
+        self.assertEqual(output[:2], output[2:])
+
+        # Stats are cached by the file sequences.
+        parser = get_parser(columnar=True)
+        parser.scan_options["stat"] = True
+        parser.scan_path(root)
+        self.assertEqual(parser.num_records, 0)
+        kitty = parser.sequences[root]["kitty"]["exr"][4]
+        self.assertEqual(kitty.size, 3 * len("kitty.0001.exr"))
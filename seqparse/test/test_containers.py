@@ -87,6 +87,14 @@ class TestSingletonContainer(unittest.TestCase):
         self.assertEqual("\n".join(file_names), str(container))
         self.assertEqual("\n".join(file_names), "\n".join(output))
 
+        # The sorted order is cached until files are added or removed.
+        container.add(self._singletons[0])
+        container.add("aardvark.jpg")
+        container.discard(self._singletons[-1])
+        output = [os.path.basename(str(x)) for x in container.output()]
+        self.assertEqual(output,
+                         sorted(["aardvark.jpg"] + self._singletons[:-1]))
+
     @mock.patch("seqparse.seqparse.os.scandir")
     def test_stats(self, mock_api_call):
         """SingletonContainer: Test disk stat functionality."""
@@ -203,6 +211,27 @@ class TestFileSequenceContainer(unittest.TestCase):
         with self.assertRaises(KeyError):
             del container["tiff"]
 
+    def test_output(self):
+        """FileSequenceContainer: Test output method."""
+        parser = get_parser()
+        parser.add_files(
+            os.path.join(self._test_root, f"kitty.{x:04d}.{y}")
+            for x in (1, 2) for y in ("tif", "exr", "jpg"))
+        container = parser.sequences[self._test_root]["kitty"]
+
+        # File sequences are sorted by extension.
+        expected = [
+            os.path.join(self._test_root, f"kitty.0001,0002.{x}")
+            for x in ("exr", "jpg", "tif")
+        ]
+        self.assertEqual([str(x) for x in container.output()], expected)
+
+        container["dpx"][4].add("0003")
+        del container["jpg"]
+        expected[1:2] = []
+        expected.insert(0, os.path.join(self._test_root, "kitty.0003.dpx"))
+        self.assertEqual([str(x) for x in container.output()], expected)
+
     @mock.patch("seqparse.seqparse.os.path.isfile")
     def test_properties(self, fake_isfile):
         """FileSequenceContainer: Test class properties."""
@@ -332,3 +361,55 @@ class TestFileExtension(unittest.TestCase):
         output = "\n".join(str(x) for x in file_ext.output())
 
         self.assertEqual(output, str(input_seq1))
+
+    def test_consolidate(self):
+        """FileExtension: Test zero-padding consolidation."""
+        file_ext = FileExtension(name=self._test_ext)
+        file_ext[1] = [5, 8]
+        file_ext[2] = [10, 11]
+        file_ext[3] = [1, 200]
+        file_ext[4] = [1000, 1001]
+        for pad, frame in ((3, 1), (3, 200), (4, 1000), (4, 1001)):
+            file_stat = file_ext[pad].cache_stat(frame, os.stat(__file__))
+
+        # Frames are merged as integers, rather than re-added as strings.
+        with mock.patch.object(FileSequence, "update") as update:
+            self.assertEqual(file_ext.consolidate(), 2)
+            self.assertFalse(update.called)
+
+        self.assertEqual(sorted(file_ext), [1, 3])
+        self.assertEqual(file_ext[1].pretty_frames, "5,8,10,11")
+        self.assertEqual(file_ext[3].pretty_frames, "001,200,1000,1001")
+        self.assertEqual(file_ext[3].stat(1001), file_stat)
+
+        # Nothing is done until file sequences have been added again.
+        self.assertEqual(file_ext.consolidate(), 0)
+        file_ext[4] = [2000]
+        file_ext[4].cache_stat(2000, file_stat)
+        self.assertEqual(file_ext.consolidate(), 1)
+        self.assertEqual([x.pretty_frames for x in file_ext.output()],
+                         ["5,8,10,11", "001,200,1000,1001,2000"])
+
+        # Zero-padded frames reclaim the merged frames of their zero-padding.
+        file_ext[4] = [1]
+        file_ext[4].cache_stat(1, file_stat)
+        self.assertEqual(file_ext.consolidate(), 0)
+        self.assertEqual([x.pretty_frames for x in file_ext.output()],
+                         ["5,8,10,11", "001,200", "0001,1000,1001,2000"])
+        self.assertEqual(file_ext[4].stat(2000), file_stat)
+        self.assertIsNone(file_ext[3].stat(2000))
+
+        # A new, smaller zero-padding absorbs the previous smallest one.
+        file_ext = FileExtension(name=self._test_ext)
+        file_ext[2] = [10, 11]
+        self.assertEqual(file_ext.consolidate(), 0)
+        file_ext[1] = [7]
+        self.assertEqual(file_ext.consolidate(), 1)
+        self.assertEqual([x.pretty_frames for x in file_ext.output()],
+                         ["7,10,11"])
+
+        # Unpadded frames can skip the merge altogether.
+        self.assertIs(file_ext.get_sequence(4, padded=False), file_ext[1])
+        self.assertEqual(sorted(file_ext), [1])
+        self.assertIsNot(file_ext.get_sequence(4), file_ext[1])
+        self.assertEqual(sorted(file_ext), [1, 4])
@@ -383,3 +383,33 @@ class TestFileSequences(unittest.TestCase):
         self.assertIn(frames[0], input_seq)
         input_seq.discard(frames[0])
         self.assertNotIn(frames[0], input_seq)
+
+    def test_move_frames(self):
+        """FileSequence: Test moving frames between instances."""
+        full_name = os.path.join(self._test_root, self._test_name)
+        source = FileSequence(ext=self._test_ext,
+                              frames=[1, 2, 1000, 1001],
+                              name=full_name,
+                              pad=4)
+        target = FileSequence(ext=self._test_ext,
+                              frames=[1002],
+                              name=full_name,
+                              pad=4)
+        for fseq in (source, target):
+            for frame in map(int, fseq.frames):
+                fseq.cache_stat(frame, os.stat_result((0, 0, 0, 0, 0, 0,
+                                                       frame, 0, 0, 0)))
+
+        self.assertEqual(sorted(source.move_frames(target, first=1000)),
+                         [1000, 1001])
+        self.assertEqual(str(source), f"{full_name}.0001,0002.exr")
+        self.assertEqual(str(target), f"{full_name}.1000-1002.exr")
+        self.assertEqual(sorted(source.stat()), [1, 2])
+        self.assertEqual(sorted(target.stat()), [1000, 1001, 1002])
+        self.assertEqual((source.size, target.size), (3, 3003))
+
+        source.move_frames(target)
+        self.assertEqual(str(source), "")
+        self.assertEqual(str(target), f"{full_name}.0001,0002,1000-1002.exr")
+        self.assertEqual(sorted(target.stat()), [1, 2, 1000, 1001, 1002])
+        self.assertEqual(target.size, 3006)
@@ -3,8 +3,10 @@
 import os
 import unittest
 
-from ..sequences import (FileSequence, FrameChunk, FrameSequence,
-                         SeqparsePadException)
+from .. import validate_frame_sequence
+from ..sequences import (FileSequence, frame_cache_info, FrameChunk,
+                         FrameSequence, SeqparsePadException,
+                         set_frame_cache_size)
 
 ###############################################################################
 # class: TestFrameSequences
@@ -288,3 +290,38 @@ class TestFrameSequences(unittest.TestCase):
                              pad=4)
 
         self.assertNotEqual(seq1, fseq1)
+
+    def test_frame_cache(self):
+        """FrameSequence: Test the shared frame sequence cache."""
+        set_frame_cache_size(2)
+        self.addCleanup(set_frame_cache_size)
+
+        seq1 = FrameSequence("1001-1240")
+        self.assertEqual(frame_cache_info().misses, 1)
+
+        # Cached instances must not share their frame storage.
+        seq1.add(5)
+        seq2 = FrameSequence("1001-1240")
+        self.assertEqual(frame_cache_info().hits, 1)
+        self.assertNotIn(5, seq2)
+        self.assertEqual(str(seq2), "1001-1240")
+        self.assertTrue(seq2.is_padded is False)
+
+        # ... and the cache is shared with FileSequence and the validation
+        # methods.
+        fseq = FileSequence("cat.1001-1240.exr")
+        self.assertEqual(str(fseq), "cat.1001-1240.exr")
+        self.assertEqual(validate_frame_sequence("1001-1240"), "1001-1240")
+        self.assertEqual(frame_cache_info().hits, 3)
+
+        seq3 = FrameSequence(pad=4)
+        seq3.add("0001-0005")
+        with self.assertRaises(SeqparsePadException):
+            seq3.add("1-5")
+        with self.assertRaises(ValueError):
+            seq3.add("0001-")
+        self.assertEqual(str(seq3), "0001-0005")
+
+        info = frame_cache_info()
+        self.assertEqual(info.maxsize, 2)
+        self.assertEqual(info.currsize, 2)
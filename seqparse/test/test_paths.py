@@ -0,0 +1,140 @@
+"""Test path storage (seqparse.paths)."""
+
+import os
+import unittest
+
+from .. import get_parser
+from ..paths import PathNode, PathTrie
+
+###############################################################################
+# class: TestPathTrie
+
+
+class TestPathTrie(unittest.TestCase):
+    """Test the PathTrie class of the seqparse module."""
+
+    _paths = [
+        os.path.join("prod", "show", "render", "v001"),
+        os.path.join("prod", "show", "render"),
+        os.path.join("prod", "show", "comp", "v001"),
+        os.sep + os.path.join("prod", "show"),
+        os.path.join("prod", "show//", "render"), "", os.sep
+    ]
+
+    def test_mapping(self):
+        """PathTrie: Test standard mapping behaviour."""
+        trie = PathTrie()
+        for index, path in enumerate(self._paths):
+            trie[path] = index
+
+        # Paths are rebuilt exactly as they were added, in (depth-first)
+        # insertion order.
+        self.assertEqual(len(trie), len(self._paths))
+        self.assertEqual(sorted(trie), sorted(self._paths))
+        self.assertEqual(dict(trie.items()),
+                         {x: i
+                          for i, x in enumerate(self._paths)})
+        self.assertEqual(list(trie),
+                         [self._paths[x] for x in (1, 0, 2, 4, 5, 3, 6)])
+
+        self.assertIn(self._paths[1], trie)
+        self.assertNotIn(os.path.join("prod", "show"), trie)
+        self.assertIsNone(trie.get(os.path.join("prod", "show")))
+        self.assertEqual(trie.get(key=self._paths[1], default=-1), 1)
+        self.assertEqual(trie.get(key="missing", default=-1), -1)
+        with self.assertRaises(KeyError):
+            trie[os.path.join("prod", "show")]  # pylint: disable=W0104
+
+        # Deleting values prunes any branches that no longer hold values.
+        self.assertEqual(trie.pop(self._paths[0]), 0)
+        self.assertEqual(trie.pop(self._paths[0], None), None)
+        with self.assertRaises(KeyError):
+            trie.pop(key=self._paths[0])
+        del trie[self._paths[2]]
+        self.assertEqual(len(trie), len(self._paths) - 2)
+        self.assertIsNone(
+            trie.get_node(os.path.join("prod", "show", "comp"), create=False))
+        with self.assertRaises(KeyError):
+            del trie[self._paths[2]]
+
+        trie.clear()
+        self.assertEqual((len(trie), list(trie)), (0, []))
+
+    def test_defaults(self):
+        """PathTrie: Test default values (per collections.defaultdict)."""
+        trie = PathTrie(list)
+        trie[self._paths[0]].append(1)
+        trie[self._paths[0]].append(2)
+        self.assertEqual(dict(trie.items()), {self._paths[0]: [1, 2]})
+
+        # Fetching a node doesn't provide it with a value.
+        node = trie.get_node(self._paths[1])
+        self.assertEqual(len(trie), 1)
+        self.assertIs(trie[node], trie[self._paths[1]])
+
+    def test_sorted_nodes(self):
+        """PathTrie: Test the cached, sorted list of nodes."""
+        trie = PathTrie(list)
+        for path in self._paths:
+            trie[path].append(path)
+
+        expected = sorted(self._paths)
+        nodes = trie.sorted_nodes()
+        self.assertEqual([x.path for x in nodes], expected)
+        self.assertIs(trie.sorted_nodes(), nodes)
+
+        # Updating values doesn't affect the order ...
+        trie[self._paths[0]] = 0
+        trie[self._paths[1]].append(1)
+        self.assertIs(trie.sorted_nodes(), nodes)
+
+        # ... but adding or removing paths does.
+        del trie[self._paths[0]]
+        trie[os.path.join("prod", "show")].append(2)
+        expected.remove(self._paths[0])
+        expected.append(os.path.join("prod", "show"))
+        self.assertEqual([x.path for x in trie.sorted_nodes()],
+                         sorted(expected))
+
+        trie.clear()
+        self.assertEqual(trie.sorted_nodes(), ())
+
+    def test_nodes(self):
+        """PathTrie: Test path nodes."""
+        trie = PathTrie()
+        nodes = [trie.get_node(x) for x in self._paths]
+
+        for node, path in zip(nodes, self._paths):
+            self.assertIsInstance(node, PathNode)
+            self.assertEqual(str(node), path)
+            self.assertEqual(os.fspath(node), path)
+            self.assertEqual(bool(node), bool(path))
+
+        # Segments are stored once, no matter how many paths share them.
+        self.assertIs(nodes[0].parent.parent, nodes[1].parent)
+        self.assertIs(nodes[0].segment, nodes[2].segment)
+
+    def test_shared_paths(self):
+        """PathTrie: Test paths shared by Seqparse containers."""
+        root_dir = os.path.join("test_dir", "render")
+        parser = get_parser()
+        parser.add_files(
+            os.path.join(root_dir, x)
+            for x in ("kitty.0001.exr", "pony.0001.exr", "kitty.0002.exr",
+                      "notes.txt"))
+
+        node = parser.locations.get_node(root_dir)
+        containers = list(parser.sequences[root_dir].values())
+        containers.append(parser.singletons[root_dir])
+        for container in containers:
+            self.assertIs(container._path, node)  # pylint: disable=W0212
+            self.assertEqual(container.path, root_dir)
+
+        fseq = parser.sequences[root_dir]["kitty"]["exr"][4]
+        self.assertIs(fseq._info["path"], node)  # pylint: disable=W0212
+        self.assertEqual(fseq.full_name, os.path.join(root_dir, "kitty"))
+
+        self.assertEqual([str(x) for x in parser.output()], [
+            os.path.join(root_dir, x)
+            for x in ("kitty.0001,0002.exr", "pony.0001.exr", "notes.txt")
+        ])
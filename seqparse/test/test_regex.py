@@ -1,9 +1,14 @@
 """Test the regex module."""
 
 import os
+import random
+import re
 import unittest
 
-from ..regex import SeqparseRegexMixin
+from ..regex import (compile_grammars, compile_name_patterns,
+                     DEFAULT_GRAMMAR, FILE_NAME_EXPR, FILE_SEQ_EXPR,
+                     FRAME_EXPR, NamingGrammar, SeqparseRegexMixin,
+                     split_file_name)
 
 ###############################################################################
 # class: TestRegex
@@ -138,3 +143,178 @@ class TestSeqparseModule(unittest.TestCase):
             self.assertFalse(self.regex.is_frame_sequence(frame_seq))
 
         print("")
+
+    def test_parse_many(self):
+        """SeqparseRegexMixin: Test the parse_many method."""
+        file_names = [
+            "/i/like/cats/kitty.0001.tif".replace("/", os.sep),
+            "/i/like/cats/kitty.0002.tif".replace("/", os.sep),
+            "/i/like/dogs/pony.jpg".replace("/", os.sep), "0010.exr",
+            "/i/like/cats/kitty.3.tif".replace("/", os.sep)
+        ]
+
+        parsed = self.regex.parse_many(iter(file_names))
+
+        self.assertEqual(parsed.dirs, [
+            "/i/like/cats".replace("/", os.sep),
+            "/i/like/dogs".replace("/", os.sep), ""
+        ])
+        self.assertEqual(list(parsed.dir_index), [0, 0, 1, 2, 0])
+        self.assertEqual(parsed.name,
+                         ["kitty", "kitty", "pony.jpg", "", "kitty"])
+        self.assertEqual(parsed.sep, [".", ".", "", ".", "."])
+        self.assertEqual(list(parsed.frame), [1, 2, -1, 10, 3])
+        self.assertEqual(list(parsed.pad), [4, 4, 0, 4, 1])
+        self.assertEqual(parsed.ext, ["tif", "tif", "", "exr", "tif"])
+        self.assertEqual(list(parsed.singleton), [0, 0, 1, 0, 0])
+
+        # Every column should agree with file_name_match.
+        for idx, file_name in enumerate(file_names):
+            bits = self.regex.file_name_match(file_name)
+            self.assertEqual(bool(parsed.singleton[idx]), bits is None)
+            if bits:
+                self.assertEqual(int(bits.frame), parsed.frame[idx])
+                self.assertEqual(bits.ext, parsed.ext[idx])
+
+        # Names parsed under other naming grammars can be put back together.
+        regex = SeqparseRegexMixin()
+        regex.set_grammars([DEFAULT_GRAMMAR, NamingGrammar("_", r"[^\.]+")])
+        file_names = ["kitty_0001.exr", "kitty.0002.exr", "pony.jpg"]
+        parsed = regex.parse_many(file_names)
+        self.assertEqual(parsed.sep, ["_", ".", ""])
+        for idx, file_name in enumerate(file_names[:2]):
+            self.assertEqual(
+                f"{parsed.name[idx]}{parsed.sep[idx]}"
+                f"{parsed.frame[idx]:0{parsed.pad[idx]}d}.{parsed.ext[idx]}",
+                file_name)
+
+    def test_grammars(self):
+        """SeqparseRegexMixin: Test pluggable file naming grammars."""
+        split_file, split_seq = compile_grammars([DEFAULT_GRAMMAR])
+        self.assertIs(split_file.func, split_file_name)
+        self.assertIs(split_seq.func, split_file_name)
+
+        regex = SeqparseRegexMixin()
+        regex.set_grammars([
+            DEFAULT_GRAMMAR,
+            NamingGrammar("_", r"[^\.]+"),
+            NamingGrammar("", r"[^\.]+"),
+            NamingGrammar(".", r"[^\.]+\.gz")
+        ])
+        self.assertEqual(len(regex.grammars), 4)
+
+        good_names = [
+            ("kitty.0001.exr", ("kitty", "0001", "exr"), "."),
+            ("kitty_0001.exr", ("kitty", "0001", "exr"), "_"),
+            ("kitty0001.exr", ("kitty", "0001", "exr"), ""),
+            ("kitty.0001.exr.gz", ("kitty", "0001", "exr.gz"), "."),
+            ("kitty_v2.0001.exr", ("kitty_v2", "0001", "exr"), "."),
+            ("0001.exr", (None, "0001", "exr"), "."),
+        ]
+
+        print("\n\n  GOOD NAMES\n  ----------")
+        for file_name, result, sep in good_names:
+            bits = regex.file_name_match(file_name)
+            print(f'  o "{file_name}" --> {bits}')
+            self.assertEqual(bits, result)
+            self.assertEqual(regex.frame_sep(file_name, bits), sep)
+
+        bits = regex.file_seq_match("kitty_0001-0010x2.exr")
+        self.assertEqual(bits, ("kitty", "0001-0010x2", "exr"))
+        self.assertIsNone(regex.file_name_match("kitty.exr"))
+
+        # Other instances still use the default naming convention only.
+        self.assertIsNone(self.regex.file_name_match("kitty_0001.exr"))
+        self.assertIsNone(self.regex.file_name_match("kitty.0001.exr.gz"))
+
+        # Separators only match the extensions they were declared with.
+        regex.set_grammars([
+            NamingGrammar("_", r"exr"),
+            NamingGrammar("", r"tif"),
+            NamingGrammar(".", r"[^\.]+\.gz")
+        ])
+        self.assertEqual(regex.file_name_match("kitty_0001.exr"),
+                         ("kitty", "0001", "exr"))
+        self.assertEqual(regex.file_seq_match("kitty0001-0010.tif"),
+                         ("kitty", "0001-0010", "tif"))
+        for file_name in ("kitty_0001.tif", "kitty0001.exr",
+                          "kitty.0001.exr", "kitty_0001.exr.gz"):
+            self.assertIsNone(regex.file_name_match(file_name), file_name)
+
+        with self.assertRaises(ValueError):
+            compile_grammars([NamingGrammar("v1", r"exr")])
+
+        print("")
+
+    def test_split_file_name(self):
+        """SeqparseRegexMixin: Fuzz split_file_name against the regexes."""
+        file_expr = re.compile(FILE_NAME_EXPR)
+        fseq_expr = re.compile(FILE_SEQ_EXPR)
+        frame_num_expr = re.compile(r"\d+")
+        frames_expr = re.compile(FRAME_EXPR)
+
+        def regex_split(expr, val):
+            fmatch = expr.match(val)
+            return fmatch.groups() if fmatch else None
+
+        rng = random.Random(1234)
+        alphabet = "0123456789" + "..,,--xx" + "ab/_\n\u0663"
+        for _ in range(20000):
+            val = "".join(
+                rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+            self.assertEqual(split_file_name(val, frame_num_expr),
+                             regex_split(file_expr, val), val)
+            self.assertEqual(split_file_name(val, frames_expr),
+                             regex_split(fseq_expr, val), val)
+
+    def test_split_grammar_names(self):
+        """SeqparseRegexMixin: Fuzz compiled grammars against the regexes."""
+        # Every separator is declared with every extension, so a single
+        # expression per match type (with the separators and extensions
+        # combined freely) should match exactly the same names.
+        seps = (".", "-", "__", "")
+        exts = (r"[^\.]+", r"[^\.]+\.gz")
+        split_file, split_seq = compile_grammars(
+            NamingGrammar(x, y) for x in seps for y in exts)
+
+        sep_expr = r"\.|-|__|(?<!\d)(?<!\.)(?<!-)(?<!__)"
+        seq_sep_expr = sep_expr + r"(?<!\d-)(?<!\dx)(?<!\d,)"
+        ext_expr = "|".join(f"(?:{x})" for x in exts)
+        file_expr = re.compile(rf"(?:^(?P<name>.+)(?:{sep_expr})|^)"
+                               rf"(?P<frame>\d+)\.(?P<ext>{ext_expr})$")
+        fseq_expr = re.compile(rf"(?:^(?P<name>.+)(?:{seq_sep_expr})|^)"
+                               rf"(?P<frames>{FRAME_EXPR})"
+                               rf"\.(?P<ext>{ext_expr})$")
+
+        def regex_split(expr, val):
+            fmatch = expr.match(val)
+            return fmatch.groups() if fmatch else None
+
+        rng = random.Random(1234)
+        alphabet = "0123456789" + "..,,--xx" + "ab/__gz\n\u0663"
+        for _ in range(20000):
+            val = "".join(
+                rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+            self.assertEqual(split_file(val), regex_split(file_expr, val),
+                             val)
+            self.assertEqual(split_seq(val), regex_split(fseq_expr, val),
+                             val)
+
+    def test_compile_name_patterns(self):
+        """compile_name_patterns: Test glob and regular expression patterns."""
+        self.assertIsNone(compile_name_patterns([]))
+
+        expr = compile_name_patterns(
+            ["*.exr", "cache", r"re:v\d{3}$", "re:tmp"])
+        self.assertIs(expr, compile_name_patterns(
+            ("*.exr", "cache", r"re:v\d{3}$", "re:tmp")))
+
+        for name in ("kitty.0001.exr", ".exr", "cache", "v001", "tmp",
+                     "tmp_files"):
+            self.assertTrue(expr.match(name), name)
+        for name in ("kitty.0001.exr.gz", "kitty.EXR", "caches", "v0001",
+                     "old_tmp", "re:tmp"):
+            self.assertFalse(expr.match(name), name)
+
+        with self.assertRaises(re.error):
+            compile_name_patterns(["re:("])
@@ -3,15 +3,17 @@
 import copy
 import os
 import shlex
+import tempfile
 import time
 import unittest
 from unittest import mock
 
 from . import (DirEntry, generate_entries, initialise_mock_scandir_data,
                mock_scandir_deep)
-from .. import get_version
+from .. import get_parser, get_version
 from ..cli import seqls
 from ..sequences import FileSequence, FrameChunk
+from ..watch import PollingWatcher
 
 ###############################################################################
 # class: TestFrameSequences
@@ -28,14 +30,28 @@ class TestSeqls(unittest.TestCase):
     def test_parse_args(self):
         """Seqls: Test seqls argument parsing."""
         defaults = dict(all=False,
+                        exclude=None,
+                        ext=None,
+                        from_file=None,
+                        from_stdin=None,
                         human_readable=False,
+                        include=None,
+                        include_dirs=None,
+                        index=None,
                         long_format=False,
+                        manifest=None,
+                        manifest_columns=None,
+                        manifest_sep=None,
                         max_levels=[-1],
                         min_levels=[-1],
                         missing=False,
+                        null=False,
+                        poll=False,
                         search_path=["."],
                         seqs_only=False,
-                        version=False)
+                        stream=False,
+                        version=False,
+                        watch=False)
         args = vars(seqls.parse_args([]))
         self.assertEqual(args, defaults)
 
@@ -51,7 +67,9 @@ class TestSeqls(unittest.TestCase):
             (shlex.split("--maxdepth 1 -S"), dict(
                 max_levels=[1], seqs_only=True)),
             (shlex.split("-m test_dir"), dict(
-                missing=True, search_path=["test_dir"], seqs_only=True))]
+                missing=True, search_path=["test_dir"], seqs_only=True)),
+            (shlex.split("--exclude tmp --exclude 're:\\.' --ext exr"), dict(
+                exclude=["tmp", r"re:\."], ext=["exr"]))]
         # yapf: enable
 
         for input_args, updated_options in data:
@@ -261,3 +279,174 @@ class TestSeqls(unittest.TestCase):
 
         self.assertEqual(len(output), 2)
         self.assertEqual(output, expected)
+
+    def test_index_option(self):
+        """Seqls: Test the index option."""
+        with tempfile.TemporaryDirectory() as root:
+            search_path = os.path.join(root, "shots")
+            index_path = os.path.join(root, "index.db")
+
+            for file_name in ("a.0001.exr", "a.0002.exr", "b/c.0001.exr"):
+                file_path = os.path.join(search_path, file_name)
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                with open(file_path, "w", encoding="utf-8"):
+                    pass
+
+            args = seqls.parse_args([search_path, "--index", index_path])
+            expected = seqls.main(args, _debug=True)
+            self.assertEqual(len(expected), 2)
+            self.assertTrue(os.path.isfile(index_path))
+
+            with mock.patch("seqparse.seqparse.os.scandir") as mock_api_call:
+                self.assertEqual(seqls.main(args, _debug=True), expected)
+                self.assertFalse(mock_api_call.called)
+
+            # A different set of options won't use the index.
+            args = seqls.parse_args(
+                [search_path, "--index", index_path, "--maxdepth", "0"])
+            self.assertEqual(seqls.main(args, _debug=True), expected[:1])
+
+    def test_from_file_option(self):
+        """Seqls: Test the from-file option."""
+        # Relative and absolute paths to the same directories are merged.
+        test_root = os.path.abspath(self._test_root)
+        file_names = [
+            os.path.join(self._test_root, "kitty.0001.exr"),
+            os.path.join(test_root, "kitty.0002.exr"),
+            os.path.join(os.curdir, self._test_root, "sub", "pony.jpg"),
+            os.path.join(test_root, "sub", "pony.0003.jpg")
+        ]
+
+        with tempfile.TemporaryDirectory() as root:
+            file_list = os.path.join(root, "files.txt")
+            expected = [
+                os.path.join(test_root, "kitty.0001,0002.exr"),
+                os.path.join(test_root, "sub", "pony.0003.jpg"),
+                os.path.join(test_root, "sub", "pony.jpg")
+            ]
+
+            for sep, opts in (("\n", []), ("\0", ["-z"])):
+                with open(file_list, "w", encoding="utf-8") as file_obj:
+                    file_obj.write(sep.join(file_names) + sep)
+
+                args = seqls.parse_args(["--from-file", file_list] + opts)
+                with mock.patch("seqparse.seqparse.os.scandir") as scandir:
+                    self.assertEqual(seqls.main(args, _debug=True), expected)
+                    self.assertFalse(scandir.called)
+
+                # Paths are read in (small) chunks.
+                self.assertEqual(
+                    list(seqls.read_file_list(file_list, bool(opts), 7)),
+                    file_names)
+
+        with self.assertRaises(SystemExit):
+            seqls.parse_args(["test_dir", "--from-stdin"])
+
+    def test_filter_options(self):
+        """Seqls: Test the exclude, ext and include options."""
+        with tempfile.TemporaryDirectory() as root:
+            for file_name in ("kitty.0001.exr", "kitty.0002.exr",
+                              "kitty.0001.jpg", "pony.tif", "tmp/a.0001.exr",
+                              "sub/b.0001.exr"):
+                file_path = os.path.join(root, file_name)
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                with open(file_path, "w", encoding="utf-8"):
+                    pass
+
+            args = seqls.parse_args(
+                [root, "--exclude", "tmp", "--ext", "exr", "--include", "p*"])
+            self.assertEqual(seqls.main(args, _debug=True), [
+                os.path.join(root, "kitty.0001,0002.exr"),
+                os.path.join(root, "pony.tif"),
+                os.path.join(root, "sub", "b.0001.exr")
+            ])
+
+            args = seqls.parse_args([root, "--stream", "--exclude", "*.exr"])
+            self.assertEqual(seqls.main(args, _debug=True), [
+                os.path.join(root, "kitty.0001.jpg"),
+                os.path.join(root, "pony.tif")
+            ])
+
+            args = seqls.parse_args([root, "--include-dir", "s*"])
+            self.assertEqual(seqls.main(args, _debug=True),
+                             [os.path.join(root, "sub", "b.0001.exr")])
+
+        for bad_args in (["--include", "re:("],
+                         ["--from-stdin", "--ext", "exr"],
+                         ["--from-stdin", "--include-dir", "sub"]):
+            with self.assertRaises(SystemExit):
+                with mock.patch("sys.stderr"):
+                    seqls.parse_args(bad_args)
+
+    def test_manifest_option(self):
+        """Seqls: Test the manifest option."""
+        root_dir = os.path.join(os.getcwd(), self._test_root)
+        mtime = 1490908305
+        file_date = time.strftime('%Y/%m/%d %H:%M', time.localtime(mtime))
+
+        with tempfile.TemporaryDirectory() as root:
+            manifest = os.path.join(root, "manifest.txt")
+            with open(manifest, "w", encoding="utf-8") as file_obj:
+                for frame in (1, 2, 3):
+                    file_obj.write(f"{mtime} 1024 -- "
+                                   f"{root_dir}/kitty.{frame:04d}.exr\n")
+
+            args = seqls.parse_args([
+                "--manifest", manifest, "--manifest-columns",
+                "mtime,size,,path", "-l", "-H"
+            ])
+            with mock.patch("seqparse.seqparse.os.scandir") as scandir:
+                self.assertEqual(seqls.main(args, _debug=True), [
+                    f"3.0K  {file_date}  " +
+                    os.path.join(root_dir, "kitty.0001-0003.exr")
+                ])
+                self.assertFalse(scandir.called)
+
+        with self.assertRaises(SystemExit):
+            seqls.parse_args(
+                ["--manifest", "-", "--manifest-columns", "path,size"])
+
+    def test_watch_option(self):
+        """Seqls: Test the watch option."""
+        with tempfile.TemporaryDirectory() as root:
+            for frame in (1, 2, 5):
+                with open(os.path.join(root, f"kitty.{frame:04d}.exr"),
+                          "w",
+                          encoding="utf-8"):
+                    pass
+
+            args = seqls.parse_args([root, "-m", "--watch", "--poll"])
+            parser = get_parser()
+            parser.scan_options["incremental"] = True
+            parser.scan_path(root)
+
+            with open(os.path.join(root, "kitty.0003.exr"),
+                      "w",
+                      encoding="utf-8"):
+                pass
+            mtime_ns = os.stat(root).st_mtime_ns + 10**9
+            os.utime(root, ns=(mtime_ns, mtime_ns))
+
+            watcher = PollingWatcher(parser, interval=0.01)
+            lines = next(seqls.watch_output(parser, args, watcher))
+            self.assertEqual(lines, [
+                "- " + os.path.join(root, "kitty.0003,0004.exr"),
+                "+ " + os.path.join(root, "kitty.0004.exr")
+            ])
+
+    @mock.patch("seqparse.seqparse.os.scandir")
+    def test_stream_option(self, mock_api_call):
+        """Seqls: Test the stream option."""
+        mock_api_call.side_effect = mock_scandir_deep
+        search_path = os.path.join(os.getcwd(), self._test_root)
+
+        initialise_mock_scandir_data(search_path)
+        args = seqls.parse_args(["test_dir", "--mindepth", "1"])
+        expected = seqls.main(args, _debug=True)
+
+        initialise_mock_scandir_data(search_path)
+        args = seqls.parse_args(["test_dir", "--mindepth", "1", "--stream"])
+        self.assertEqual(seqls.main(args, _debug=True), expected)
+
+        with self.assertRaises(SystemExit):
+            seqls.parse_args(["test_dir", "--stream", "--watch"])
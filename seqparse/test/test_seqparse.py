@@ -1,13 +1,22 @@
 """Test file sequence discovery on disk."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 import os
+import shutil
+import tempfile
+import threading
 import unittest
 from unittest import mock
 
 from . import (DirEntry, generate_entries, initialise_mock_scandir_data,
-               mock_scandir_deep)
+               mock_scandir_deep, SyscallDirEntry)
 from .. import (__version__, get_parser, get_sequence, get_version, invert,
                 validate_frame_sequence)
+from ..containers import FileExtension
+from ..regex import DEFAULT_GRAMMAR, NamingGrammar
+from ..seqparse import Seqparse
 from ..sequences import FileSequence, FrameChunk, FrameSequence
 
 ###############################################################################
@@ -269,6 +278,326 @@ class TestSeqparseModule(unittest.TestCase):
 
         print("")
 
+    @mock.patch("seqparse.seqparse.os.scandir")
+    def test_threaded_scan(self, mock_api_call):
+        """Seqparse: Test directory listing on a thread pool."""
+        mock_api_call.side_effect = mock_scandir_deep
+
+        for max_levels in range(-1, 4):
+            for min_levels in range(-1, 4):
+                outputs = []
+                for workers in (None, 4):
+                    initialise_mock_scandir_data(self._test_root)
+                    parser = get_parser()
+                    parser.scan_path(self._test_root,
+                                     max_levels=max_levels,
+                                     min_levels=min_levels,
+                                     workers=workers)
+                    outputs.append(list(map(str, parser.output())))
+
+                self.assertEqual(outputs[0], outputs[1])
+
+    @mock.patch("seqparse.seqparse.os.scandir")
+    def test_iter_scan(self, mock_api_call):
+        """Seqparse: Test streaming scans, one directory at a time."""
+        mock_api_call.side_effect = mock_scandir_deep
+
+        for max_levels in range(-1, 4):
+            for min_levels in range(-1, 4):
+                initialise_mock_scandir_data(self._test_root)
+                parser = get_parser()
+                parser.scan_path(self._test_root,
+                                 max_levels=max_levels,
+                                 min_levels=min_levels)
+                expected = list(map(str, parser.output()))
+
+                initialise_mock_scandir_data(self._test_root)
+                parser = get_parser()
+                output = parser.iter_scan(self._test_root,
+                                          max_levels=max_levels,
+                                          min_levels=min_levels)
+                self.assertEqual(list(map(str, output)), expected)
+                self.assertFalse(parser.locations)
+
+        tree = {
+            "root": ["root/b", "root/a"],
+            "root/a": [],
+            "root/b": ["root/b/b"],
+            "root/b/b": []
+        }
+
+        def list_dir(search_path, follow_symlinks=True):
+            """Mock'd Seqparse._list_dir for a small directory tree."""
+            dir_entries = [
+                DirEntry(x, is_file=False) for x in tree[search_path]
+            ]
+            file_entries = generate_entries(name="x",
+                                            ext="exr",
+                                            frames={4: [1, 2]},
+                                            root=search_path)
+            return search_path, dir_entries, file_entries
+
+        parser = get_parser()
+        with mock.patch.object(parser, "_list_dir", side_effect=list_dir):
+            output = [x.path for x in parser.iter_scan("root")]
+        self.assertEqual(output, ["root", "root/a", "root/b", "root/b/b"])
+
+    @mock.patch("seqparse.seqparse.os.scandir")
+    def test_async_scan(self, mock_api_call):
+        """Seqparse: Test scanning from an asyncio event loop."""
+        mock_api_call.side_effect = mock_scandir_deep
+
+        for max_levels in range(-1, 4):
+            for min_levels in range(-1, 4):
+                initialise_mock_scandir_data(self._test_root)
+                parser = get_parser()
+                parser.scan_path(self._test_root,
+                                 max_levels=max_levels,
+                                 min_levels=min_levels)
+                expected = list(map(str, parser.output()))
+
+                initialise_mock_scandir_data(self._test_root)
+                parser = get_parser()
+                asyncio.run(
+                    parser.scan_path_async(self._test_root,
+                                           max_levels=max_levels,
+                                           min_levels=min_levels,
+                                           concurrency=2))
+                self.assertEqual(list(map(str, parser.output())), expected)
+
+        async def collect(parser):
+            """Gather the items yielded by an asynchronous scan."""
+            return [
+                str(x)
+                async for x in parser.iter_scan_async(self._test_root)
+            ]
+
+        initialise_mock_scandir_data(self._test_root)
+        parser = get_parser()
+        output = asyncio.run(collect(parser))
+        self.assertEqual(output, list(map(str, parser.output())))
+        self.assertEqual(len(output), 5)
+        self.assertEqual(
+            output[0], os.path.join(self._test_root, "level0_1.0000-0004.exr"))
+
+    def test_process_scan(self):
+        """Seqparse: Test sharding a scan across worker processes."""
+        with tempfile.TemporaryDirectory() as root:
+            file_names = ["top.0001.exr", "top.0002.exr", "readme.txt"]
+            for sub_dir in ("a", "b", os.path.join("b", "c")):
+                file_names.extend(
+                    os.path.join(sub_dir, x) for x in
+                    ("kitty.0001.exr", "kitty.0002.exr", "kitty.0010.exr",
+                     "kitty.10000.exr", "kitty.1.exr", "kitty.2.exr",
+                     "pony.010.jpg", "pony.100.jpg", "singleton.jpg"))
+
+            for file_name in file_names:
+                file_path = os.path.join(root, file_name)
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                with open(file_path, "w", encoding="utf-8") as file_obj:
+                    file_obj.write(file_name)
+
+            for max_levels in range(-1, 3):
+                for min_levels in range(-1, 3):
+                    outputs = []
+                    for processes in (None, 2):
+                        parser = get_parser()
+                        parser.scan_options["stat"] = True
+                        parser.scan_path(root,
+                                         max_levels=max_levels,
+                                         min_levels=min_levels,
+                                         processes=processes)
+                        outputs.append([(str(x), x.size)
+                                        for x in parser.output()])
+
+                    self.assertEqual(outputs[0], outputs[1])
+
+    def test_rescan(self):
+        """Seqparse: Test incremental rescans of previously scanned paths."""
+
+        def touch(*paths):
+            """Create files (and their directories) below the test root."""
+            for path in paths:
+                path = os.path.join(root, path)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "w", encoding="utf-8"):
+                    pass
+
+        def bump(path):
+            """Make sure a directory's modification time has changed."""
+            path = os.path.join(root, path)
+            mtime_ns = os.stat(path).st_mtime_ns + 10**9
+            os.utime(path, ns=(mtime_ns, mtime_ns))
+
+        with tempfile.TemporaryDirectory() as root:
+            touch("top.0001.exr", "a/kitty.0001.exr", "a/kitty.0002.exr",
+                  "b/pony.0001.jpg", "b/c/pony.0001.jpg")
+
+            parser = get_parser()
+            parser.scan_options["incremental"] = True
+            parser.scan_path(root)
+            self.assertEqual(len(list(parser.output())), 4)
+
+            with mock.patch.object(parser,
+                                   "_list_dir",
+                                   wraps=parser._list_dir) as list_dir:
+                self.assertEqual(parser.rescan(), set())
+                self.assertFalse(list_dir.called)
+
+                touch("a/kitty.0003.exr", "a/d/dog.0001.exr")
+                os.remove(os.path.join(root, "b", "c", "pony.0001.jpg"))
+                os.rmdir(os.path.join(root, "b", "c"))
+                bump("a")
+                bump("b")
+
+                changed = parser.rescan()
+                self.assertEqual(
+                    changed, {
+                        os.path.join(root, "a"),
+                        os.path.join(root, "a", "d"),
+                        os.path.join(root, "b"),
+                        os.path.join(root, "b", "c")
+                    })
+                self.assertEqual(list_dir.call_count, 3)
+
+            expected = get_parser()
+            expected.scan_path(root)
+            self.assertEqual(list(map(str, parser.output())),
+                             list(map(str, expected.output())))
+
+            shutil.rmtree(os.path.join(root, "a"))
+            bump("")
+            self.assertEqual(parser.rescan(), {
+                root,
+                os.path.join(root, "a"),
+                os.path.join(root, "a", "d")
+            })
+            self.assertEqual(
+                list(map(str, parser.output())),
+                [os.path.join(root, "top.0001.exr"),
+                 os.path.join(root, "b", "pony.0001.jpg")])
+
+    def test_index(self):
+        """Seqparse: Test saving and loading SQLite indexes."""
+        with tempfile.TemporaryDirectory() as root:
+            search_path = os.path.join(root, "shots")
+            index_path = os.path.join(root, "index.db")
+
+            for file_name in ("kitty.0001.exr", "kitty.0002.exr",
+                              "kitty.10000.exr", "kitty_0001.exr",
+                              "sub/pony.01.jpg"):
+                file_path = os.path.join(search_path, file_name)
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                with open(file_path, "w", encoding="utf-8") as file_obj:
+                    file_obj.write(file_name)
+
+            parser = get_parser()
+            parser.scan_options.update(incremental=True, stat=True)
+            parser.scan_path(search_path)
+            parser.save_index(index_path)
+            expected = [(str(x), x.size) for x in parser.output()]
+
+            loaded = get_parser()
+            self.assertEqual(loaded.load_index(index_path), set())
+            self.assertEqual([(str(x), x.size) for x in loaded.output()],
+                             expected)
+            self.assertEqual(loaded.scan_options, parser.scan_options)
+            self.assertEqual(loaded.scan_roots, {search_path: (-1, -1)})
+
+            # Changes on disk are picked up when the index is validated.
+            sub_dir = os.path.join(search_path, "sub")
+            with open(os.path.join(sub_dir, "pony.02.jpg"), "w",
+                      encoding="utf-8"):
+                pass
+            mtime_ns = os.stat(sub_dir).st_mtime_ns + 10**9
+            os.utime(sub_dir, ns=(mtime_ns, mtime_ns))
+
+            loaded = get_parser()
+            self.assertEqual(loaded.load_index(index_path, validate=False),
+                             set())
+            self.assertEqual(len(list(loaded.output())), 3)
+            loaded = get_parser()
+            self.assertEqual(loaded.load_index(index_path), {sub_dir})
+            self.assertEqual(str(list(loaded.output())[-1]),
+                             os.path.join(sub_dir, "pony.01,02.jpg"))
+
+            # Indexes only load into instances with the same naming grammars.
+            grammars = [DEFAULT_GRAMMAR, NamingGrammar("_", r"[^\.]+")]
+            with self.assertRaises(ValueError):
+                get_parser(grammars=grammars).load_index(index_path)
+
+            parser = get_parser(grammars=grammars)
+            parser.scan_path(search_path)
+            parser.save_index(index_path)
+            loaded = get_parser(grammars=grammars)
+            loaded.load_index(index_path, validate=False)
+            self.assertEqual(list(map(str, loaded.output())),
+                             list(map(str, parser.output())))
+            with self.assertRaises(ValueError):
+                get_parser().load_index(index_path)
+
+            with self.assertRaises(ValueError):
+                loaded.load_index(os.path.join(root, "missing.db"))
+            with self.assertRaises(ValueError):
+                loaded.load_index(os.path.join(sub_dir, "pony.01.jpg"))
+
+    def test_walk_order(self):
+        """Seqparse: Test iterative depth- and breadth-first traversal."""
+        tree = {
+            "root": ["root/a", "root/b"],
+            "root/a": ["root/a/a1"],
+            "root/a/a1": [],
+            "root/b": []
+        }
+
+        def list_dir(search_path, follow_symlinks=True):
+            """Mock'd Seqparse._list_dir for a small directory tree."""
+            dir_entries = [
+                DirEntry(x, is_file=False) for x in tree[search_path]
+            ]
+            return search_path, dir_entries, []
+
+        parser = get_parser()
+        with mock.patch.object(parser, "_list_dir", side_effect=list_dir):
+            walked = [(x[0], x[3]) for x in parser._scandir_walk("root")]
+            self.assertEqual(walked, [("root", 0), ("root/a", 1),
+                                      ("root/a/a1", 2), ("root/b", 1)])
+
+            walker = parser._scandir_walk("root", breadth_first=True)
+            walked = [(x[0], x[3]) for x in walker]
+            self.assertEqual(walked, [("root", 0), ("root/a", 1),
+                                      ("root/b", 1), ("root/a/a1", 2)])
+
+    def test_deep_scan(self):
+        """Seqparse: Test scanning a tree deeper than the recursion limit."""
+        depth = 2000
+
+        def list_dir(search_path, follow_symlinks=True):
+            """Mock'd Seqparse._list_dir for a single, very deep branch."""
+            level = search_path.count("/")
+            dir_entries = []
+            if level < depth:
+                dir_entries.append(
+                    DirEntry(f"{search_path}/d", is_file=False))
+            file_entries = generate_entries(ext="exr",
+                                            frames={4: [level]},
+                                            root=search_path)
+            return search_path, dir_entries, file_entries
+
+        for breadth_first in (False, True):
+            parser = get_parser()
+            with mock.patch.object(parser,
+                                   "_list_dir",
+                                   side_effect=list_dir):
+                parser.scan_path("root",
+                                 max_levels=depth - 1,
+                                 breadth_first=breadth_first)
+
+            output = list(parser.output())
+            self.assertEqual(len(output), depth)
+            self.assertEqual(str(output[-1]),
+                             "root" + "/d" * (depth - 1) + "/dog.1999.exr")
+
     def test_valid_frame_sequences(self):
         """Seqparse: Test validity of simple frame ranges."""
         good_frame_seqs = [
@@ -297,6 +626,462 @@ class TestSeqparseModule(unittest.TestCase):
 
         print("")
 
+    def test_merge(self):
+        """Seqparse: Test merging the contents of two instances."""
+        file_names = [[
+            "kitty.0001-0003.exr", "kitty.0010.exr", "kitty.5.exr",
+            "sub/pony.01-04.jpg", "singleton.jpg"
+        ], ["kitty.0004.exr", "kitty.10000.exr", "kitty_0001.exr",
+            "sub/pony.05.jpg", "sub/dog.0001.exr", "sub/other.jpg"]]
+
+        parsers = []
+        for names in file_names:
+            parser = get_parser()
+            for file_name in names:
+                parser.add_file(os.path.join(self._test_root, file_name))
+            parsers.append(parser)
+
+        sub_dir = os.path.join(self._test_root, "sub")
+        stat = os.stat(__file__)
+        parsers[1].sequences[sub_dir]["dog"]["exr"][4].cache_stat(1, stat)
+        parsers[1].singletons[sub_dir].cache_stat("other.jpg", stat)
+
+        expected = get_parser()
+        for file_name in file_names[0] + file_names[1]:
+            expected.add_file(os.path.join(self._test_root, file_name))
+
+        merged, other = parsers
+        merged.merge(other)
+        self.assertEqual(list(map(str, merged.output())),
+                         list(map(str, expected.output())))
+        self.assertEqual(len(list(other.output())), 5)
+
+        kitty = list(merged.sequences[self._test_root]["kitty"].output())
+        self.assertEqual(str(kitty[-1]),
+                         os.path.join(self._test_root,
+                                      "kitty.0001-0004,0010,10000.exr"))
+        dog = list(merged.sequences[sub_dir]["dog"].output())
+        self.assertEqual(dog[0].size, stat.st_size)
+        self.assertEqual(merged.singletons[sub_dir].stat("other.jpg"), stat)
+
+        merged = get_parser()
+        merged |= other
+        self.assertEqual(list(map(str, merged.output())),
+                         list(map(str, other.output())))
+
+        with self.assertRaises(TypeError):
+            merged.merge(FrameSequence("0001"))
+
+    def test_consolidation(self):
+        """Seqparse: Test zero-padding consolidation as files are added."""
+        file_names = [
+            os.path.join(self._test_root, x)
+            for x in ("kitty.5.exr", "kitty.1000.exr", "kitty.1001.exr",
+                      "kitty.0001.exr")
+        ]
+        expected = [
+            os.path.join(self._test_root, x)
+            for x in ("kitty.5.exr", "kitty.0001,1000,1001.exr")
+        ]
+
+        parser = get_parser()
+        parser.add_files(file_names[:3])
+        self.assertEqual(parser.stats.sequences, 1)
+        self.assertEqual(
+            list(map(str, parser.output())),
+            [os.path.join(self._test_root, "kitty.5,1000,1001.exr")])
+
+        # The result doesn't depend on the order in which files are added,
+        # or how instances are combined.
+        for names in itertools.permutations(file_names):
+            parser = get_parser()
+            for file_name in names:
+                parser.add_file(file_name)
+            self.assertEqual(list(map(str, parser.output())), expected)
+            self.assertEqual(parser.stats.sequences, 2)
+
+            for index in range(1, len(names)):
+                parsers = [get_parser(), get_parser()]
+                parsers[0].add_files(names[:index])
+                parsers[1].add_files(names[index:])
+                parsers[0].merge(parsers[1])
+                self.assertEqual(list(map(str, parsers[0].output())),
+                                 expected)
+
+                imported = get_parser()
+                for other in parsers[::-1]:
+                    imported._import_locations(  # pylint: disable=W0212
+                        other._export_locations())  # pylint: disable=W0212
+                self.assertEqual(list(map(str, imported.output())), expected)
+
+        # Output is a pure read.
+        with mock.patch.object(FileExtension, "consolidate") as consolidate:
+            self.assertEqual(list(map(str, parser.output())), expected)
+            self.assertFalse(consolidate.called)
+
+    def test_concurrent_output(self):
+        """Seqparse: Test outputting an instance from several threads."""
+        file_names = []
+        for index in range(40):
+            file_names.extend(
+                os.path.join(self._test_root, f"dir{index % 4}",
+                             f"shot{index}.{x:04d}.exr")
+                for x in range(1, 500, index % 5 + 1))
+            file_names.append(
+                os.path.join(self._test_root, f"shot{index}.10000.exr"))
+            file_names.append(
+                os.path.join(self._test_root, f"notes{index}.txt"))
+
+        def get_output(parser, missing):
+            """Output the (uncalculated) contents of an instance."""
+            barrier.wait()
+            return list(map(str, parser.output(missing=missing)))
+
+        num_threads = 8
+        for missing in (False, True):
+            expected = get_parser()
+            expected.add_files(file_names)
+            expected = list(map(str, expected.output(missing=missing)))
+
+            parser = get_parser()
+            parser.add_files(file_names)
+            barrier = threading.Barrier(num_threads)
+            with ThreadPoolExecutor(max_workers=num_threads) as executor:
+                futures = [
+                    executor.submit(get_output, parser, missing)
+                    for _ in range(num_threads)
+                ]
+                output = [x.result() for x in futures]
+
+            self.assertEqual(output, [expected] * num_threads)
+
+    def test_add_files(self):
+        """Seqparse: Test adding many files via seqparse.add_files."""
+        file_names = [
+            "kitty.0001.exr", "sub/pony.01.jpg", "kitty.0002.exr",
+            "kitty.0010.exr", "kitty.5.exr", "sub/pony.02.jpg",
+            "kitty.0001-0003.exr", "singleton.jpg", "sub/.0001.exr",
+            "sub/0001.exr", "kitty_0004.exr"
+        ]
+        file_names = [os.path.join(self._test_root, x) for x in file_names]
+
+        expected = get_parser()
+        for file_name in file_names:
+            expected.add_file(file_name)
+
+        for batch_size in (1, 3, 100):
+            parser = get_parser()
+            with mock.patch("seqparse.seqparse.os.stat") as mock_api_call:
+                parser.add_files(iter(file_names), batch_size=batch_size)
+                self.assertFalse(mock_api_call.called)
+            self.assertEqual(list(map(str, parser.output())),
+                             list(map(str, expected.output())))
+
+        # Files are only stat'd on request.
+        parser = get_parser()
+        parser.scan_options["stat"] = True
+        parser.add_files([__file__])
+        output = list(parser.output())
+        self.assertEqual(output[0].size, os.stat(__file__).st_size)
+
+    def test_load_manifest(self):
+        """Seqparse: Test loading files and stats from a stat manifest."""
+        root_dir = os.path.join(self._test_root, "dir with spaces")
+        manifest = [
+            f"100 1490908305.5 1490908306 {root_dir}/kitty.0001.exr\n",
+            f"200 1490908300 1490908310.25 {root_dir}/kitty.0002.exr\n", "\n",
+            f"300 1490997828 1490997828 {root_dir}/pony jumps.jpg\n",
+            f"400 1490997828 1490997828 {root_dir}/dog.0001-0003.exr\n"
+        ]
+
+        parser = get_parser()
+        parser.scan_options["stat"] = True
+        with mock.patch("seqparse.seqparse.os.stat") as mock_api_call:
+            parser.load_manifest(iter(manifest), batch_size=2)
+            self.assertFalse(mock_api_call.called)
+
+        # Files named after a frame range have no stats for any one frame.
+        dog, kitty, pony = list(parser.output())
+        self.assertEqual(str(dog), os.path.join(root_dir, "dog.0001-0003.exr"))
+        self.assertIsNone(dog.size)
+        self.assertEqual(str(kitty), os.path.join(root_dir,
+                                                  "kitty.0001,0002.exr"))
+        self.assertEqual((kitty.size, kitty.mtime, kitty.ctime),
+                         (300, 1490908305.5, 1490908310.25))
+        self.assertEqual(str(pony), os.path.join(root_dir, "pony jumps.jpg"))
+        self.assertEqual((pony.size, pony.mtime), (300, 1490997828))
+
+        # Custom column layouts and separators.
+        parser = get_parser()
+        columns = ("ino", None, None, "size", "mtime", None, "path")
+        parser.load_manifest(
+            [f"12 0 0 10 1490908305 -- {root_dir}/kitty.0003.exr"],
+            columns=columns)
+        kitty = list(parser.output())[0]
+        self.assertEqual((kitty.size, kitty.mtime), (10, 1490908305))
+        self.assertEqual(kitty.stat(3).st_ino, 12)
+
+        parser = get_parser()
+        parser.load_manifest([f"10|{root_dir}/kitty|0004.exr"],
+                             columns=("size", "path"),
+                             sep="|")
+        self.assertEqual(str(list(parser.output())[0]),
+                         os.path.join(root_dir, "kitty|0004.exr"))
+
+        with self.assertRaises(ValueError):
+            parser.load_manifest(["10 kitty.0001.exr"],
+                                 columns=("path", "size"))
+        with self.assertRaises(ValueError):
+            parser.load_manifest(["10 kitty.0001.exr"],
+                                 columns=("bogus", "path"))
+        with self.assertRaises(ValueError):
+            parser.load_manifest(["ten kitty.0001.exr"],
+                                 columns=("size", "path"))
+        with self.assertRaises(ValueError):
+            parser.load_manifest(["10 20"], columns=("size", "mtime", "path"))
+
+    def test_stat_policy(self):
+        """Seqparse: Test the number of system calls made by stat policies."""
+
+        def scan(d_type=True, **options):
+            """Scan a mock'd directory, return the output and system calls."""
+            entries = [
+                SyscallDirEntry(os.path.join(self._test_root, x),
+                                d_type=d_type)
+                for x in ("kitty.0001.exr", "kitty.0002.exr", "notes.txt")
+            ]
+            entries.extend([
+                SyscallDirEntry(os.path.join(self._test_root,
+                                             "kitty.0003.exr"),
+                                kind="link",
+                                target="file",
+                                d_type=d_type),
+                SyscallDirEntry(os.path.join(self._test_root, "sub"),
+                                kind="link",
+                                target="dir",
+                                d_type=d_type)
+            ])
+
+            parser = get_parser()
+            parser.scan_options.update(options)
+            with mock.patch("seqparse.seqparse.os.scandir") as mock_api_call:
+                mock_api_call.side_effect = [entries, []]
+                parser.scan_path(self._test_root)
+
+            syscalls = sum((x.syscalls for x in entries), [])
+            return list(map(str, parser.output())), syscalls
+
+        kitty = os.path.join(self._test_root, "kitty.0001-0003.exr")
+        notes = os.path.join(self._test_root, "notes.txt")
+        sub_dir = os.path.join(self._test_root, "sub")
+
+        # Only the symlinks are stat'd to find out what they are.
+        output, syscalls = scan()
+        self.assertEqual(output, [kitty, notes])
+        self.assertEqual(sorted(syscalls), ["stat", "stat"])
+
+        output, syscalls = scan(stat=True)
+        self.assertEqual(output, [kitty, notes])
+        self.assertEqual(sorted(syscalls), ["lstat"] * 3 + ["stat"] * 2)
+
+        # Singletons aren't stat'd.
+        output, syscalls = scan(stat="sequences")
+        self.assertEqual(output, [kitty, notes])
+        self.assertEqual(sorted(syscalls), ["lstat"] * 2 + ["stat"] * 2)
+
+        # Symlinks are listed as files, and never followed.
+        output, syscalls = scan(follow_symlinks=False, stat="sequences")
+        self.assertEqual(output, [kitty, notes, sub_dir])
+        self.assertEqual(syscalls, ["lstat"] * 3)
+
+        output, syscalls = scan(follow_symlinks=False)
+        self.assertEqual(syscalls, [])
+
+        # Without file types from the directory listing, everything needs to
+        # be lstat'd -- but only once.
+        output, syscalls = scan(d_type=False, follow_symlinks=False, stat=True)
+        self.assertEqual(output, [kitty, notes, sub_dir])
+        self.assertEqual(syscalls, ["lstat"] * 5)
+
+    def test_output_order(self):
+        """Seqparse: Test the cached sort order of seqparse.output."""
+        parser = get_parser()
+        parser.add_files(
+            os.path.join(self._test_root, x)
+            for x in ("sub/pony.0001.exr", "kitty.0002.exr", "kitty.0001.jpg",
+                      "cat.0001.exr", "notes.txt", "kitty.0001.exr"))
+
+        expected = [
+            os.path.join(self._test_root, x)
+            for x in ("cat.0001.exr", "kitty.0001,0002.exr", "kitty.0001.jpg",
+                      "notes.txt", "sub/pony.0001.exr")
+        ]
+        self.assertEqual(list(map(str, parser.output())), expected)
+
+        # Nothing needs to be sorted again ...
+        with mock.patch("seqparse.seqparse._get_container_key") as get_key:
+            with mock.patch.object(parser.locations, "nodes") as nodes:
+                self.assertEqual(list(map(str, parser.output())), expected)
+                self.assertFalse(get_key.called or nodes.called)
+
+        # ... until files are added to (or directories dropped from) the
+        # instance.
+        parser.add_files(
+            os.path.join(self._test_root, x)
+            for x in ("sub/aardvark.0001.exr", "bat.txt", "dog.0001.exr"))
+        parser.add_file(os.path.join(self._test_root, "ant", "a.0001.exr"))
+        self.assertEqual(list(map(str, parser.output())), [
+            os.path.join(self._test_root, x)
+            for x in ("cat.0001.exr", "dog.0001.exr", "kitty.0001,0002.exr",
+                      "kitty.0001.jpg", "bat.txt", "notes.txt",
+                      "ant/a.0001.exr", "sub/aardvark.0001.exr",
+                      "sub/pony.0001.exr")
+        ])
+
+        parser._drop_location(self._test_root)  # pylint: disable=W0212
+        self.assertEqual(list(map(str, parser.output(seqs_only=True))), [
+            os.path.join(self._test_root, x)
+            for x in ("ant/a.0001.exr", "sub/aardvark.0001.exr",
+                      "sub/pony.0001.exr")
+        ])
+
+    def test_scan_filters(self):
+        """Seqparse: Test the include and exclude scan options."""
+        with tempfile.TemporaryDirectory() as root:
+            for file_name in ("kitty.0001.exr", "kitty.0002.exr",
+                              "kitty.0001.jpg", "notes.txt", "tmp/a.0001.exr",
+                              "sub/cache/b.0001.exr", "sub/c.0001.exr",
+                              "sub/cache.exr"):
+                file_path = os.path.join(root, file_name)
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                with open(file_path, "w", encoding="utf-8"):
+                    pass
+
+            expected = [
+                os.path.join(root, "kitty.0001,0002.exr"),
+                os.path.join(root, "sub", "c.0001.exr"),
+                os.path.join(root, "sub", "cache.exr")
+            ]
+
+            parser = get_parser()
+            parser.scan_options.update(exclude=["tmp", "cache"],
+                                       include=["*.exr"])
+            with mock.patch.object(parser,
+                                   "_list_dir",
+                                   wraps=parser._list_dir) as list_dir:
+                parser.scan_path(root)
+
+            # Excluded directories are never listed.
+            self.assertEqual(list(map(str, parser.output())), expected)
+            self.assertEqual(sorted(x[0][0] for x in list_dir.call_args_list),
+                             [root, os.path.join(root, "sub")])
+
+            # Patterns apply to names, rather than paths.
+            parser = get_parser()
+            parser.scan_options.update(exclude=[r"re:(?!c\.)\w+\.0001"])
+            output = list(map(str, parser.iter_scan(root)))
+            self.assertEqual(output, [
+                os.path.join(root, "kitty.0002.exr"),
+                os.path.join(root, "notes.txt"),
+                os.path.join(root, "sub", "c.0001.exr"),
+                os.path.join(root, "sub", "cache.exr")
+            ])
+
+            parser = get_parser()
+            parser.scan_options.update(exclude=("tmp", "cache"),
+                                       include=("*.exr", ))
+            parser.scan_path(root, processes=2)
+            self.assertEqual(list(map(str, parser.output())), expected)
+
+            # Directory patterns keep the files anywhere below matching
+            # directories, which are searched for wherever they are.
+            parser = get_parser()
+            parser.scan_options.update(include=["*.exr"],
+                                       include_dirs=["sub"])
+            parser.scan_path(root)
+            self.assertEqual(list(map(str, parser.output())), [
+                os.path.join(root, "sub", "c.0001.exr"),
+                os.path.join(root, "sub", "cache.exr"),
+                os.path.join(root, "sub", "cache", "b.0001.exr")
+            ])
+
+            parser = get_parser()
+            parser.scan_options.update(include_dirs=["re:c[a-z]+$"])
+            output = list(map(str, parser.iter_scan(root)))
+            expected = os.path.join(root, "sub", "cache", "b.0001.exr")
+            self.assertEqual(output, [expected])
+
+    def test_stats(self):
+        """Seqparse: Test the live counters of seqparse.stats."""
+
+        def count(parser):
+            """Count the contents of a parser the hard way."""
+            seqs = [
+                fseq for container in parser.locations.values()
+                for fext in container["seqs"].values()
+                for fseq in fext.values() for fseq in fseq.values()
+            ]
+            files = [x["files"] for x in parser.locations.values()]
+            stats = [x.stat() for x in seqs + files]
+            return (len(parser.locations), len(seqs), sum(map(len, files)),
+                    sum(map(len, seqs)),
+                    sum(x.st_size for y in stats for x in y.values()))
+
+        with tempfile.TemporaryDirectory() as root:
+            for file_name in ("kitty.0001.exr", "kitty.0002.exr",
+                              "kitty.5.exr", "a/pony.01.jpg", "a/notes.txt",
+                              "a/b/dog.0001.exr"):
+                file_path = os.path.join(root, file_name)
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                with open(file_path, "w", encoding="utf-8") as file_obj:
+                    file_obj.write(file_name)
+
+            parser = get_parser()
+            parser.scan_options.update(incremental=True, stat=True)
+            parser.scan_path(root)
+            self.assertEqual(parser.stats, count(parser))
+            self.assertEqual(tuple(parser.stats), (3, 4, 1, 5, 79))
+            self.assertEqual(parser.stats.size, 79)
+
+            # Re-adding files (and their stats) doesn't count them twice.
+            parser.add_file(os.path.join(root, "kitty.0001.exr"))
+            parser.add_file(os.path.join(root, "a", "notes.txt"))
+            parser.add_file(os.path.join(root, "a", "pony.01.jpg"))
+            self.assertEqual(parser.stats, count(parser))
+            self.assertEqual(tuple(parser.stats), (3, 4, 1, 5, 79))
+
+            shutil.rmtree(os.path.join(root, "a", "b"))
+            os.remove(os.path.join(root, "kitty.0002.exr"))
+            parser.rescan()
+            self.assertEqual(parser.stats, count(parser))
+            self.assertEqual(tuple(parser.stats), (2, 3, 1, 3, 49))
+
+            merged = get_parser()
+            merged.add_file(os.path.join(root, "kitty.0010.exr"))
+            merged |= parser
+            merged |= parser
+            self.assertEqual(merged.stats, count(merged))
+            self.assertEqual(merged.stats.frames, 4)
+
+            # Sequences merged by zero-padding consolidation aren't counted.
+            merged.add_file(os.path.join(root, "kitty.10.exr"))
+            self.assertEqual(merged.stats, count(merged))
+            self.assertEqual(merged.stats.sequences, 3)
+
+            # Scans sharded across processes are imported.
+            parser = get_parser()
+            parser.scan_path(root, processes=2)
+            self.assertEqual(parser.stats, count(parser))
+            self.assertEqual(repr(parser), (
+                "Seqparse(locations=2, sequences=3, singletons=1, frames=3)"))
+
+        # Buffered (columnar) records are grouped before they're counted.
+        parser = get_parser(columnar=True)
+        parser.add_files(
+            os.path.join(self._test_root, x)
+            for x in ("kitty.0001.exr", "kitty.0002.exr", "pony.jpg"))
+        self.assertEqual(tuple(parser.stats), (1, 1, 1, 2, 0))
+
     def test_add_file_sequence(self):
         """Seqparse: Test file sequence addition via seqparse.add_file."""
         input_file = ".".join((self._test_file_name, "0005", self._test_ext))
@@ -465,6 +1250,71 @@ class TestSeqparseModule(unittest.TestCase):
         self.assertEqual(len(output), 3)
         self.assertEqual(list(map(str, output)), expected)
 
+    def test_naming_grammars(self):
+        """Seqparse: Test file discovery with multiple naming grammars."""
+        grammars = [
+            DEFAULT_GRAMMAR,
+            NamingGrammar("_", r"[^\.]+"),
+            NamingGrammar("", r"[^\.]+"),
+            NamingGrammar(".", r"[^\.]+\.gz")
+        ]
+
+        file_names = [
+            "kitty.0001.exr", "kitty.0002.exr", "kitty_0003.exr",
+            "kitty_0004.exr", "kitty0005.exr", "pony.0001.exr.gz",
+            "pony.0002.exr.gz", "pony.jpg"
+        ]
+
+        parser = get_parser(grammars=grammars)
+        for file_name in file_names:
+            parser.add_file(os.path.join(self._test_root, file_name))
+
+        expected = [
+            "kitty.0001,0002.exr", "kitty_0003,0004.exr", "kitty0005.exr",
+            "pony.0001,0002.exr.gz", "pony.jpg"
+        ]
+        expected = [os.path.join(self._test_root, x) for x in expected]
+        self.assertEqual(list(map(str, parser.output())), expected)
+
+        seqs = parser.sequences[self._test_root]
+        self.assertEqual(seqs["kitty"].sep, ".")
+        self.assertEqual(seqs[("kitty", "_")].sep, "_")
+        self.assertEqual(seqs[("kitty", "")].sep, "")
+
+        # Output file sequences re-parse with the grammars of the instance.
+        for fseq in parser.output(seqs_only=True):
+            clone = FileSequence(str(fseq), grammars=parser.grammars)
+            self.assertEqual((clone.name, clone.sep, clone.pretty_frames),
+                             (fseq.name, fseq.sep, fseq.pretty_frames))
+
+        # Grammars belong to the instance, not the class.
+        other = Seqparse()
+        self.assertEqual(other.grammars, (DEFAULT_GRAMMAR,))
+        other.add_file(os.path.join(self._test_root, "kitty_0003.exr"))
+        self.assertEqual(list(map(str, other.output())),
+                         [os.path.join(self._test_root, "kitty_0003.exr")])
+
+        # ... and are shared with worker processes and streaming scans.
+        with tempfile.TemporaryDirectory() as root:
+            for file_name in file_names:
+                file_path = os.path.join(root, "sub", file_name)
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                with open(file_path, "w", encoding="utf-8") as file_obj:
+                    file_obj.write(file_name)
+
+            expected = [
+                os.path.join(root, "sub", os.path.basename(x))
+                for x in expected
+            ]
+
+            parser = get_parser(grammars=grammars)
+            parser.scan_path(root, processes=2)
+            self.assertEqual(list(map(str, parser.output())), expected)
+
+            parser = get_parser(grammars=grammars)
+            self.assertEqual(list(map(str, parser.iter_scan(root))),
+                             expected)
+
     def test_api_calls(self):
         """Seqparse: Test API calls at root of module."""
         chunk = FrameChunk(first=1, last=7, step=2, pad=4)
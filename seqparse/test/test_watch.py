@@ -0,0 +1,109 @@
+"""Test keeping parsers in sync with the disk (seqparse.watch)."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from .. import get_parser
+from ..watch import (_get_libc, get_watcher, InotifyWatcher, PollingWatcher,
+                     Watcher)
+
+
+def has_inotify():
+    """Whether inotify is available on this system."""
+    try:
+        _get_libc()
+    except OSError:
+        return False
+    return True
+
+
+###############################################################################
+# class: TestWatchers
+
+
+class TestWatchers(unittest.TestCase):
+    """Test the watchers of the seqparse module."""
+
+    def setUp(self):
+        """Set up a directory tree for each test."""
+        self._root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self._root)
+        self.touch("kitty.0001.exr", "sub/pony.0001.jpg")
+
+        self._parser = get_parser()
+        self._parser.scan_options["incremental"] = True
+        self._parser.scan_path(self._root)
+
+    def output(self):
+        """Current output of the parser, relative to the test root."""
+        return [
+            os.path.relpath(str(x), self._root)
+            for x in self._parser.output()
+        ]
+
+    def touch(self, *paths):
+        """Create files (and their directories) below the test root."""
+        for path in paths:
+            path = os.path.join(self._root, path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8"):
+                pass
+
+    def bump(self, path):
+        """Make sure a directory's modification time has changed."""
+        path = os.path.join(self._root, path)
+        mtime_ns = os.stat(path).st_mtime_ns + 10**9
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def check_watcher(self, watcher):
+        """Make sure the watcher keeps the parser up to date."""
+        sub_dir = os.path.join(self._root, "sub")
+        new_dir = os.path.join(self._root, "new")
+
+        self.assertEqual(watcher.read_batch(timeout=0), set())
+
+        self.touch("kitty.0002.exr", "new/dog.0001.exr")
+        os.remove(os.path.join(sub_dir, "pony.0001.jpg"))
+        os.rmdir(sub_dir)
+        self.bump("")
+
+        changed = set()
+        while new_dir not in changed:
+            batch = watcher.read_batch(timeout=5)
+            self.assertTrue(batch)
+            changed.update(batch)
+
+        self.assertEqual(changed, {self._root, sub_dir, new_dir})
+        self.assertEqual(self.output(),
+                         ["kitty.0001,0002.exr", "new/dog.0001.exr"])
+
+        self.touch("new/dog.0002.exr")
+        self.bump("new")
+        self.assertEqual(watcher.read_batch(timeout=5), {new_dir})
+        self.assertEqual(self.output(),
+                         ["kitty.0001,0002.exr", "new/dog.0001,0002.exr"])
+
+    def test_polling_watcher(self):
+        """Watch: Test the polling watcher."""
+        with PollingWatcher(self._parser, interval=0.01) as watcher:
+            self.check_watcher(watcher)
+
+    @unittest.skipUnless(has_inotify(), "inotify is not available")
+    def test_inotify_watcher(self):
+        """Watch: Test the inotify watcher."""
+        with InotifyWatcher(self._parser, latency=0.05) as watcher:
+            self.check_watcher(watcher)
+
+    def test_get_watcher(self):
+        """Watch: Test watcher creation."""
+        with get_watcher(self._parser, polling=True) as watcher:
+            self.assertIsInstance(watcher, PollingWatcher)
+        with get_watcher(self._parser) as watcher:
+            self.assertIsInstance(watcher, Watcher)
+
+        with self.assertRaises(ValueError):
+            get_watcher(get_parser())
+        with self.assertRaises(TypeError):
+            Watcher(self._parser)  # pylint: disable=E0110
@@ -0,0 +1,393 @@
+"""Keep Seqparse instances in sync with changes made on disk."""
+
+import abc
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import time
+
+__all__ = ("get_watcher", "InotifyWatcher", "PollingWatcher", "Watcher")
+
+# Constants from <sys/inotify.h>.
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CLOSE_WRITE = 0x00000008
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+WATCH_MASK = (IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVED_FROM
+              | IN_MOVED_TO | IN_MOVE_SELF | IN_ONLYDIR)
+
+_EVENT = struct.Struct("iIII")
+
+###############################################################################
+# Class: Watcher
+
+
+class Watcher(abc.ABC):
+    """
+    Base class for keeping a Seqparse instance in sync with the disk.
+
+    Watchers track the directories scanned by the instance with the
+    "incremental" scan option enabled (see Seqparse.rescan). Iterating over a
+    watcher blocks until changes have been made on disk, then yields the set of
+    directories that have been updated in the instance.
+
+    Args:
+        parser (Seqparse): The instance that you'd like to keep up to date.
+    """
+
+    def __init__(self, parser):
+        """Initialise the instance."""
+        if not parser.scan_options["incremental"]:
+            raise ValueError(
+                'Watched instances must enable the "incremental" scan option.')
+        self._parser = parser
+
+    def __enter__(self):
+        """Enter the runtime context for the instance."""
+        return self
+
+    def __exit__(self, *args):
+        """Exit the runtime context for the instance."""
+        self.close()
+
+    def __iter__(self):
+        """Yield sets of updated directories, as changes are made on disk."""
+        while True:
+            changed = self.read_batch()
+            if changed:
+                yield changed
+
+    @property
+    def parser(self):
+        """Seqparse: The instance kept in sync by the watcher."""
+        return self._parser
+
+    def close(self):
+        """
+        Stop watching the disk for changes.
+
+        Returns:
+            None
+        """
+
+    @abc.abstractmethod
+    def read_batch(self, timeout=None):
+        """
+        Wait for changes on disk, then update the parser.
+
+        Args:
+            timeout (float, optional): Maximum number of seconds to wait for
+                changes. Defaults to None (wait indefinitely).
+
+        Returns:
+            set of str directories that have been updated (empty if the
+            timeout expired).
+        """
+
+
+###############################################################################
+# Class: InotifyWatcher
+
+
+class InotifyWatcher(Watcher):
+    """
+    Watcher driven by Linux inotify events.
+
+    Events are batched: once an event has been received, further events are
+    collected for the specified latency, and each affected directory is then
+    re-listed (once).
+
+    Args:
+        parser (Seqparse): The instance that you'd like to keep up to date.
+        latency (float, optional): Number of seconds over which events are
+            coalesced. Defaults to 0.1.
+
+    Raises:
+        OSError: If inotify isn't available on this system.
+    """
+
+    def __init__(self, parser, latency=0.1):
+        """Initialise the instance."""
+        super().__init__(parser)
+
+        self._libc = _get_libc()
+        self._latency = latency
+        self._mask = WATCH_MASK
+        if parser.scan_options["stat"]:
+            # Keep disk stats up to date, too.
+            self._mask |= IN_CLOSE_WRITE
+
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+        self._dirs = {}
+        self._wds = {}
+
+        try:
+            # Anything that changed before the watches were added will be
+            # reported by the first batch.
+            self._pending = self._sync_watches(
+                self.parser._scanned)  # pylint: disable=W0212
+        except OSError:
+            self.close()
+            raise
+
+    def close(self):
+        """
+        Stop watching the disk for changes.
+
+        Returns:
+            None
+        """
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._dirs.clear()
+        self._wds.clear()
+
+    def read_batch(self, timeout=None):
+        """
+        Wait for changes on disk, then update the parser.
+
+        Args:
+            timeout (float, optional): Maximum number of seconds to wait for
+                changes. Defaults to None (wait indefinitely).
+
+        Returns:
+            set of str directories that have been updated (empty if the
+            timeout expired).
+        """
+        if self._pending:
+            changed, self._pending = self._pending, set()
+            return changed
+
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return set()
+
+        dir_names = set()
+        overflow = False
+        deadline = time.monotonic() + self._latency
+
+        while True:
+            for wd, mask in self._read_events():
+                overflow = overflow or bool(mask & IN_Q_OVERFLOW)
+                if wd in self._wds:
+                    dir_names.add(self._wds[wd])
+                if mask & IN_IGNORED:
+                    # The kernel has removed the watch.
+                    self._dirs.pop(self._wds.pop(wd, None), None)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if not select.select([self._fd], [], [], remaining)[0]:
+                break
+
+        # pylint: disable=W0212
+        if overflow:
+            # Events have been lost: check every directory.
+            changed = self.parser._rescan_dirs(
+                self.parser._scanned, force=self.parser.scan_options["stat"])
+        else:
+            changed = self.parser._rescan_dirs(dir_names, force=True)
+
+        return changed | self._sync_watches(changed)
+
+    def _add_watch(self, dir_name):
+        """
+        Watch the specified directory.
+
+        Args:
+            dir_name (str): The directory that you'd like to watch.
+
+        Returns:
+            bool, whether the directory is being watched.
+        """
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dir_name),
+                                          self._mask)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR):
+                return False
+            raise OSError(error, os.strerror(error), dir_name)
+
+        self._dirs[dir_name] = wd
+        self._wds[wd] = dir_name
+        return True
+
+    def _read_events(self):
+        """
+        Read all queued inotify events.
+
+        Returns:
+            list of (watch descriptor, event mask) tuples.
+        """
+        events = []
+        while True:
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT.unpack_from(data, offset)
+                events.append((wd, mask))
+                offset += _EVENT.size + length
+
+        return events
+
+    def _sync_watches(self, dir_names):
+        """
+        Add or remove watches to match the directories tracked by the parser.
+
+        Newly watched directories are checked for changes made before their
+        watches were added.
+
+        Args:
+            dir_names (iterable of str): Directories that have been added to
+                or removed from the parser.
+
+        Returns:
+            set of str directories updated while checking for changes.
+        """
+        # pylint: disable=W0212
+        scanned = self.parser._scanned
+        changed = set()
+
+        while dir_names:
+            added = set()
+            for dir_name in dir_names:
+                if dir_name in scanned and dir_name not in self._dirs:
+                    if self._add_watch(dir_name):
+                        added.add(dir_name)
+                elif dir_name not in scanned and dir_name in self._dirs:
+                    wd = self._dirs.pop(dir_name)
+                    self._wds.pop(wd, None)
+                    self._libc.inotify_rm_watch(self._fd, wd)
+
+            # Watches are only added once a directory has been listed:
+            # re-check anything that may have changed in the meantime.
+            dir_names = self.parser._rescan_dirs(added)
+            changed.update(dir_names)
+
+        return changed
+
+
+###############################################################################
+# Class: PollingWatcher
+
+
+class PollingWatcher(Watcher):
+    """
+    Watcher that periodically checks directory modification times.
+
+    Useful on file systems that don't support inotify (eg, network mounts).
+
+    Args:
+        parser (Seqparse): The instance that you'd like to keep up to date.
+        interval (float, optional): Number of seconds between checks.
+            Defaults to 1.0.
+    """
+
+    def __init__(self, parser, interval=1.0):
+        """Initialise the instance."""
+        super().__init__(parser)
+        self._interval = interval
+
+    def read_batch(self, timeout=None):
+        """
+        Wait for changes on disk, then update the parser.
+
+        Args:
+            timeout (float, optional): Maximum number of seconds to wait for
+                changes. Defaults to None (wait indefinitely).
+
+        Returns:
+            set of str directories that have been updated (empty if the
+            timeout expired).
+        """
+        deadline = None
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+
+        while True:
+            changed = self.parser.rescan()
+            if changed:
+                return changed
+
+            wait = self._interval
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+            if wait <= 0:
+                return changed
+            time.sleep(wait)
+
+
+###############################################################################
+# EXPORTED METHODS
+
+
+def get_watcher(parser, polling=False, interval=1.0, latency=0.1):
+    """
+    Create the best available watcher for the supplied parser.
+
+    An InotifyWatcher is returned where inotify is available, otherwise (or
+    if polling has been requested) a PollingWatcher.
+
+    Args:
+        parser (Seqparse): The instance that you'd like to keep up to date.
+        polling (bool, optional): Whether to force polling. Defaults to False.
+        interval (float, optional): Number of seconds between checks when
+            polling. Defaults to 1.0.
+        latency (float, optional): Number of seconds over which inotify
+            events are coalesced. Defaults to 0.1.
+
+    Returns:
+        Watcher instance.
+    """
+    if not polling:
+        try:
+            return InotifyWatcher(parser, latency=latency)
+        except OSError:
+            pass
+
+    return PollingWatcher(parser, interval=interval)
+
+
+###############################################################################
+# INTERNAL METHODS
+
+
+def _get_libc():
+    """
+    Load the C library's inotify functions.
+
+    Returns:
+        ctypes.CDLL instance.
+
+    Raises:
+        OSError: If inotify isn't available on this system.
+    """
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6",
+                       use_errno=True)
+    if not hasattr(libc, "inotify_init1"):
+        raise OSError(errno.ENOSYS, "inotify is not available")
+
+    libc.inotify_add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p,
+                                       ctypes.c_uint32)
+    return libc